@@ -0,0 +1,39 @@
+"""
+Measures assertions per second of the assertion engine compared to instantiating a unittest.TestCase per expectation
+as the asserters did before.
+
+Run with ``python -m benchmarks.bench_assertions [iterations]``
+"""
+import sys
+import time
+import unittest
+
+from unittest_specs import assertions
+from unittest_specs.fun_test_spec import expect
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+
+
+def per_second(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return iterations / (time.perf_counter() - start)
+
+
+def main(iterations: int = 100000) -> None:
+    value = [1, 2, 3]
+    cases = {
+        "TestCase per expectation": lambda: unittest.TestCase().assertEqual(value, [1, 2, 3]),
+        "assertions.assert_equal": lambda: assertions.assert_equal(value, [1, 2, 3]),
+        "SimpleFlatSpec.expect().to_be": lambda: SimpleFlatSpec.expect(value).to_be([1, 2, 3]),
+        "fun expect().to_be": lambda: expect(value).to_be([1, 2, 3])(None),
+        "TestCase().assertRaises": lambda: unittest.TestCase().assertRaises(KeyError, {}.__getitem__, 1),
+        "SimpleFlatSpec.expect().to_raise": lambda: SimpleFlatSpec.expect({}.__getitem__).to_raise(KeyError, 1),
+    }
+
+    for name, function in cases.items():
+        print(f"{name:36} {per_second(function, iterations):12,.0f} assertions/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Compares running async tests with a new event loop per test (as unittest.IsolatedAsyncioTestCase does) to running
+them on the event loop shared by a SimpleFlatSpec class.
+
+Run with ``python -m benchmarks.bench_async [number of tests]``
+"""
+import asyncio
+import sys
+import time
+import unittest
+
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+
+
+async def exercise():
+    await asyncio.sleep(0)
+
+
+def test_class(base, tests: int):
+    async def test(self):
+        await exercise()
+
+    return type("AsyncTests", (base,), {f"test_{index}": test for index in range(tests)})
+
+
+def run(test_class_to_run) -> float:
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_class_to_run)
+    start = time.perf_counter()
+    suite.run(unittest.TestResult())
+    return time.perf_counter() - start
+
+
+def main(tests: int = 2000) -> None:
+    per_test = run(test_class(unittest.IsolatedAsyncioTestCase, tests))
+    shared = run(test_class(SimpleFlatSpec, tests))
+
+    print(f"{tests} async tests")
+    print(f"  loop per test: {per_test * 1000:9.1f} ms")
+    print(f"  shared loop:   {shared * 1000:9.1f} ms  ({per_test / shared:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""
+Measures how long producing the failure message of a mismatching list of records takes with unittest's difflib-based
+assertEqual compared to the bounded structural diff of the assertion engine.
+
+Run with ``python -m benchmarks.bench_diff [records]``
+"""
+import sys
+import time
+import unittest
+
+from unittest_specs import assertions
+
+
+def failure_time(assertion, first, second) -> float:
+    start = time.perf_counter()
+    try:
+        assertion(first, second)
+    except AssertionError:
+        return time.perf_counter() - start
+    raise RuntimeError("expected the assertion to fail")
+
+
+def main(records: int = 5000) -> None:
+    first = [{"id": index, "tags": [index, index + 1]} for index in range(records)]
+    second = [dict(record, tags=list(record["tags"])) for record in first]
+    for record in second[::10]:
+        record["tags"].append(-1)
+
+    reference = unittest.TestCase()
+    reference.maxDiff = None
+    for name, assertion in (("unittest assertEqual", reference.assertEqual),
+                            ("assertions.assert_equal", assertions.assert_equal)):
+        print(f"{name:25} {failure_time(assertion, first, second) * 1000:10.1f} ms for {records} records")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""
+Measures import time and allocated memory of a generated FunSpec module with many expect() lines, once with the
+former class-per-call expect() implementation and once with the shared Asserter type.
+
+Run with ``python -m benchmarks.bench_fun_expect [number of expect() lines]``
+"""
+import importlib
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from unittest_specs import fun_test_spec
+
+
+def legacy_expect(actual_value):
+    def _get_actual_value():
+        return actual_value() if hasattr(actual_value, '__call__') else actual_value
+
+    class Asserter(unittest.TestCase):
+        def to_be(self, expected_value):
+            def run_test(_):
+                self.assertEqual(expected_value, _get_actual_value())
+
+            return run_test
+
+        def to_be_of_type(self, expected_type):
+            def run_test(_):
+                self.assertIsInstance(_get_actual_value(), expected_type)
+
+            return run_test
+
+    return Asserter()
+
+
+def write_spec_module(directory: Path, name: str, lines: int) -> None:
+    source = [
+        "from unittest_specs import describe, it, fun_test_spec",
+        "expect = fun_test_spec.expect",
+    ]
+    for index in range(lines):
+        if index % 100 == 0:
+            source.append(f'describe("Generated {index}",')
+        source.append(f'    it("check {index}", expect({index}).to_be({index})),')
+        if index % 100 == 99 or index == lines - 1:
+            source.append(")")
+    (directory / f"{name}.py").write_text("\n".join(source))
+
+
+def measure_import(name: str):
+    sys.modules.pop(name, None)
+    start = time.perf_counter()
+    importlib.import_module(name)
+    duration = time.perf_counter() - start
+
+    sys.modules.pop(name, None)
+    tracemalloc.start()
+    importlib.import_module(name)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, retained
+
+
+def main(lines: int = 10000) -> None:
+    current_expect = fun_test_spec.expect
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_spec_module(Path(directory), "generated_fun_spec", lines)
+        sys.path.insert(0, directory)
+        importlib.import_module("generated_fun_spec")
+
+        fun_test_spec.expect = legacy_expect
+        legacy_time, legacy_memory = measure_import("generated_fun_spec")
+        fun_test_spec.expect = current_expect
+        current_time, current_memory = measure_import("generated_fun_spec")
+
+        sys.path.remove(directory)
+
+    print(f"{lines} expect() lines")
+    print(f"  class per call: {legacy_time * 1000:9.1f} ms  {legacy_memory / 2 ** 20:8.1f} MiB retained")
+    print(f"  shared type:    {current_time * 1000:9.1f} ms  {current_memory / 2 ** 20:8.1f} MiB retained")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
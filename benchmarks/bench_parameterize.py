@@ -0,0 +1,34 @@
+"""
+Shows the wall-clock scaling of a parameterized, I/O bound test with the number of parameterize() workers.
+
+Run with ``python -m benchmarks.bench_parameterize [rows] [seconds per row]``
+"""
+import sys
+import time
+import unittest
+
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+
+
+def spec_class(rows: int, row_duration: float, workers):
+    class IOBoundSpec(SimpleFlatSpec):
+        @SimpleFlatSpec.parameterize(params=list(range(rows)), workers=workers)
+        def test_io_bound(self, _):
+            time.sleep(row_duration)
+
+    return IOBoundSpec
+
+
+def main(rows: int = 100, row_duration: float = 0.01) -> None:
+    baseline = None
+    for workers in (None, 2, 4, 8, 16, 32):
+        result = unittest.TestResult()
+        start = time.perf_counter()
+        spec_class(rows, row_duration, workers)("test_io_bound").run(result)
+        duration = time.perf_counter() - start
+        baseline = baseline or duration
+        print(f"workers={str(workers or 'serial'):7} {duration * 1000:9.1f} ms  speed-up {baseline / duration:5.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if "." in arg else int(arg) for arg in sys.argv[1:]))
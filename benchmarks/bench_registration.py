@@ -0,0 +1,55 @@
+"""
+Compares the import time of generated spec modules when resolving the calling module via inspect.stack() (the former
+implementation) and via unittest_specs.registration.
+
+Run with ``python -m benchmarks.bench_registration [number of describe blocks]``
+"""
+import importlib
+import sys
+import tempfile
+import time
+from inspect import getmodule, stack
+from pathlib import Path
+
+from unittest_specs import fun_test_spec
+
+
+def legacy_resolve_module(target=None, depth=1):
+    return getmodule(stack()[depth + 1][0])
+
+
+def write_spec_module(directory: Path, name: str, blocks: int) -> None:
+    lines = ["from unittest_specs import describe, it, expect", ""]
+    for index in range(blocks):
+        lines.append(f'describe("Block {index}", it("should hold", expect({index}).to_be({index})))')
+    (directory / f"{name}.py").write_text("\n".join(lines))
+
+
+def time_import(name: str) -> float:
+    sys.modules.pop(name, None)
+    importlib.invalidate_caches()
+    start = time.perf_counter()
+    importlib.import_module(name)
+    return time.perf_counter() - start
+
+
+def main(blocks: int = 2000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        write_spec_module(Path(directory), "generated_spec", blocks)
+        sys.path.insert(0, directory)
+
+        current_resolver = fun_test_spec.resolve_module
+        fun_test_spec.resolve_module = legacy_resolve_module
+        legacy = time_import("generated_spec")
+        fun_test_spec.resolve_module = current_resolver
+        current = time_import("generated_spec")
+
+        sys.path.remove(directory)
+
+    print(f"{blocks} describe() blocks")
+    print(f"  inspect.stack():  {legacy * 1000:9.1f} ms")
+    print(f"  caller_module():  {current * 1000:9.1f} ms  ({legacy / current:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -7,7 +7,34 @@ A simple wrapper around the unittest package with different styles for specs
 __version__ = "1.2.0"
 __author__ = "Phillip Goellner"
 
+# Public names are imported from their modules on first access, so that importing the package (e.g. in every worker
+# process) does not pay for unittest, asyncio and the modules of all spec styles up front.
+_exports = {
+    "SimpleFlatSpec": "unittest_specs.simple_test_spec",
+    "describe": "unittest_specs.fun_test_spec",
+    "it": "unittest_specs.fun_test_spec",
+    "expect": "unittest_specs.fun_test_spec",
+    "defer": "unittest_specs.fun_test_spec",
+    "scenario": "unittest_specs.with_test_spec",
+    "setup": "unittest_specs.with_test_spec",
+    "run": "unittest_specs.with_test_spec",
+    "assertion": "unittest_specs.with_test_spec",
+    "teardown": "unittest_specs.with_test_spec",
+    "bench": "unittest_specs.bench_test_spec",
+}
 
-from unittest_specs.simple_test_spec import SimpleFlatSpec
-from unittest_specs.fun_test_spec import describe, it, expect
-from unittest_specs.with_test_spec import scenario, setup, run, assertion, teardown
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # __import__ instead of importlib.import_module, which would have to be imported first
+    value = globals()[name] = getattr(__import__(module_name, fromlist=(name,)), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
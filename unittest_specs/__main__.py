@@ -0,0 +1,5 @@
+import sys
+
+from unittest_specs.runner import main
+
+sys.exit(main())
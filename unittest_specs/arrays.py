@@ -0,0 +1,205 @@
+"""
+Assertions on numeric arrays: NumPy arrays, array.array, memoryview and (nested) lists or tuples of numbers. NumPy is
+imported lazily on first use and, if available, used for vectorized comparisons; without it, values are compared
+element by element. Mismatches are summarized instead of listing every element.
+"""
+import array
+import math
+from functools import lru_cache
+from typing import Callable, List, Tuple, Union
+
+from unittest_specs.assertions import fail, register_equality_function
+
+__unittest = True  # hides frames of this module from unittest's failure tracebacks
+
+USE_NUMPY = True
+MAX_REPORTED_MISMATCHES = 5
+
+
+@lru_cache(maxsize=None)
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def numpy():
+    """
+    Returns the numpy module if it is importable and USE_NUMPY is set, None otherwise.
+    """
+    return _import_numpy() if USE_NUMPY else None
+
+
+def _is_sequence(value) -> bool:
+    return isinstance(value, (list, tuple, range, array.array))
+
+
+def _flatten(value) -> Tuple[List, tuple]:
+    if isinstance(value, memoryview):
+        return _flatten(value.tolist()) if value.ndim else ([value.tolist()], ())
+    if hasattr(value, "shape") and hasattr(value, "tolist"):
+        return _flatten(value.tolist()) if value.shape else ([value.tolist()], ())
+    if not _is_sequence(value):
+        return [value], ()
+    if not value or not _is_sequence(value[0]):
+        return list(value), (len(value),)
+
+    flat, inner_shape = [], None
+    for element in value:
+        elements, shape = _flatten(element)
+        if inner_shape is not None and shape != inner_shape:
+            raise ValueError(f"Cannot compare ragged nested sequences, found shapes {inner_shape} and {shape}")
+        inner_shape = shape
+        flat.extend(elements)
+    return flat, (len(value),) + inner_shape
+
+
+def shape_of(value) -> tuple:
+    """
+    Determines the shape of an array or of nested sequences, e.g. ``(2, 3)`` for ``[[1, 2, 3], [4, 5, 6]]``.
+    """
+    shape = getattr(value, "shape", None)
+    if shape is not None:
+        return tuple(shape)
+    return _flatten(value)[1]
+
+
+def _index(flat_index: int, shape: tuple) -> str:
+    if len(shape) <= 1:
+        return f"[{flat_index}]"
+    indices = []
+    for dimension in reversed(shape):
+        flat_index, index = divmod(flat_index, dimension)
+        indices.append(index)
+    return f"[{', '.join(map(str, reversed(indices)))}]"
+
+
+def _summary(count: int, total: int, description: str, lines: List[str]) -> str:
+    message = f"{count} of {total} elements ({count / total:.1%}) {description}:\n" + "\n".join(
+        f"  {line}" for line in lines[:MAX_REPORTED_MISMATCHES])
+    if count > MAX_REPORTED_MISMATCHES:
+        message += f"\n  ... ({count - MAX_REPORTED_MISMATCHES} more)"
+    return message
+
+
+def _assert_same_shape(actual_shape: tuple, expected_shape: tuple) -> None:
+    if actual_shape != expected_shape:
+        fail(f"Arrays differ in shape: {actual_shape} != {expected_shape}")
+
+
+def assert_shape(actual, expected_shape: Union[int, tuple]) -> None:
+    expected_shape = (expected_shape,) if isinstance(expected_shape, int) else tuple(expected_shape)
+    actual_shape = shape_of(actual)
+    if actual_shape != expected_shape:
+        fail(f"shape {actual_shape} != {expected_shape}")
+
+
+def assert_close_to(actual, expected, rtol: float = 1e-07, atol: float = 0.0) -> None:
+    """
+    Asserts that all elements of an array are close to the expected ones, i.e.
+    ``abs(actual - expected) <= atol + rtol * abs(expected)``. NaNs are considered equal to NaNs.
+
+    :param actual: the actual array, nested sequence or number
+    :param expected: an array or nested sequence of the same shape, or a single number all elements are compared to
+    :param rtol: the relative tolerance
+    :param atol: the absolute tolerance
+    """
+    np = numpy()
+    if np is not None:
+        actual_array, expected_array = np.asarray(actual), np.asarray(expected)
+        if expected_array.shape:
+            _assert_same_shape(actual_array.shape, expected_array.shape)
+        expected_array = np.broadcast_to(expected_array, actual_array.shape)
+
+        mismatches = np.flatnonzero(~np.isclose(actual_array, expected_array, rtol, atol, equal_nan=True))
+        if not mismatches.size:
+            return
+        actual_values, expected_values = actual_array.ravel()[mismatches], expected_array.ravel()[mismatches]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            absolute = np.abs(actual_values - expected_values)
+            relative = absolute / np.abs(expected_values)
+        shape, total, count = actual_array.shape, actual_array.size, mismatches.size
+        max_absolute, max_relative = float(np.nanmax(absolute)), float(np.nanmax(relative))
+        mismatches = mismatches[:MAX_REPORTED_MISMATCHES].tolist()
+        actual_values = actual_values[:MAX_REPORTED_MISMATCHES].tolist()
+        expected_values = expected_values[:MAX_REPORTED_MISMATCHES].tolist()
+    else:
+        actual_values, shape = _flatten(actual)
+        expected_values, expected_shape = _flatten(expected)
+        if expected_shape:
+            _assert_same_shape(shape, expected_shape)
+        else:
+            expected_values = expected_values * len(actual_values)
+
+        mismatches = [index for index, (value, expected_value) in enumerate(zip(actual_values, expected_values))
+                      if not (abs(value - expected_value) <= atol + rtol * abs(expected_value)
+                              or (value != value and expected_value != expected_value))]
+        if not mismatches:
+            return
+        total, count = len(actual_values), len(mismatches)
+        actual_values = [actual_values[index] for index in mismatches]
+        expected_values = [expected_values[index] for index in mismatches]
+        absolute = [abs(value - expected_value) for value, expected_value in zip(actual_values, expected_values)]
+        max_absolute = max(absolute)
+        max_relative = max(difference / abs(expected_value) if expected_value else math.inf
+                           for difference, expected_value in zip(absolute, expected_values))
+
+    lines = [f"{_index(index, shape)}: {value!r} != {expected_value!r}"
+             for index, value, expected_value in zip(mismatches, actual_values, expected_values)]
+    fail(_summary(count, total, f"not close (rtol={rtol:g}, atol={atol:g}), max absolute difference "
+                  f"{max_absolute:.6g}, max relative difference {max_relative:.6g}", lines))
+
+
+def assert_all_satisfy(actual, predicate: Callable) -> None:
+    """
+    Asserts that all elements of an array satisfy a predicate. With NumPy, the predicate is first applied to the whole
+    array, so vectorized predicates like ``lambda x: x >= 0`` are evaluated in one call; predicates not returning
+    an array of the same shape are applied to every element.
+
+    :param actual: the actual array or nested sequence
+    :param predicate: a function returning whether an element is valid
+    """
+    np = numpy()
+    if np is not None:
+        values = np.asarray(actual)
+        try:
+            satisfied = np.asarray(predicate(values), dtype=bool)
+        except Exception:
+            satisfied = None
+        if satisfied is None or satisfied.shape != values.shape:
+            satisfied = np.fromiter((bool(predicate(value)) for value in values.flat), bool, values.size)
+
+        violations = np.flatnonzero(~satisfied.ravel())
+        shape, total = values.shape, values.size
+        violating_values = values.ravel()[violations[:MAX_REPORTED_MISMATCHES]].tolist()
+        count, violations = violations.size, violations[:MAX_REPORTED_MISMATCHES].tolist()
+    else:
+        values, shape = _flatten(actual)
+        violations = [index for index, value in enumerate(values) if not predicate(value)]
+        total, count = len(values), len(violations)
+        violating_values = [values[index] for index in violations[:MAX_REPORTED_MISMATCHES]]
+
+    if count:
+        lines = [f"{_index(index, shape)}: {value!r}" for index, value in zip(violations, violating_values)]
+        fail(_summary(count, total, f"do not satisfy {getattr(predicate, '__name__', predicate)}", lines))
+
+
+def _ndarray_equal(first, second) -> None:
+    """
+    Equality function for NumPy arrays, which cannot be compared by ``==`` in a boolean context.
+    """
+    np = _import_numpy()
+    _assert_same_shape(first.shape, second.shape)
+    mismatches = np.flatnonzero(first != second)
+    if mismatches.size:
+        first_values = first.ravel()[mismatches[:MAX_REPORTED_MISMATCHES]].tolist()
+        second_values = second.ravel()[mismatches[:MAX_REPORTED_MISMATCHES]].tolist()
+        lines = [f"{_index(index, first.shape)}: {value!r} != {other!r}"
+                 for index, value, other in zip(mismatches[:MAX_REPORTED_MISMATCHES].tolist(), first_values,
+                                                second_values)]
+        fail("Arrays differ: " + _summary(mismatches.size, first.size, "differ", lines))
+
+
+register_equality_function("numpy.ndarray", _ndarray_equal)
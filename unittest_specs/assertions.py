@@ -0,0 +1,394 @@
+"""
+Standalone assertion functions shared by all spec styles. They raise AssertionError with the same messages
+unittest.TestCase produces, without requiring a TestCase instance.
+"""
+import difflib
+import pprint
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, List, Type, Union
+from unittest.util import safe_repr, _common_shorten_repr, _count_diff_all_purpose, _count_diff_hashable
+
+from unittest_specs import diff
+
+__unittest = True  # hides frames of this module from unittest's failure tracebacks
+
+MAX_DIFF = 80 * 8
+DIFF_THRESHOLD = 2 ** 16
+MAX_REPORTED_ELEMENTS = 20
+STRUCTURAL_DIFF_THRESHOLD = 1000
+DIFF_OMITTED = "\nDiff is %s characters long. Set unittest_specs.assertions.MAX_DIFF to None to see it."
+
+
+def fail(message: str) -> None:
+    raise AssertionError(message)
+
+
+def _truncated(message: str, details: str) -> str:
+    if MAX_DIFF is None or len(details) <= MAX_DIFF:
+        return message + details
+    return message + (DIFF_OMITTED % len(details))
+
+
+def _is_large(first, second) -> bool:
+    return diff.exceeds(first, STRUCTURAL_DIFF_THRESHOLD) or diff.exceeds(second, STRUCTURAL_DIFF_THRESHOLD)
+
+
+def _diff(message: str, first, second) -> str:
+    """
+    Appends a diff of both values to a failure message: the unittest-compatible ndiff for small values, a bounded
+    structural diff (see unittest_specs.diff) for values holding more than STRUCTURAL_DIFF_THRESHOLD items, which
+    difflib would take up to quadratic time for.
+    """
+    if _is_large(first, second):
+        return message + "\n" + str(diff.structural_diff(first, second))
+    return _truncated(message, "\n" + "\n".join(
+        difflib.ndiff(pprint.pformat(first).splitlines(), pprint.pformat(second).splitlines())))
+
+
+def _sequence_equal(first, second, type_name: str) -> None:
+    if first == second:
+        return
+
+    message = "%ss differ: %s != %s\n" % ((type_name.capitalize(),) + _common_shorten_repr(first, second))
+
+    for index in range(min(len(first), len(second))):
+        if first[index] != second[index]:
+            message += "\nFirst differing element %d:\n%s\n%s\n" % (
+                index, safe_repr(first[index]), safe_repr(second[index]))
+            break
+    else:
+        if len(first) > len(second):
+            message += "\nFirst %s contains %d additional elements.\nFirst extra element %d:\n%s\n" % (
+                type_name, len(first) - len(second), len(second), safe_repr(first[len(second)]))
+        else:
+            message += "\nSecond %s contains %d additional elements.\nFirst extra element %d:\n%s\n" % (
+                type_name, len(second) - len(first), len(first), safe_repr(second[len(first)]))
+
+    fail(_diff(message, first, second))
+
+
+def _list_equal(first, second) -> None:
+    _sequence_equal(first, second, "list")
+
+
+def _tuple_equal(first, second) -> None:
+    _sequence_equal(first, second, "tuple")
+
+
+def _dict_equal(first, second) -> None:
+    if first != second:
+        fail(_diff("%s != %s" % _common_shorten_repr(first, second), first, second))
+
+
+def _set_equal(first, second) -> None:
+    if first == second:
+        return
+
+    if _is_large(first, second):
+        fail("Sets differ: %s != %s\n" % _common_shorten_repr(first, second) + str(diff.structural_diff(first, second)))
+
+    lines = []
+    only_first = first - second
+    only_second = second - first
+    if only_first:
+        lines.append("Items in the first set but not the second:")
+        lines.extend(repr(item) for item in only_first)
+    if only_second:
+        lines.append("Items in the second set but not the first:")
+        lines.extend(repr(item) for item in only_second)
+    fail("\n".join(lines))
+
+
+def _str_equal(first, second) -> None:
+    if first == second:
+        return
+
+    message = "%s != %s" % _common_shorten_repr(first, second)
+    if len(first) > DIFF_THRESHOLD or len(second) > DIFF_THRESHOLD:
+        fail(message + "\n" + str(diff.structural_diff(first, second)))
+
+    first_lines = first.splitlines(True)
+    second_lines = second.splitlines(True)
+    if len(first_lines) == 1 and first.strip("\r\n") == first:
+        first_lines = [first + "\n"]
+        second_lines = [second + "\n"]
+
+    fail(_truncated(message, "\n" + "".join(difflib.ndiff(first_lines, second_lines))))
+
+
+_equality_functions = {
+    list: _list_equal,
+    tuple: _tuple_equal,
+    dict: _dict_equal,
+    set: _set_equal,
+    frozenset: _set_equal,
+    str: _str_equal,
+}
+_named_equality_functions = {}
+
+
+def register_equality_function(value_type: Union[Type, str], function: Callable[[Any, Any], None]) -> None:
+    """
+    Registers a type-specific comparison used by assert_equal() whenever both values are of exactly this type.
+
+    :param value_type: the type the comparison applies to, or its qualified name (e.g. ``"numpy.ndarray"``) to avoid
+    importing the module defining it
+    :param function: a function taking both values and raising AssertionError if they differ
+    """
+    if isinstance(value_type, str):
+        _named_equality_functions[value_type] = function
+        for known_type in [known_type for known_type, known in _equality_functions.items() if known is None]:
+            del _equality_functions[known_type]
+    else:
+        _equality_functions[value_type] = function
+
+
+def _equality_function(value_type: Type):
+    try:
+        return _equality_functions[value_type]
+    except KeyError:
+        # resolved once per type; types without a comparison are remembered as None
+        function = _equality_functions[value_type] = _named_equality_functions.get(
+            f"{value_type.__module__}.{value_type.__qualname__}")
+        return function
+
+
+def assert_equal(first, second) -> None:
+    if type(first) is type(second):
+        equality_function = _equality_function(type(first))
+        if equality_function:
+            return equality_function(first, second)
+
+    if not first == second:
+        fail("%s != %s" % _common_shorten_repr(first, second))
+
+
+def assert_not_equal(first, second) -> None:
+    if not first != second:
+        fail("%s == %s" % (safe_repr(first), safe_repr(second)))
+
+
+def assert_list_equal(first, second) -> None:
+    if not isinstance(first, list):
+        fail("First sequence is not a list: %s" % safe_repr(first))
+    if not isinstance(second, list):
+        fail("Second sequence is not a list: %s" % safe_repr(second))
+    _list_equal(first, second)
+
+
+def assert_true(value) -> None:
+    if not value:
+        fail("%s is not true" % safe_repr(value))
+
+
+def assert_false(value) -> None:
+    if value:
+        fail("%s is not false" % safe_repr(value))
+
+
+def assert_is_none(value) -> None:
+    if value is not None:
+        fail("%s is not None" % safe_repr(value))
+
+
+def assert_is_not_none(value) -> None:
+    if value is None:
+        fail("unexpectedly None")
+
+
+def assert_is_instance(value, expected_type) -> None:
+    if not isinstance(value, expected_type):
+        fail("%s is not an instance of %r" % (safe_repr(value), expected_type))
+
+
+def assert_in(member, container) -> None:
+    if member not in container:
+        fail("%s not found in %s" % (safe_repr(member), safe_repr(container)))
+
+
+# containers whose membership test is plain equality against their items, so that it can be answered by a hash index
+_INDEXED_TYPES = (list, tuple, deque)
+
+
+class _Membership:
+    """
+    Answers membership queries against a collection in constant time where possible. Lists, tuples and deques, as
+    well as iterators, are traversed once; hashable items are indexed in a set, unhashable ones are kept for linear
+    comparison. All other containers, including subclasses that may override ``__contains__``, are queried with
+    ``in``; elements they cannot look up, e.g. unhashable ones in sets and dicts, count as missing.
+    """
+    __slots__ = ("container", "hashed", "unhashable")
+
+    def __init__(self, container):
+        if type(container) not in _INDEXED_TYPES and hasattr(container, "__contains__"):
+            self.container = container
+            self.hashed = None
+            self.unhashable = ()
+            return
+
+        self.container = container if type(container) in _INDEXED_TYPES else list(container)
+        self.hashed = set()
+        self.unhashable = []
+        for item in self.container:
+            try:
+                self.hashed.add(item)
+            except TypeError:
+                self.unhashable.append(item)
+
+    def __contains__(self, element) -> bool:
+        if self.hashed is None:
+            try:
+                return element in self.container
+            except TypeError:
+                return False
+        try:
+            if element in self.hashed:
+                return True
+        except TypeError:
+            return element in self.container
+        return bool(self.unhashable) and element in self.unhashable
+
+
+def _listed(elements: List) -> str:
+    listed = ", ".join(safe_repr(element) for element in elements[:MAX_REPORTED_ELEMENTS])
+    if len(elements) > MAX_REPORTED_ELEMENTS:
+        listed += f", ... ({len(elements) - MAX_REPORTED_ELEMENTS} more)"
+    return f"[{listed}]"
+
+
+def missing_elements(container, expected_elements: Iterable) -> List:
+    """
+    Determines which of the expected elements are not contained in a collection, using hashed lookups for hashable
+    elements. Containment follows the semantics of the ``in`` operator, e.g. keys for dicts and substrings for
+    strings.
+
+    :param container: the collection to search; iterators are consumed once
+    :param expected_elements: the elements to look for
+    :return: the expected elements not found, in their original order
+    """
+    membership = _Membership(container)
+    return [element for element in expected_elements if element not in membership]
+
+
+def assert_contains_all(container, expected_elements: Iterable) -> None:
+    expected_elements = list(expected_elements)
+    missing = missing_elements(container, expected_elements)
+    if missing:
+        fail("%d of %d expected elements not found: %s" % (len(missing), len(expected_elements), _listed(missing)))
+
+
+def assert_contains_any(container, expected_elements: Iterable) -> None:
+    expected_elements = list(expected_elements)
+    membership = _Membership(container)
+    if not any(element in membership for element in expected_elements):
+        fail("none of the expected elements found: %s" % _listed(expected_elements))
+
+
+def assert_contains_exactly(container, expected_elements: Iterable) -> None:
+    """
+    Asserts that a collection consists of exactly the expected elements, regardless of their order. Elements
+    occurring multiple times need to occur equally often in both.
+    """
+    actual, expected = list(container), list(expected_elements)
+    try:
+        if Counter(actual) == Counter(expected):
+            return
+        differences = _count_diff_hashable(actual, expected)
+    except TypeError:
+        differences = _count_diff_all_purpose(actual, expected)
+
+    if differences:
+        lines = ["First has %d, Second has %d:  %r" % difference for difference in differences[:MAX_REPORTED_ELEMENTS]]
+        if len(differences) > MAX_REPORTED_ELEMENTS:
+            lines.append(f"... ({len(differences) - MAX_REPORTED_ELEMENTS} more)")
+        fail("Element counts were not equal:\n" + "\n".join(lines))
+
+
+_soft_failures = ContextVar("soft_failures", default=None)
+
+
+def fail_together(failures: List[AssertionError]) -> None:
+    """
+    Raises a single AssertionError reporting all given failures; a single failure is re-raised unchanged.
+    """
+    if len(failures) == 1:
+        raise failures[0]
+    fail("%d expectations failed:\n" % len(failures) +
+         "\n".join("%d) %s" % (number, failure) for number, failure in enumerate(failures, 1)))
+
+
+@contextmanager
+def softly():
+    """
+    Collects the assertion failures of chained expectations within its block instead of stopping at the first one,
+    and reports all of them together at the end of the block.
+
+    ``with softly():``
+    """
+    failures = []
+    token = _soft_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _soft_failures.reset(token)
+    if failures:
+        fail_together(failures)
+
+
+def within_softly() -> bool:
+    """
+    Determines whether assertion failures are currently collected by a softly() block.
+    """
+    return _soft_failures.get() is not None
+
+
+def record_soft_failure(failure: AssertionError) -> bool:
+    """
+    Records a failure if it occurred within a softly() block.
+
+    :return: whether the failure was recorded and should not be raised
+    """
+    failures = _soft_failures.get()
+    if failures is None:
+        return False
+    failures.append(failure)
+    return True
+
+
+def clause_name(assertion_name: str) -> str:
+    """
+    Derives the name of a chained clause from the name of an assertion, e.g. ``and_of_length`` from
+    ``to_be_of_length`` or ``and_contain_all`` from ``to_contain_all``.
+    """
+    name = assertion_name[len("to_"):]
+    return "and_" + (name[len("be_"):] if name.startswith("be_") else name)
+
+
+class raises:
+    """
+    Context manager asserting that its block raises an exception of the expected type. Exceptions of other types
+    are propagated unchanged. The intercepted exception is available as ``exception`` afterwards.
+
+    ``with raises(ValueError):``
+    """
+    __slots__ = ("expected_exception", "exception")
+
+    def __init__(self, expected_exception: Type[BaseException]):
+        self.expected_exception = expected_exception
+        self.exception = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            name = getattr(self.expected_exception, "__name__", str(self.expected_exception))
+            fail(f"{name} not raised")
+
+        if not issubclass(exc_type, self.expected_exception):
+            return False
+
+        self.exception = exc_value.with_traceback(None)
+        return True
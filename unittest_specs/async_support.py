@@ -0,0 +1,97 @@
+"""
+Runs awaitables of otherwise synchronous specs. Every test class gets one event loop shared by all of its tests, so
+resources bound to a loop (e.g. connection pools) can be reused across tests instead of creating a loop per test.
+"""
+import atexit
+from inspect import isawaitable
+
+# asyncio is imported where a loop is needed, so that specs without async tests do not pay for importing it
+
+_loops = {}
+
+
+def event_loop(owner=None) -> "asyncio.AbstractEventLoop":
+    """
+    Returns the event loop shared by a test class, creating it on first use.
+
+    :param owner: the test class owning the loop; None refers to a loop shared by everything outside of test classes
+    :return: the event loop
+    """
+    loop = _loops.get(owner)
+    if loop is None or loop.is_closed():
+        import asyncio
+
+        loop = _loops[owner] = asyncio.new_event_loop()
+    return loop
+
+
+def close_event_loop(owner=None) -> None:
+    """
+    Closes the event loop of a test class, if one was created. Generated test classes call this in tearDownClass().
+
+    :param owner: the test class owning the loop
+    """
+    loop = _loops.pop(owner, None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def set_event_loop(owner, loop: "asyncio.AbstractEventLoop"):
+    """
+    Makes a test class use an existing event loop, e.g. one running in a background thread.
+
+    :param owner: the test class
+    :param loop: the event loop to share between its tests
+    :return: the event loop the test class used before, if any, to be restored by the caller
+    """
+    previous = _loops.get(owner)
+    _loops[owner] = loop
+    return previous
+
+
+def resolve(value, owner=None):
+    """
+    Awaits a value on the shared event loop of its test class if it is awaitable, returns it unchanged otherwise.
+    If the loop is already running in another thread, the value is awaited there and the calling thread blocks until
+    it is done.
+
+    :param value: any value, e.g. the result of calling a test function
+    :param owner: the test class whose loop should be used
+    :return: the (awaited) value
+    """
+    if not isawaitable(value):
+        return value
+
+    loop = event_loop(owner)
+    if not loop.is_running():
+        return loop.run_until_complete(value)
+
+    import asyncio
+
+    if asyncio._get_running_loop() is loop:
+        raise RuntimeError("Cannot wait for an awaitable inside a running event loop, await it instead")
+    return asyncio.run_coroutine_threadsafe(maybe_await(value), loop).result()
+
+
+async def maybe_await(value):
+    """
+    Awaits a value if it is awaitable, returns it unchanged otherwise.
+    """
+    if isawaitable(value):
+        return await value
+    return value
+
+
+def owner_of(test_case):
+    """
+    Determines the loop owner for a test case instance passed to generated test functions, which might be None when
+    those functions are called directly.
+    """
+    return None if test_case is None else type(test_case)
+
+
+@atexit.register
+def _close_all_event_loops():
+    for owner in list(_loops):
+        close_event_loop(owner)
@@ -0,0 +1,97 @@
+"""
+Benchmarks written like it() blocks. A bench() is passed to describe() and runs as a regular unittest test: it times
+a function with calibrated loops, appends the result to a local JSON history (see unittest_specs.storage) and fails if
+the median time per call regressed beyond a threshold compared to the stored baseline.
+
+The threshold defaults to the environment variable ``UNITTEST_SPECS_BENCH_THRESHOLD`` (a fraction, 0.25 if unset).
+Setting ``UNITTEST_SPECS_BENCH_UPDATE=1`` replaces the stored baselines with the current results.
+"""
+import datetime
+import os
+import threading
+from typing import Callable, Tuple
+
+from unittest_specs import performance, storage
+from unittest_specs.assertions import fail
+
+__unittest = True  # hides frames of this module from unittest's failure tracebacks
+
+HISTORY_FILE = "benchmarks.json"
+MAX_HISTORY = 50
+DEFAULT_THRESHOLD = 0.25
+
+_history_lock = threading.Lock()
+
+
+def bench(description: str, function: Callable, setup: Callable = None, rounds: int = 7, warmup: int = 1,
+          threshold: float = None) -> Tuple[str, Callable]:
+    """
+    Constructs a benchmark to be passed to describe(), e.g.
+
+    ``describe("Sorting", bench("sorts 1000 numbers", sorted, setup=lambda: random.sample(range(1000), 1000)))``
+
+    :param description: the description of the benchmark, transformed into the test method name
+    :param function: the function to time; called without arguments or with the value returned by setup
+    :param setup: optional function called once before timing, whose return value is passed to the function
+    :param rounds: number of measured rounds; the median time per call of all rounds is compared to the baseline
+    :param warmup: number of unmeasured calls before measuring
+    :param threshold: fraction the median may exceed the baseline by, e.g. 0.25 for 25%
+    :return: a tuple composed of the test method name and the test function; only intended to be used by describe()
+    """
+    test_name = f"test_{description.replace(' ', '_')}"
+
+    def benchmark_block(_=None):
+        if setup is None:
+            timed_function = function
+        else:
+            value = setup()
+            timed_function = lambda: function(value)
+
+        sample = performance.time_per_call(timed_function, rounds, warmup)
+        benchmark_id = _.id() if _ is not None else test_name
+        baseline = record_result(benchmark_id, sample)
+
+        allowed = threshold if threshold is not None else float(
+            os.environ.get("UNITTEST_SPECS_BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+        if baseline is not None and sample.median > baseline * (1 + allowed):
+            fail(f"benchmark {benchmark_id} regressed by {sample.median / baseline - 1:.1%} (threshold {allowed:.0%})"
+                 f": {sample.describe()} compared to a baseline median of {baseline:.6g}s")
+
+    benchmark_block.__name__ = test_name
+    return test_name, benchmark_block
+
+
+def record_result(benchmark_id: str, sample: performance.Sample):
+    """
+    Appends a benchmark result to the history. The first result of a benchmark becomes its baseline, unless
+    baselines are updated explicitly.
+
+    :param benchmark_id: the id of the benchmark, e.g. the test id
+    :param sample: the measured seconds per call
+    :return: the baseline median to compare the result to, or None if the result became the new baseline
+    """
+    with _history_lock:
+        stored = storage.load_json(HISTORY_FILE, {})
+        entry = stored.setdefault(benchmark_id, {"baseline": None, "runs": []})
+
+        result = {"median": sample.median, "iqr": sample.iqr, "rounds": len(sample.values),
+                  "date": datetime.datetime.now().isoformat(timespec="seconds")}
+        entry["runs"] = (entry["runs"] + [result])[-MAX_HISTORY:]
+
+        baseline = entry["baseline"]
+        if baseline is None or os.environ.get("UNITTEST_SPECS_BENCH_UPDATE") == "1":
+            entry["baseline"] = result
+        storage.save_json(HISTORY_FILE, stored)
+
+    return None if baseline is None or entry["baseline"] is result else baseline["median"]
+
+
+def history(benchmark_id: str = None) -> dict:
+    """
+    Loads the stored benchmark history.
+
+    :param benchmark_id: if set, only the entry of this benchmark is returned
+    :return: mapping of benchmark ids to their baseline and recent runs
+    """
+    stored = storage.load_json(HISTORY_FILE, {})
+    return stored if benchmark_id is None else stored.get(benchmark_id, {"baseline": None, "runs": []})
@@ -0,0 +1,216 @@
+"""
+Bounded structural diff of nested lists, tuples, dicts, sets and strings. Both values are walked once in parallel and
+compared position by position, so the cost grows linearly with their size, unlike difflib which aligns sequences in up
+to quadratic time. The walk stops after MAX_DIFFERENCES differences, MAX_ITEMS compared items or MAX_SECONDS.
+"""
+import time
+from collections.abc import Mapping, Sequence, Set
+from typing import Iterator, List, NamedTuple, Tuple
+from unittest.util import safe_repr
+
+MAX_DIFFERENCES = 10
+MAX_ITEMS = 1_000_000
+MAX_SECONDS = 1.0
+
+_CHUNK = 4096
+_TIME_CHECK_INTERVAL = 1024
+
+_MAPPING, _SET, _STRING, _SEQUENCE, _OTHER = range(5)
+
+
+class Difference(NamedTuple):
+    path: str
+    message: str
+
+    def __str__(self):
+        return f"{self.path or '(top level)'}: {self.message}"
+
+
+class StructuralDiff:
+    """
+    The differences between two values found by structural_diff().
+    """
+
+    def __init__(self, differences: List[Difference], compared_items: int, stopped_by: str = None):
+        self.differences = differences
+        self.compared_items = compared_items
+        self.stopped_by = stopped_by
+
+    def __bool__(self):
+        return bool(self.differences)
+
+    def __str__(self):
+        shown = len(self.differences)
+        if not shown:
+            return f"no differences found in the first {self.compared_items} items" + (
+                f" (stopped after {self.stopped_by})" if self.stopped_by else "")
+        if self.stopped_by is None:
+            header = f"{shown} difference{'s' if shown != 1 else ''}:"
+        else:
+            header = f"first {shown} difference{'s' if shown != 1 else ''} (stopped after {self.stopped_by}):"
+        return "\n".join([header] + [f"  {difference}" for difference in self.differences])
+
+
+def _category(value) -> int:
+    if isinstance(value, (str, bytes, bytearray)):
+        return _STRING
+    if isinstance(value, Mapping):
+        return _MAPPING
+    if isinstance(value, Set):
+        return _SET
+    if isinstance(value, Sequence):
+        return _SEQUENCE
+    return _OTHER
+
+
+def _differ(first, second) -> bool:
+    try:
+        return bool(first != second)
+    except Exception:  # e.g. element-wise comparisons returning arrays
+        return first is not second
+
+
+def _first_difference(first, second) -> int:
+    index, length = 0, min(len(first), len(second))
+    while index < length and first[index:index + _CHUNK] == second[index:index + _CHUNK]:
+        index += _CHUNK
+    while index < length and first[index] == second[index]:
+        index += 1
+    return index
+
+
+def _string_difference(first, second) -> str:
+    index = _first_difference(first, second)
+    location = f"index {index}"
+    if isinstance(first, str) and "\n" in first[:index]:
+        line_start = first.rfind("\n", 0, index) + 1
+        location += f" (line {first.count(chr(10), 0, index) + 1}, column {index - line_start + 1})"
+
+    start = max(0, index - 20)
+    message = f"differ at {location}: {safe_repr(first[start:index + 20])} != {safe_repr(second[start:index + 20])}"
+    if len(first) != len(second):
+        message += f", lengths {len(first)} != {len(second)}"
+    return message
+
+
+def _extra_elements(sequence, start: int) -> str:
+    shown = ", ".join(safe_repr(element, True) for element in sequence[start:start + 3])
+    return f"{len(sequence) - start} additional element{'s' if len(sequence) - start != 1 else ''} starting at " \
+           f"[{start}]: {shown}{', ...' if len(sequence) - start > 3 else ''}"
+
+
+def _children(path: str, first, second, category: int) -> Iterator[Tuple[str, object, object]]:
+    if category == _SEQUENCE:
+        for index in range(min(len(first), len(second))):
+            yield f"{path}[{index}]", first[index], second[index]
+    else:
+        for key, value in first.items():
+            if key in second:
+                yield f"{path}[{safe_repr(key, True)}]", value, second[key]
+
+
+def _shallow_differences(path: str, first, second, category: int) -> Iterator[Difference]:
+    if category == _SEQUENCE:
+        if len(first) > len(second):
+            yield Difference(path, "first contains " + _extra_elements(first, len(second)))
+        elif len(second) > len(first):
+            yield Difference(path, "second contains " + _extra_elements(second, len(first)))
+    elif category == _MAPPING:
+        for key in first:
+            if key not in second:
+                yield Difference(f"{path}[{safe_repr(key, True)}]", "missing in second")
+        for key in second:
+            if key not in first:
+                yield Difference(f"{path}[{safe_repr(key, True)}]", "missing in first")
+    elif category == _SET:
+        for item in first - second:
+            yield Difference(path, f"{safe_repr(item, True)} missing in second")
+        for item in second - first:
+            yield Difference(path, f"{safe_repr(item, True)} missing in first")
+
+
+def structural_diff(first, second, max_differences: int = None, max_items: int = None,
+                    max_seconds: float = None) -> StructuralDiff:
+    """
+    Compares two values structurally. Sequences are compared index by index without aligning insertions or
+    deletions, mappings key by key, sets by membership and strings by their first differing position.
+
+    :param first: the first value
+    :param second: the second value
+    :param max_differences: stop after this many differences, defaults to MAX_DIFFERENCES
+    :param max_items: stop after comparing this many items, defaults to MAX_ITEMS
+    :param max_seconds: stop after this many seconds, defaults to MAX_SECONDS
+    :return: the differences found, in the order of the first value
+    """
+    max_differences = MAX_DIFFERENCES if max_differences is None else max_differences
+    max_items = MAX_ITEMS if max_items is None else max_items
+    max_seconds = MAX_SECONDS if max_seconds is None else max_seconds
+    deadline = time.perf_counter() + max_seconds
+
+    differences = []
+    compared = 0
+    visited = set()
+    stack = [iter([("", first, second)])]
+
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+
+        path, first_value, second_value = node
+        compared += 1
+        if compared > max_items:
+            return StructuralDiff(differences, compared - 1, f"{max_items} items")
+        if compared % _TIME_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            return StructuralDiff(differences, compared, f"{max_seconds:g}s")
+
+        if first_value is second_value:
+            continue
+
+        category = _category(first_value)
+        found = []
+        if category != _category(second_value) or category == _OTHER or (
+                category == _SEQUENCE and type(first_value) is not type(second_value)
+                and {type(first_value), type(second_value)} <= {list, tuple}):
+            if _differ(first_value, second_value):
+                message = f"{safe_repr(first_value, True)} != {safe_repr(second_value, True)}"
+                if type(first_value) is not type(second_value):
+                    message += f" ({type(first_value).__name__} != {type(second_value).__name__})"
+                found.append(Difference(path, message))
+        elif category == _STRING:
+            if first_value != second_value:
+                found.append(Difference(path, _string_difference(first_value, second_value)))
+        else:
+            found.extend(_shallow_differences(path, first_value, second_value, category))
+            if category != _SET and (id(first_value), id(second_value)) not in visited:
+                visited.add((id(first_value), id(second_value)))
+                stack.append(_children(path, first_value, second_value, category))
+
+        for difference in found:
+            differences.append(difference)
+            if len(differences) >= max_differences:
+                return StructuralDiff(differences, compared, f"{max_differences} differences")
+
+    return StructuralDiff(differences, compared)
+
+
+def exceeds(value, limit: int) -> bool:
+    """
+    Determines whether a nested value holds more than limit items in total, visiting at most limit items.
+    """
+    count = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, (str, bytes, bytearray)):
+            count += len(current) // 80
+        elif isinstance(current, (Mapping, Sequence, Set)):
+            count += len(current)
+            if count > limit:
+                return True
+            stack.extend(current.values() if isinstance(current, Mapping) else current)
+            continue
+        if count > limit:
+            return True
+    return False
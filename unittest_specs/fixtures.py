@@ -0,0 +1,257 @@
+"""
+Scoped, memoized fixtures. A fixture is set up at most once per scope (scenario, module or session), shared by
+everything using it within that scope and torn down in reverse setup order when the scope ends.
+"""
+import atexit
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from inspect import isgenerator
+from typing import Callable, Dict, Iterable, List
+
+from unittest_specs.registration import caller_module
+
+SCENARIO = "scenario"
+MODULE = "module"
+SESSION = "session"
+
+_SCOPE_WIDTH = {SCENARIO: 0, MODULE: 1, SESSION: 2}
+
+
+class Scope:
+    """
+    Holds the values of the fixtures set up within one scope and tears them down in reverse order.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.values = {}
+        self.teardowns = []
+        self.lock = threading.RLock()
+
+    def close(self) -> None:
+        errors = []
+        while self.teardowns:
+            try:
+                self.teardowns.pop()()
+            except Exception as error:
+                errors.append(error)
+        self.values.clear()
+
+        if errors:
+            raise errors[0]
+
+
+class _ScenarioContext:
+    def __init__(self, module):
+        self.module = module
+        self.scope = Scope(SCENARIO)
+        self.token = None
+
+
+_current_scenario = ContextVar("current_scenario", default=None)
+_module_scopes: Dict[str, Scope] = {}
+_session_scope = Scope(SESSION)
+_scopes_lock = threading.Lock()
+
+
+class FixtureStats:
+    def __init__(self):
+        self.setups = 0
+        self.uses = 0
+        self.setup_time = 0.0
+
+    @property
+    def saved_time(self) -> float:
+        """
+        Setup time saved by sharing the fixture, estimated from its mean setup time.
+        """
+        return (self.uses - self.setups) * self.setup_time / self.setups if self.setups else 0.0
+
+
+class Fixture:
+    """
+    A memoized fixture created by the fixture() decorator. Calling the fixture returns its value in the current
+    scope, setting it up first if necessary, which makes fixtures usable as scenario setup steps:
+
+    ``test_scenario @ setup << database``
+    """
+
+    def __init__(self, function: Callable, scope: str, depends: Iterable["Fixture"]):
+        self.function = function
+        self.scope = scope
+        self.depends = list(depends)
+        self.stats = FixtureStats()
+        self.__name__ = function.__name__
+        self.__doc__ = function.__doc__
+
+        for dependency in self.depends:
+            if _SCOPE_WIDTH[dependency.scope] < _SCOPE_WIDTH[scope]:
+                raise ValueError(f"{scope} fixture {self.__name__} cannot depend on {dependency.scope} fixture "
+                                 f"{dependency.__name__}")
+
+    def __call__(self):
+        scope = _scope_for(self.scope)
+
+        with scope.lock:
+            self.stats.uses += 1
+            if self in scope.values:
+                return scope.values[self]
+
+            arguments = [dependency() for dependency in self.depends]
+
+            start = time.perf_counter()
+            value = self.function(*arguments)
+            if isgenerator(value):
+                generator = value
+                value = next(generator)
+                scope.teardowns.append(lambda: next(generator, None))
+            self.stats.setup_time += time.perf_counter() - start
+            self.stats.setups += 1
+
+            scope.values[self] = value
+            return value
+
+    @property
+    def value(self):
+        """
+        The value of the fixture in the current scope.
+        """
+        return self()
+
+    def __repr__(self):
+        return f"<{self.scope} fixture {self.__name__}>"
+
+
+def fixture(scope: str = SCENARIO, depends: Iterable[Fixture] = ()) -> Callable[[Callable], Fixture]:
+    """
+    Turns a function into a scoped fixture. The function either returns the fixture value or yields it once, in
+    which case the code after yield is run as teardown when the scope ends.
+
+    :param scope: ``"scenario"`` (set up once per scenario), ``"module"`` (once per module, torn down after its last
+    test) or ``"session"`` (once per process)
+    :param depends: fixtures that need to be set up before this one; their values are passed to the function as
+    positional arguments. Dependencies need to live at least as long as the fixture itself.
+    :return: a decorator creating the Fixture
+    """
+    if scope not in _SCOPE_WIDTH:
+        raise ValueError(f"Unknown fixture scope {scope!r}, expected one of {', '.join(_SCOPE_WIDTH)}")
+
+    def decorator_function(function: Callable) -> Fixture:
+        return Fixture(function, scope, depends)
+
+    return decorator_function
+
+
+def _scope_for(scope_name: str) -> Scope:
+    if scope_name == SESSION:
+        return _session_scope
+
+    context = _current_scenario.get()
+    if scope_name == SCENARIO:
+        if context is None:
+            raise RuntimeError("Scenario fixtures can only be used while a scenario is executed")
+        return context.scope
+
+    module = context.module if context else _calling_module()
+    with _scopes_lock:
+        scope = _module_scopes.get(module.__name__)
+        if scope is None:
+            scope = _module_scopes[module.__name__] = Scope(MODULE)
+            _hook_module_teardown(module)
+    return scope
+
+
+def _calling_module():
+    frame, depth = sys._getframe(1), 1
+    while frame.f_globals is globals():
+        frame, depth = frame.f_back, depth + 1
+    return caller_module(depth)
+
+
+def _hook_module_teardown(module) -> None:
+    existing_teardown = module.__dict__.get("tearDownModule")
+
+    def tearDownModule():
+        try:
+            if existing_teardown:
+                existing_teardown()
+        finally:
+            module.tearDownModule = existing_teardown
+            teardown_module(module.__name__)
+
+    module.tearDownModule = tearDownModule
+
+
+def enter_scenario(module):
+    """
+    Opens the scope of a single scenario execution, which needs to be closed with exit_scenario().
+
+    :param module: the module the scenario is defined in, used as module scope
+    :return: the opened scenario context
+    """
+    context = _ScenarioContext(module)
+    context.token = _current_scenario.set(context)
+    return context
+
+
+def exit_scenario(context) -> None:
+    """
+    Closes the scope of a scenario execution, tearing down the scenario fixtures used within.
+
+    :param context: the context returned by enter_scenario()
+    """
+    _current_scenario.reset(context.token)
+    context.scope.close()
+
+
+@contextmanager
+def scenario_scope(module):
+    """
+    Opens the scope of a single scenario execution; scenario fixtures used within are torn down on exit.
+
+    :param module: the module the scenario is defined in, used as module scope
+    """
+    context = enter_scenario(module)
+    try:
+        yield context.scope
+    finally:
+        exit_scenario(context)
+
+
+def teardown_module(module_name: str) -> None:
+    """
+    Tears down all module fixtures of a module. This happens automatically in tearDownModule() during unittest runs.
+    """
+    with _scopes_lock:
+        scope = _module_scopes.pop(module_name, None)
+    if scope:
+        scope.close()
+
+
+@atexit.register
+def teardown_session() -> None:
+    """
+    Tears down all remaining module fixtures and the session fixtures. This happens automatically at exit.
+    """
+    for module_name in list(_module_scopes):
+        teardown_module(module_name)
+    _session_scope.close()
+
+
+def fixture_report(fixtures: List[Fixture]) -> str:
+    """
+    Summarizes how often fixtures were set up and used and how much setup time sharing them saved.
+
+    :param fixtures: the fixtures to report on
+    :return: a printable report
+    """
+    lines = [f"{'fixture':30} {'scope':9} {'setups':>7} {'uses':>7} {'setup time':>11} {'saved':>11}"]
+    for shared_fixture in fixtures:
+        stats = shared_fixture.stats
+        lines.append(f"{shared_fixture.__name__:30} {shared_fixture.scope:9} {stats.setups:7} {stats.uses:7} "
+                     f"{stats.setup_time:10.3f}s {stats.saved_time:10.3f}s")
+    lines.append(f"total setup time saved: {sum(f.stats.saved_time for f in fixtures):.3f}s")
+    return "\n".join(lines)
@@ -1,46 +1,115 @@
+import threading
 import unittest
-from inspect import stack, getmodule
-from typing import Callable, Tuple, Type, Any
+from contextvars import ContextVar
+from inspect import isawaitable, iscoroutinefunction
+from types import ModuleType
+from typing import Callable, Tuple, Type, Any, Union
 
+from unittest_specs import arrays, assertions, async_support, timing
+from unittest_specs.registration import resolve_module, register
 
-def describe(description: str, *test_config) -> None:
+
+_actual_values = ContextVar("actual_values", default=None)
+
+
+class _ActualValues:
+    """
+    Memoizes lazy actual values (thunks and awaitables) by identity, either for a single test run or for all tests
+    of a describe() block.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.lock = threading.RLock()
+
+    def get(self, lazy_value, evaluate: Callable):
+        with self.lock:
+            entry = self.values.get(id(lazy_value))
+            if entry is None:
+                # the lazy value is kept alive with its result, so that its id cannot be reused by another object
+                entry = self.values[id(lazy_value)] = (lazy_value, evaluate())
+            return entry[1]
+
+
+def _memoizing(test_function: Callable, shared_values: _ActualValues = None) -> Callable:
+    def memoizing_function(test_case=None):
+        token = _actual_values.set(shared_values if shared_values is not None else _ActualValues())
+        try:
+            return test_function(test_case)
+        finally:
+            _actual_values.reset(token)
+
+    memoizing_function.__name__ = getattr(test_function, "__name__", "memoizing_function")
+    return memoizing_function
+
+
+def describe(description: str, *test_config, module: Union[ModuleType, str] = None,
+             share_values: bool = False) -> None:
     """
     Constructs a collection containing zero or more test cases.
 
     :param description: intended for documentation of this describe() block; this description is transformed into
     the type name of the generated unittest.TestCase subclass
     :param test_config: zero or more test case defined by it() blocks
+    :param module: the module (or its qualified name) to register the generated class in; defaults to the module
+    calling describe()
+    :param share_values: if set, lazy actual values passed to expect() are evaluated once for all tests of this
+    block instead of once per test, e.g. to share an expensive computation checked by several it() blocks
     """
     class_name = description.title().replace(" ", "")
 
-    test_class = type(class_name, (unittest.TestCase,),
-                      {test_name: test_function for test_name, test_function in test_config})
+    target_module = resolve_module(module)
+    shared_values = _ActualValues() if share_values else None
+
+    class_members = {test_name: timing.instrumented("it", f"{target_module.__name__}.{class_name}.{test_name}",
+                                                    _memoizing(test_function, shared_values))
+                     for test_name, test_function in test_config}
+    class_members.setdefault("tearDownClass", classmethod(async_support.close_event_loop))
+    class_members["__module__"] = target_module.__name__
 
-    module = getmodule(stack()[1][0])
-    module.__dict__[class_name] = test_class
+    test_class = type(class_name, (unittest.TestCase,), class_members)
 
+    register(target_module, class_name, test_class)
 
-def it(description: str, test_def: Callable, intercept: Type[Exception] = None) -> Tuple[str, Callable]:
+
+def it(description: str, test_def: Callable, intercept: Type[Exception] = None,
+       deterministic: bool = False) -> Tuple[str, Callable]:
     """
     Constructs a test case consisting of a description and an assertion line.
 
     :param description: intended for documentation of this test case; the description is also transformed into the
     test method name
-    :param test_def: assertion line passed to describe() block for
+    :param test_def: assertion line passed to describe() block for; coroutine functions are run on the event loop
+    shared by the generated test class
     :param intercept: Intercepts an expected Exception object occurring in this it() declaration. If no Exception
     of the specified type is raised, the test fails.
+    :param deterministic: marks a test whose outcome only depends on its assertion line, caching its result (see
+    unittest_specs.result_cache)
     :return: a tuple composed of the test method name and the assertion line; this is only intended to be
     used by describe()
     """
+    test_name = f"test_{description.replace(' ', '_')}"
 
     if intercept and issubclass(intercept, Exception):
         def intercept_block(_):
-            with unittest.TestCase().assertRaises(expected_exception=intercept):
-                test_def()
+            with assertions.raises(intercept):
+                async_support.resolve(test_def(), async_support.owner_of(_))
+
+        test_function = intercept_block
+    elif iscoroutinefunction(test_def):
+        def event_loop_block(_):
+            return async_support.resolve(test_def(_), async_support.owner_of(_))
 
-        return f"test_{description.replace(' ', '_')}", intercept_block
+        test_function = event_loop_block
+    else:
+        test_function = test_def
 
-    return f"test_{description.replace(' ', '_')}", test_def
+    if deterministic:
+        # imported on demand, as the result cache pulls in hashing and the test-impact machinery
+        from unittest_specs import result_cache
+
+        test_function = result_cache.cached(test_function)
+    return test_name, test_function
 
 
 def expect(actual_value):
@@ -51,94 +120,280 @@ def expect(actual_value):
     ``expect("Nice String").to_be_of_type(str)``
 
     The actual value can be either a computed value (determined at call time) or a function of style ``() -> Any``
-    called during the execution of the assertion.
+    called during the execution of the assertion. Awaitables and coroutine functions are awaited on the event loop
+    shared by the test class executing the assertion. Within tests generated by describe(), such lazy values are
+    evaluated at most once per test run; use defer() to turn calls with arguments into lazy values.
 
     :param actual_value: value to be compared against an expectation
     :return: an Asserter object offering different assertions
     """
-    def _get_actual_value():
-        return actual_value() if hasattr(actual_value, '__call__') else actual_value
+    return Asserter(actual_value)
+
+
+class Deferred:
+    """
+    A function call postponed until an assertion needs its result. Created by defer().
+    """
+    __slots__ = ("function", "args", "kwargs")
+
+    def __init__(self, function: Callable, args: tuple, kwargs: dict):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self):
+        return self.function(*self.args, **self.kwargs)
+
+    def __repr__(self):
+        return f"defer({getattr(self.function, '__name__', self.function)})"
+
+
+def defer(function: Callable, *args, **kwargs) -> Deferred:
+    """
+    Postpones a call until the test using its result is executed, which keeps expensive work out of test discovery,
+    e.g. ``expect(defer(load_fixture, "users.json"))`` instead of ``expect(load_fixture("users.json"))``. Assign the
+    result to a variable and pass it to several expect() calls to evaluate it only once per describe(share_values=True)
+    block.
+
+    :param function: the function to call
+    :param args: positional arguments passed to the function
+    :param kwargs: keyword arguments passed to the function
+    :return: a lazy value to be passed to expect()
+    """
+    return Deferred(function, args, kwargs)
+
+
+class Expectation:
+    """
+    A test function checking one or more assertions on the same actual value. Further assertions are chained with
+    and_* clauses, e.g.
+
+    ``expect(ids).to_be_a_list().and_of_length(3).and_contain_all([1, 2])``
+
+    The actual value is evaluated once for all clauses, and every failing clause is reported.
+    """
+    __slots__ = ("_asserter", "_clauses")
+
+    def __init__(self, asserter: "Asserter", clauses: list):
+        self._asserter = asserter
+        self._clauses = clauses
+
+    def __call__(self, test_case=None):
+        if len(self._clauses) == 1:
+            # a single clause evaluates the actual value only once anyway
+            return self._clauses[0](test_case)
+
+        values = _actual_values.get()
+        token = _actual_values.set(values if values is not None else _ActualValues())
+        failures = []
+        try:
+            for clause in self._clauses:
+                try:
+                    clause(test_case)
+                except AssertionError as failure:
+                    failures.append(failure)
+        finally:
+            _actual_values.reset(token)
+
+        if failures:
+            assertions.fail_together(failures)
+
+
+def _clause(assertion: Callable) -> Callable:
+    """
+    Adds an assertion of Asserter as and_* clause to Expectation.
+    """
+    assertion_name = assertion.__name__
+
+    def add_clause(self, *args, **kwargs) -> Expectation:
+        chained = getattr(self._asserter, assertion_name)(*args, **kwargs)
+        return Expectation(self._asserter, self._clauses + chained._clauses)
+
+    add_clause.__name__ = assertions.clause_name(assertion_name)
+    setattr(Expectation, add_clause.__name__, add_clause)
+    return assertion
+
+
+class Asserter:
+    """
+    Offers the assertions available after expect(). Every assertion returns an Expectation, the test function to be
+    passed to it(); the @_clause decorator adds each assertion to Expectation as and_* clause.
+    """
+    __slots__ = ("_actual_value",)
+
+    def __init__(self, actual_value):
+        self._actual_value = actual_value
+
+    def _get_actual_value(self, test_case=None):
+        lazy_value = self._actual_value
+        owner = async_support.owner_of(test_case)
+        is_callable = hasattr(lazy_value, '__call__')
+
+        def evaluate():
+            return async_support.resolve(lazy_value() if is_callable else lazy_value, owner)
+
+        values = _actual_values.get()
+        if values is None or not (is_callable or isawaitable(lazy_value)):
+            return evaluate()
+        return values.get(lazy_value, evaluate)
+
+    @_clause
+    def to_be(self, expected_value) -> Expectation:
+        def run_test(_):
+            assertions.assert_equal(expected_value, self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_not_be(self, expected_value) -> Expectation:
+        def run_test(_):
+            assertions.assert_not_equal(expected_value, self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_be_of_type(self, expected_type) -> Expectation:
+        def run_test(_):
+            assertions.assert_is_instance(self._get_actual_value(_), expected_type)
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_equal_list(self, expected_list) -> Expectation:
+        def run_test(_):
+            assertions.assert_list_equal(expected_list, self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_contain(self, expected_element) -> Expectation:
+        def run_test(_):
+            assertions.assert_true(expected_element in self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_contain_all(self, expected_elements) -> Expectation:
+        def run_test(_=None):
+            assertions.assert_contains_all(self._get_actual_value(_), expected_elements)
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_contain_any(self, expected_elements) -> Expectation:
+        def run_test(_=None):
+            assertions.assert_contains_any(self._get_actual_value(_), expected_elements)
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_contain_exactly(self, expected_elements) -> Expectation:
+        def run_test(_=None):
+            assertions.assert_contains_exactly(self._get_actual_value(_), expected_elements)
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_be_true(self) -> Expectation:
+        def run_test(_):
+            assertions.assert_true(self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
+
+    @_clause
+    def to_be_false(self) -> Expectation:
+        def run_test(_):
+            assertions.assert_false(self._get_actual_value(_))
+
+        return Expectation(self, [run_test])
 
-    class Asserter(unittest.TestCase):
+    @_clause
+    def to_be_none(self) -> Expectation:
+        def run_test(_):
+            assertions.assert_is_none(self._get_actual_value(_))
 
-        def to_be(self, expected_value) -> Callable:
-            def run_test(_):
-                self.assertEqual(expected_value, _get_actual_value())
+        return Expectation(self, [run_test])
 
-            return run_test
+    @_clause
+    def to_not_be_none(self) -> Expectation:
+        def run_test(_):
+            assertions.assert_is_not_none(self._get_actual_value(_))
 
-        def to_not_be(self, expected_value) -> Callable:
-            def run_test(_):
-                self.assertNotEqual(expected_value, _get_actual_value())
+        return Expectation(self, [run_test])
 
-            return run_test
+    @_clause
+    def to_be_a_list(self) -> Expectation:
+        return self.to_be_of_type(list)
 
-        def to_be_of_type(self, expected_type) -> Callable:
-            def run_test(_):
-                self.assertIsInstance(_get_actual_value(), expected_type)
+    @_clause
+    def to_be_a_dict(self) -> Expectation:
+        return self.to_be_of_type(dict)
 
-            return run_test
+    @_clause
+    def to_be_a_set(self) -> Expectation:
+        return self.to_be_of_type(set)
 
-        def to_equal_list(self, expected_list) -> Callable:
-            def run_test(_):
-                self.assertListEqual(expected_list, _get_actual_value())
+    @_clause
+    def to_be_of_length(self, expected_length: int) -> Expectation:
+        def run_test(_):
+            assertions.assert_equal(expected_length, len(self._get_actual_value(_)))
 
-            return run_test
+        return Expectation(self, [run_test])
 
-        def to_contain(self, expected_element) -> Callable:
-            def run_test(_):
-                self.assertTrue(expected_element in _get_actual_value())
+    @_clause
+    def to_be_close_to(self, expected, rtol: float = 1e-07, atol: float = 0.0) -> Expectation:
+        def run_test(_=None):
+            arrays.assert_close_to(self._get_actual_value(_), expected, rtol, atol)
 
-            return run_test
+        return Expectation(self, [run_test])
 
-        def to_contain_all(self, expected_elements) -> Callable:
-            def run_test(_=None):
-                is_contained = True
-                for element in expected_elements:
-                    if element not in _get_actual_value():
-                        is_contained = False
-                        break
-                self.assertTrue(is_contained)
+    @_clause
+    def to_all_satisfy(self, predicate: Callable) -> Expectation:
+        def run_test(_=None):
+            arrays.assert_all_satisfy(self._get_actual_value(_), predicate)
 
-            return run_test
+        return Expectation(self, [run_test])
 
-        def to_be_true(self) -> Callable:
-            def run_test(_):
-                self.assertTrue(_get_actual_value())
+    @_clause
+    def to_have_shape(self, expected_shape) -> Expectation:
+        def run_test(_=None):
+            arrays.assert_shape(self._get_actual_value(_), expected_shape)
 
-            return run_test
+        return Expectation(self, [run_test])
 
-        def to_be_false(self) -> Callable:
-            def run_test(_):
-                self.assertFalse(_get_actual_value())
+    @_clause
+    def to_complete_within(self, seconds: float, rounds: int = 7, warmup: int = 1) -> Expectation:
+        from unittest_specs import performance
 
-            return run_test
+        def run_test(_=None):
+            performance.assert_completes_within(self._actual_value, seconds, rounds, warmup)
 
-        def to_be_none(self) -> Callable:
-            def run_test(_):
-                self.assertIsNone(_get_actual_value())
+        return Expectation(self, [run_test])
 
-            return run_test
+    @_clause
+    def to_run_faster_than(self, other_callable, factor: float = 1.0, rounds: int = 7, warmup: int = 1) -> Expectation:
+        from unittest_specs import performance
 
-        def to_not_be_none(self) -> Callable:
-            def run_test(_):
-                self.assertIsNotNone(_get_actual_value())
+        def run_test(_=None):
+            performance.assert_faster_than(self._actual_value, other_callable, factor, rounds, warmup)
 
-            return run_test
+        return Expectation(self, [run_test])
 
-        def to_be_a_list(self) -> Callable:
-            return self.to_be_of_type(list)
+    @_clause
+    def to_allocate_less_than(self, max_bytes: int, rounds: int = 5, warmup: int = 1) -> Expectation:
+        from unittest_specs import performance
 
-        def to_be_a_dict(self) -> Callable:
-            return self.to_be_of_type(dict)
+        def run_test(_=None):
+            performance.assert_allocates_less_than(self._actual_value, max_bytes, rounds, warmup)
 
-        def to_be_a_set(self) -> Callable:
-            return self.to_be_of_type(set)
+        return Expectation(self, [run_test])
 
-        def to_be_of_length(self, expected_length: int) -> Callable:
-            def run_test(_):
-                self.assertEqual(expected_length, len(_get_actual_value()))
+    @_clause
+    def to_scale_at_most(self, complexity, inputs, tolerance: float = 2.0, rounds: int = 5,
+                         warmup: int = 1) -> Expectation:
+        from unittest_specs import performance
 
-            return run_test
+        def run_test(_=None):
+            performance.assert_scales_at_most(self._actual_value, complexity, inputs, tolerance, rounds, warmup)
 
-    return Asserter()
+        return Expectation(self, [run_test])
@@ -0,0 +1,150 @@
+"""
+Test impact analysis: records which project files every test executes code of and selects, on later runs, only the
+tests depending on files that changed since. Used by ``python -m unittest_specs --impact``.
+
+Files are recorded with sys.settrace() on call events only, so every function runs at full speed once it has been
+entered. Code running at import time (e.g. values computed for expect()) is not attributed to any test, which is why
+the module defining a test always counts as one of its dependencies. Class and module fixtures are attributed to the
+first test run after them.
+"""
+import hashlib
+import os
+import sys
+import threading
+from typing import Dict, Iterable, List, Set
+
+from unittest_specs import storage
+
+INDEX_FILE = "impact.json"
+
+
+_active_recorder = None
+
+
+def project_file(file_name: str, root: str = None) -> str:
+    """
+    Returns the absolute path of a file if it belongs to the project, i.e. lies within root (the working directory by
+    default) but not in an installed package, and an empty string otherwise. Pseudo file names of code without a file,
+    e.g. ``<frozen posixpath>`` or ``<string>``, never belong to the project.
+    """
+    if file_name.startswith("<"):
+        return ""
+
+    path = os.path.abspath(file_name)
+    if path.startswith(os.path.join(os.path.abspath(root or os.getcwd()), "")) and "site-packages" not in path:
+        return path
+    return ""
+
+
+def record_files(paths: Iterable[str]) -> None:
+    """
+    Adds files to those recorded for the running test, e.g. the dependencies of a test whose result is taken from the
+    result cache instead of executing it.
+    """
+    recorder = _active_recorder
+    if recorder is not None:
+        recorder.files.update(paths)
+
+
+class FileRecorder:
+    """
+    Records the project files whose code is executed while recording.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = os.path.join(os.path.abspath(root or os.getcwd()), "")
+        self.files = set()
+        self._known_code = {}
+
+    def _trace(self, frame, event, arg):
+        code = frame.f_code
+        file_name = self._known_code.get(code)
+        if file_name is None:
+            file_name = self._known_code[code] = self._project_file(code.co_filename)
+        if file_name:
+            self.files.add(file_name)
+        return None
+
+    def _project_file(self, file_name: str) -> str:
+        return project_file(file_name, self.root)
+
+    def start(self) -> None:
+        global _active_recorder
+
+        _active_recorder = self
+        sys.settrace(self._trace)
+        threading.settrace(self._trace)
+
+    def stop(self) -> None:
+        global _active_recorder
+
+        sys.settrace(None)
+        threading.settrace(None)
+        _active_recorder = None
+
+    def take(self) -> Set[str]:
+        """
+        Returns the files recorded since the last call.
+        """
+        files, self.files = self.files, set()
+        return files
+
+
+def file_hash(path: str, cache: Dict[str, str] = None) -> str:
+    """
+    Hashes the content of a file; missing files hash to an empty string.
+    """
+    if cache is not None and path in cache:
+        return cache[path]
+    try:
+        with open(path, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        digest = ""
+    if cache is not None:
+        cache[path] = digest
+    return digest
+
+
+def load_index() -> Dict[str, dict]:
+    """
+    Loads the impact index, mapping test ids to the hashes of the files they depend on and whether they failed.
+    """
+    return storage.load_json(INDEX_FILE, {})
+
+
+def update_index(touched: Dict[str, Iterable[str]], failed: Iterable[str]) -> None:
+    """
+    Stores the files touched by tests, with their current hashes, in the impact index.
+
+    :param touched: the files touched by every executed test, by test id
+    :param failed: the ids of the executed tests that failed
+    """
+    index = load_index()
+    hashes = {}
+    failed = set(failed)
+    for test_id, files in touched.items():
+        index[test_id] = {"files": {path: file_hash(path, hashes) for path in sorted(files)},
+                          "failed": test_id in failed}
+    storage.save_json(INDEX_FILE, index)
+
+
+def is_affected(test_id: str, index: Dict[str, dict], hashes: Dict[str, str]) -> bool:
+    entry = index.get(test_id)
+    if entry is None or entry["failed"]:
+        return True
+    return any(file_hash(path, hashes) != digest for path, digest in entry["files"].items())
+
+
+def select(test_ids: List[str], index: Dict[str, dict] = None) -> List[bool]:
+    """
+    Determines which tests need to run: tests missing from the index, tests that failed on their last run and tests
+    depending on files whose content changed since it was recorded.
+
+    :param test_ids: the ids of the tests to select from
+    :param index: the impact index, loaded from the state directory if omitted
+    :return: whether each test needs to run
+    """
+    index = load_index() if index is None else index
+    hashes = {}
+    return [is_affected(test_id, index, hashes) for test_id in test_ids]
@@ -0,0 +1,105 @@
+"""
+Parameter sources for SimpleFlatSpec.parameterize(). Data sets are streamed row by row, so sources do not need to fit
+into memory.
+"""
+import csv
+import json
+import random
+from heapq import nlargest
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Tuple, Union
+
+ParameterSource = Union[Iterable, Callable[[], Iterable]]
+
+
+def iterate(params: ParameterSource) -> Iterable:
+    """
+    Opens a parameter source for one test run. Factories (callables returning an iterable) are called on every run,
+    which makes sources like generators re-iterable; any other iterable is returned as it is.
+
+    :param params: an iterable of data sets or a factory creating one
+    :return: the data sets of this run
+    """
+    return params() if callable(params) else params
+
+
+def parse_shard(shard: Union[Tuple[int, int], str]) -> Tuple[int, int]:
+    """
+    Parses a shard specification into its index and count.
+
+    :param shard: either a tuple ``(index, count)`` or a string ``"index/count"``, with index starting at 0
+    :return: a tuple ``(index, count)``
+    """
+    index, count = (int(part) for part in shard.split("/")) if isinstance(shard, str) else shard
+    if not 0 <= index < count:
+        raise ValueError(f"Invalid shard {index} of {count}, index needs to be between 0 and {count - 1}")
+    return index, count
+
+
+def select(rows: Iterable, limit: int = None, sample: int = None, seed=0,
+           shard: Union[Tuple[int, int], str] = None) -> Iterator:
+    """
+    Streams a subset of data sets. Options are applied in the order shard, sample, limit.
+
+    :param rows: the data sets to select from
+    :param limit: only use the first ``limit`` data sets
+    :param sample: draw a random sample of this many data sets; the sample is reproducible for the same seed, keeps
+    the original order and only holds ``sample`` rows in memory
+    :param seed: the seed for sample
+    :param shard: only use every n-th data set, given as ``(index, count)`` or ``"index/count"``, to split huge data
+    sets across several workers
+    :return: an iterator over the selected data sets
+    """
+    if shard is not None:
+        index, count = parse_shard(shard)
+        rows = islice(rows, index, None, count)
+
+    if sample is not None:
+        generator = random.Random(seed)
+        keyed = nlargest(sample, ((generator.random(), position, row) for position, row in enumerate(rows)))
+        rows = (row for _, _, row in sorted(keyed, key=lambda entry: entry[1]))
+
+    if limit is not None:
+        rows = islice(rows, limit)
+
+    return iter(rows)
+
+
+def csv_rows(path: str, skip_header: bool = True, convert: Callable = None, **reader_options) -> Callable[[], Iterator]:
+    """
+    Creates a factory streaming the rows of a CSV file as data sets.
+
+    :param path: path of the CSV file
+    :param skip_header: whether the first line should be skipped
+    :param convert: optional function applied to every row (a list of strings), e.g. to convert column types;
+    rows are passed on as tuples otherwise
+    :param reader_options: further arguments passed to csv.reader()
+    :return: a parameter source to be passed to parameterize()
+    """
+    def rows():
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file, **reader_options)
+            if skip_header:
+                next(reader, None)
+            for row in reader:
+                yield convert(row) if convert else tuple(row)
+
+    return rows
+
+
+def jsonl_rows(path: str) -> Callable[[], Iterator]:
+    """
+    Creates a factory streaming a JSON Lines file as data sets. JSON arrays are passed on as parameter tuples, any
+    other value as single parameter. Empty lines are skipped.
+
+    :param path: path of the JSON Lines file
+    :return: a parameter source to be passed to parameterize()
+    """
+    def rows():
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    value = json.loads(line)
+                    yield tuple(value) if isinstance(value, list) else value
+
+    return rows
@@ -0,0 +1,187 @@
+"""
+Performance assertions on callables: latency budgets, relative speed, memory allocation and asymptotic scaling.
+Every measurement is repeated after warmup runs and compared by its median, with the interquartile range reported on
+failure, to keep the assertions from flaking.
+"""
+import gc
+import math
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Iterable, List
+
+from unittest_specs.assertions import fail
+
+__unittest = True  # hides frames of this module from unittest's failure tracebacks
+
+MIN_ROUND_TIME = 0.002
+
+
+def O_1(n: int) -> float:
+    return 1.0
+
+
+def O_log_n(n: int) -> float:
+    return math.log2(max(n, 2))
+
+
+def O_n(n: int) -> float:
+    return float(n)
+
+
+def O_n_log_n(n: int) -> float:
+    return n * math.log2(max(n, 2))
+
+
+def O_n2(n: int) -> float:
+    return float(n) ** 2
+
+
+def O_n3(n: int) -> float:
+    return float(n) ** 3
+
+
+class Sample:
+    """
+    Repeated measurements of the same quantity, e.g. seconds per call.
+    """
+
+    def __init__(self, values: List[float]):
+        self.values = values
+        self.median = statistics.median(values)
+        quartiles = statistics.quantiles(values, n=4) if len(values) > 1 else (values[0], values[0], values[0])
+        self.iqr = quartiles[2] - quartiles[0]
+
+    def describe(self, unit: str = "s") -> str:
+        return f"median {self.median:.6g}{unit} (IQR {self.iqr:.3g}{unit}, {len(self.values)} rounds)"
+
+
+def _loops_per_round(function: Callable) -> int:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        if time.perf_counter() - start >= MIN_ROUND_TIME or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def time_per_call(function: Callable, rounds: int = 7, warmup: int = 1) -> Sample:
+    """
+    Measures the time per call of a function. Fast functions are called repeatedly per round, so that every round
+    takes at least MIN_ROUND_TIME and timer resolution does not distort the result.
+
+    :param function: the function to measure, called without arguments
+    :param rounds: number of measured rounds
+    :param warmup: number of unmeasured calls before measuring
+    :return: the seconds per call of every round
+    """
+    for _ in range(warmup):
+        function()
+
+    loops = _loops_per_round(function)
+    durations = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                function()
+            durations.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return Sample(durations)
+
+
+def allocated_bytes(function: Callable, rounds: int = 5, warmup: int = 1) -> Sample:
+    """
+    Measures the peak memory allocated during a call of a function using tracemalloc.
+
+    :param function: the function to measure, called without arguments
+    :param rounds: number of measured calls
+    :param warmup: number of unmeasured calls before measuring, e.g. to fill caches
+    :return: the peak allocated bytes of every call
+    """
+    for _ in range(warmup):
+        function()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(rounds):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(float(peak - baseline))
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return Sample(peaks)
+
+
+def _size_of(value) -> int:
+    return len(value) if hasattr(value, "__len__") else int(value)
+
+
+def assert_completes_within(function: Callable, seconds: float, rounds: int = 7, warmup: int = 1) -> None:
+    sample = time_per_call(function, rounds, warmup)
+    if sample.median > seconds:
+        fail(f"expected to complete within {seconds:.6g}s, but took {sample.describe()}")
+
+
+def assert_faster_than(function: Callable, other: Callable, factor: float = 1.0, rounds: int = 7,
+                       warmup: int = 1) -> None:
+    """
+    Asserts that a function is at least ``factor`` times faster than another one. Rounds of both functions are
+    interleaved, so that fluctuations of the machine's speed affect both alike.
+    """
+    own_rounds, other_rounds = [], []
+    for _ in range(rounds):
+        own_rounds.extend(time_per_call(function, 1, warmup).values)
+        other_rounds.extend(time_per_call(other, 1, warmup).values)
+
+    own, reference = Sample(own_rounds), Sample(other_rounds)
+    if own.median * factor > reference.median:
+        fail(f"expected to run at least {factor:g}x faster than {getattr(other, '__name__', other)}, but took "
+             f"{own.describe()} compared to {reference.describe()} ({reference.median / own.median:.3g}x)")
+
+
+def assert_allocates_less_than(function: Callable, max_bytes: int, rounds: int = 5, warmup: int = 1) -> None:
+    sample = allocated_bytes(function, rounds, warmup)
+    if sample.median >= max_bytes:
+        fail(f"expected to allocate less than {max_bytes} bytes, but allocated {sample.describe(' bytes')}")
+
+
+def assert_scales_at_most(function: Callable, complexity: Callable[[int], float], inputs: Iterable,
+                          tolerance: float = 2.0, rounds: int = 5, warmup: int = 1,
+                          size: Callable = _size_of) -> None:
+    """
+    Asserts that the run time of a function grows no faster than a complexity function, e.g. O_n_log_n. The function
+    is timed for every input; the growth of its median time from the smallest to the largest input must not exceed
+    the growth of the complexity function by more than ``tolerance``.
+
+    :param function: the function to measure, called with every input
+    :param complexity: the upper bound, a function of the input size
+    :param inputs: at least two inputs of different sizes
+    :param tolerance: factor the measured growth may exceed the expected growth by
+    :param size: determines the size of an input, defaults to len() or the input itself for numbers
+    """
+    measurements = sorted(((size(value), time_per_call(lambda value=value: function(value), rounds, warmup))
+                           for value in inputs), key=lambda measurement: measurement[0])
+    if len(measurements) < 2 or measurements[0][0] == measurements[-1][0]:
+        raise ValueError("Scaling can only be asserted for at least two inputs of different sizes")
+
+    (smallest, fastest), (largest, slowest) = measurements[0], measurements[-1]
+    expected_growth = complexity(largest) / complexity(smallest)
+    measured_growth = slowest.median / fastest.median
+
+    if measured_growth > expected_growth * tolerance:
+        details = "\n".join(f"  n={n}: {sample.describe()}" for n, sample in measurements)
+        fail(f"expected run time to grow at most like {complexity.__name__} ({expected_growth:.3g}x from n={smallest}"
+             f" to n={largest}), but it grew {measured_growth:.3g}x:\n{details}")
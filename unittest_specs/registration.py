@@ -0,0 +1,85 @@
+import sys
+import unittest
+from importlib import import_module
+from inspect import getmodule
+from types import ModuleType
+from typing import Any, Callable, Type, Union
+
+
+_modules_by_namespace = {}
+
+
+def caller_module(depth: int = 1) -> ModuleType:
+    """
+    Determines the module of a calling frame without building the full stack. Unlike inspect.stack(), this does not
+    create FrameInfo records or read any source context from disk.
+
+    :param depth: how many frames above the function calling caller_module() to look; 1 refers to its direct caller
+    :return: the module the frame's code is executed in
+    """
+    frame = sys._getframe(depth + 1)
+    namespace = frame.f_globals
+
+    module = _modules_by_namespace.get(id(namespace))
+    if module is not None and module.__dict__ is namespace:
+        return module
+
+    module = sys.modules.get(namespace.get("__name__"))
+    if module is None or module.__dict__ is not namespace:
+        module = getmodule(frame)
+
+    _modules_by_namespace[id(namespace)] = module
+    return module
+
+
+def resolve_module(target: Union[ModuleType, str, None] = None, depth: int = 1) -> ModuleType:
+    """
+    Resolves the module generated test classes should be registered in.
+
+    :param target: an explicit module object or the qualified name of a module; if omitted, the module of the calling
+    frame is used
+    :param depth: how many frames above the function calling resolve_module() the caller lives, only used without
+    an explicit target
+    :return: the resolved module
+    """
+    if target is None:
+        return caller_module(depth + 1)
+    if isinstance(target, str):
+        return sys.modules.get(target) or import_module(target)
+    return target
+
+
+def register(module: ModuleType, name: str, value: Any) -> None:
+    """
+    Hooks a generated object into a module's namespace, so that unittest picks it up during auto-discovery.
+
+    :param module: the target module
+    :param name: the attribute name to register the value under
+    :param value: the object to register, typically a unittest.TestCase subclass
+    """
+    setattr(module, name, value)
+
+
+def add_test(module: ModuleType, class_name: str, method_name: str, test_function: Callable,
+             class_members: dict = None) -> Type[unittest.TestCase]:
+    """
+    Adds a test method to a unittest.TestCase subclass registered in a module. The class is created and registered on
+    first use and extended in place afterwards, so that the number of generated classes does not grow with the number
+    of tests and references held by unittest loaders stay valid.
+
+    :param module: the module the test class is registered in
+    :param class_name: name of the test class
+    :param method_name: name of the test method to add
+    :param test_function: the test method
+    :param class_members: further members of the test class, only used when the class is created
+    :return: the test class containing the added method
+    """
+    test_class = module.__dict__.get(class_name)
+
+    if not (isinstance(test_class, type) and issubclass(test_class, unittest.TestCase)):
+        test_class = type(class_name, (unittest.TestCase,), {"__module__": module.__name__, **(class_members or {})})
+        register(module, class_name, test_class)
+
+    test_function.__name__ = method_name
+    setattr(test_class, method_name, test_function)
+    return test_class
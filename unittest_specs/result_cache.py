@@ -0,0 +1,365 @@
+"""
+Result cache for deterministic specs, i.e. tests whose outcome only depends on their code and inputs. A passing
+deterministic test is stored under a key hashing its id, its code including closures, defaults and parameters, and the
+sources of the project modules it depends on; as long as none of them changes, later runs skip it and report a pass.
+
+Dependencies are the module defining the test and the modules of all functions and classes its fingerprint reaches,
+along with every project module these import, directly or indirectly. Changes to installed packages, data files,
+environment variables or module level state computed at runtime are not detected. Set the environment variable
+``UNITTEST_SPECS_RESULT_CACHE=0`` to execute all tests, e.g. on CI.
+
+Entries are stored in ``.unittest_specs/results.json``; entries not used for MAX_AGE seconds are evicted, as are the
+least recently used ones beyond MAX_ENTRIES.
+"""
+import atexit
+import hashlib
+import os
+import sys
+import threading
+import time
+from functools import wraps
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from unittest_specs import impact, storage
+
+CACHE_FILE = "results.json"
+MAX_ENTRIES = 10_000
+MAX_AGE = 30 * 24 * 60 * 60
+MAX_DEPTH = 64
+
+enabled = os.environ.get("UNITTEST_SPECS_RESULT_CACHE", "1") != "0"
+report_at_exit = True
+
+_ATOMIC_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+_lock = threading.Lock()
+_entries = None
+_changed = {}
+_module_files = {}
+_file_hashes = {}
+_hits = _misses = _uncacheable = 0
+_time_saved = 0.0
+
+
+class Uncacheable(Exception):
+    """
+    Raised for tests referencing values that cannot be fingerprinted reproducibly, e.g. generators or open files.
+    Such tests are always executed.
+    """
+
+
+class CacheStats(NamedTuple):
+    hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+    time_saved: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(*(mine + theirs for mine, theirs in zip(self, other)))
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(*(mine - theirs for mine, theirs in zip(self, other)))
+
+    def __str__(self):
+        report = f"result cache: {self.hits} hits, {self.misses} misses ({self.hit_ratio:.1%} hit ratio), " \
+                 f"{self.time_saved:.3f}s saved"
+        if self.uncacheable:
+            report += f", {self.uncacheable} uncacheable"
+        return report
+
+
+class _Fingerprint:
+    """
+    Hashes values by their content, collecting the modules of all functions and classes encountered.
+    """
+
+    def __init__(self):
+        self.digest = hashlib.sha1()
+        self.modules = set()
+        self._path = set()
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+
+    def _update(self, *tokens) -> None:
+        for token in tokens:
+            self.digest.update(token if isinstance(token, bytes) else str(token).encode("utf-8", "surrogatepass"))
+            self.digest.update(b"\0")
+
+    def _module(self, name) -> None:
+        module = sys.modules.get(name) if isinstance(name, str) else None
+        if module is not None:
+            self.modules.add(module)
+        self._update(name)
+
+    def add(self, value, depth: int = 0) -> None:
+        if depth > MAX_DEPTH:
+            raise Uncacheable(f"{type(value).__qualname__} is nested too deeply")
+
+        value_type = type(value)
+        self._update(value_type.__module__, value_type.__qualname__)
+        if isinstance(value, _ATOMIC_TYPES):
+            self._update(repr(value))
+            return
+
+        if id(value) in self._path:
+            self._update("<cycle>")
+            return
+        self._path.add(id(value))
+        try:
+            self._add_composite(value, depth + 1)
+        finally:
+            self._path.discard(id(value))
+
+    def _add_composite(self, value, depth: int) -> None:
+        if isinstance(value, (list, tuple)):
+            self._update(len(value))
+            for item in value:
+                self.add(item, depth)
+        elif isinstance(value, dict):
+            self._update(len(value))
+            for key, item in value.items():
+                self.add(key, depth)
+                self.add(item, depth)
+        elif isinstance(value, (set, frozenset)):
+            self._update(*sorted(self._nested(item, depth) for item in value))
+        elif isinstance(value, CodeType):
+            self._update(value.co_code, value.co_names)
+            self.add(value.co_consts, depth)
+        elif isinstance(value, FunctionType):
+            self._module(value.__module__)
+            self._update(value.__qualname__)
+            self.add(value.__code__, depth)
+            self.add(value.__defaults__, depth)
+            self.add(value.__kwdefaults__, depth)
+            for cell in value.__closure__ or ():
+                try:
+                    self.add(cell.cell_contents, depth)
+                except ValueError:  # cell of a variable not assigned yet
+                    self._update("<empty>")
+        elif isinstance(value, MethodType):
+            self.add(value.__func__, depth)
+            self.add(value.__self__, depth)
+        elif isinstance(value, BuiltinFunctionType):
+            self._module(value.__module__)
+            self._update(value.__qualname__)
+            if not isinstance(value.__self__, (ModuleType, type(None))):
+                self.add(value.__self__, depth)
+        elif isinstance(value, type):
+            self._module(value.__module__)
+            self._update(value.__qualname__)
+        elif isinstance(value, ModuleType):
+            self._module(value.__name__)
+        else:
+            self._add_object(value, depth)
+
+    def _add_object(self, value, depth: int) -> None:
+        self._module(type(value).__module__)
+        try:
+            reduced = value.__reduce_ex__(4)
+        except Exception as error:
+            raise Uncacheable(f"cannot fingerprint {type(value).__qualname__}: {error}") from None
+        if isinstance(reduced, str):
+            self._update(reduced)
+            return
+        self.add(reduced[0], depth)
+        self.add(reduced[1], depth)
+        for part in reduced[2:]:
+            self.add(list(part) if part is not None and not isinstance(part, (dict, tuple)) else part, depth)
+
+    def _nested(self, value, depth: int) -> str:
+        nested = _Fingerprint()
+        nested.add(value, depth)
+        self.modules |= nested.modules
+        return nested.hexdigest()
+
+
+def _project_files(module: ModuleType) -> FrozenSet[str]:
+    """
+    Determines the files of a project module and of all project modules it imports, directly or indirectly.
+    """
+    files = _module_files.get(module.__name__)
+    if files is not None:
+        return files
+
+    found = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        path = impact.project_file(getattr(current, "__file__", None) or "")
+        if not path or path in found:
+            continue
+        found[path] = current
+        for value in list(vars(current).values()):
+            if isinstance(value, ModuleType):
+                pending.append(value)
+            elif isinstance(value, (type, FunctionType)):
+                dependency = sys.modules.get(value.__module__)
+                if dependency is not None:
+                    pending.append(dependency)
+
+    files = _module_files[module.__name__] = frozenset(found)
+    return files
+
+
+def result_key(test_id: str, test_function: Callable, module: ModuleType = None) -> Tuple[str, FrozenSet[str]]:
+    """
+    Computes the cache key of a test.
+
+    :param test_id: the id of the test
+    :param test_function: the test function, including everything it references through closures and defaults
+    :param module: the module defining the test, if it is not the module of test_function
+    :return: the key and the project files the test depends on
+    :raises Uncacheable: if the test references values that cannot be fingerprinted
+    """
+    fingerprint = _Fingerprint()
+    fingerprint.add((sys.version, test_id))
+    fingerprint.add(test_function)
+    if module is not None:
+        fingerprint.modules.add(module)
+
+    files = frozenset().union(*map(_project_files, fingerprint.modules))
+    for path in sorted(files):
+        fingerprint.add((path, impact.file_hash(path, _file_hashes)))
+    return fingerprint.hexdigest(), files
+
+
+def _load() -> Dict[str, dict]:
+    global _entries
+
+    if _entries is None:
+        _entries = storage.load_json(CACHE_FILE, {})
+        atexit.register(_at_exit)
+    return _entries
+
+
+def lookup(key: str) -> Optional[dict]:
+    """
+    Looks up a cached result, marking it as used.
+    """
+    with _lock:
+        entry = _load().get(key)
+        if entry is not None:
+            entry = _changed[key] = dict(entry, used=time.time())
+        return entry
+
+
+def store(key: str, test_id: str, duration: float) -> None:
+    """
+    Stores the result of a passed test, replacing the outdated entries of the same test when saved.
+    """
+    with _lock:
+        _load()[key] = _changed[key] = {"test": test_id, "duration": duration, "used": time.time()}
+
+
+def evict(entries: Dict[str, dict], now: float = None) -> Dict[str, dict]:
+    """
+    Drops entries not used for MAX_AGE seconds and the least recently used ones beyond MAX_ENTRIES.
+    """
+    oldest = (time.time() if now is None else now) - MAX_AGE
+    recent = sorted((entry["used"], key) for key, entry in entries.items() if entry["used"] >= oldest)
+    return {key: entries[key] for _, key in recent[-MAX_ENTRIES:]} if MAX_ENTRIES else {}
+
+
+def save() -> None:
+    """
+    Merges the entries used or stored by this process into the cache file, so that processes running tests in
+    parallel do not discard each other's results.
+    """
+    with _lock:
+        if not _changed:
+            return
+        entries = storage.load_json(CACHE_FILE, {})
+        replaced = {entry["test"] for entry in _changed.values()}
+        entries = {key: entry for key, entry in entries.items() if entry.get("test") not in replaced}
+        entries.update(_changed)
+        _changed.clear()
+        storage.save_json(CACHE_FILE, evict(entries))
+
+
+def clear() -> None:
+    """
+    Removes all cached results and resets the statistics.
+    """
+    global _entries, _hits, _misses, _uncacheable, _time_saved
+
+    with _lock:
+        _entries = {}
+        _changed.clear()
+        _hits = _misses = _uncacheable = 0
+        _time_saved = 0.0
+        storage.save_json(CACHE_FILE, {})
+
+
+def stats() -> CacheStats:
+    """
+    Returns the statistics of all cache lookups in this process.
+    """
+    return CacheStats(_hits, _misses, _uncacheable, _time_saved)
+
+
+def _count(hit: dict = None, miss: bool = False, uncacheable: bool = False) -> None:
+    global _hits, _misses, _uncacheable, _time_saved
+
+    with _lock:
+        if hit is not None:
+            _hits += 1
+            _time_saved += hit["duration"]
+        _misses += miss
+        _uncacheable += uncacheable
+
+
+def _at_exit() -> None:
+    save()
+    current = stats()
+    if report_at_exit and current.hits + current.misses + current.uncacheable:
+        sys.stderr.write(f"\n{current}\n")
+
+
+def _succeeded(test_case) -> bool:
+    # failing sub-tests and skips do not raise out of the test method, but are tracked by its outcome
+    outcome = getattr(test_case, "_outcome", None)
+    return outcome is not None and outcome.success and not outcome.expecting_failure
+
+
+def cached(test_function: Callable, module: ModuleType = None) -> Callable:
+    """
+    Wraps a deterministic test function taking the executing test case as first argument, skipping it while its cache
+    key is unchanged since it last passed.
+
+    :param test_function: the test function
+    :param module: the module defining the test, if it is not the module of test_function
+    :return: the wrapped test function
+    """
+    @wraps(test_function)
+    def cached_test(test_case=None, *args, **kwargs):
+        if not enabled or test_case is None or args or kwargs:
+            return test_function(test_case, *args, **kwargs)
+
+        try:
+            key, files = result_key(test_case.id(), test_function,
+                                    module or sys.modules.get(type(test_case).__module__))
+        except Uncacheable:
+            _count(uncacheable=True)
+            return test_function(test_case)
+
+        entry = lookup(key)
+        if entry is not None:
+            _count(hit=entry)
+            impact.record_files(files)
+            return None
+
+        _count(miss=True)
+        started = time.perf_counter()
+        result = test_function(test_case)
+        if _succeeded(test_case):
+            store(key, test_case.id(), time.perf_counter() - started)
+        return result
+
+    return cached_test
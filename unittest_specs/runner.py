@@ -0,0 +1,494 @@
+"""
+Parallel spec runner behind ``python -m unittest_specs``. It discovers tests like ``python -m unittest discover``
+(describe() classes, SimpleFlatSpec subclasses and scenario suites alike), splits them into shards of whole test
+classes or single test methods, runs the shards on a process pool and merges all outcomes into one unittest report.
+
+Shards are balanced by the durations recorded in previous runs (see unittest_specs.storage): units of work are
+assigned longest first to the shard with the least total duration so far. Within a shard, units run in discovery order
+or, with the priority order, tests that failed in their last run first and the fastest ones after them, so that red
+builds fail as early as possible.
+"""
+import argparse
+import heapq
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import unittest
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import import_module
+from typing import Collection, Dict, Iterable, List, Tuple
+
+from unittest_specs import fixtures, impact, result_cache, storage, timing
+
+CLASS = "class"
+METHOD = "method"
+
+DISCOVERY = "discovery"
+PRIORITY = "priority"
+
+DURATIONS_FILE = "durations.json"
+OUTCOMES_FILE = "outcomes.json"
+DEFAULT_DURATION = 0.01
+
+# a test is addressed by module name, qualified class name and method name, since method names generated from
+# descriptions may contain dots and test ids cannot be split reliably
+Address = Tuple[str, str, str]
+
+# set by the first worker failing with failfast, stopping the other workers after their current test
+_stop_event = None
+
+
+def iterate_tests(suite) -> Iterable[unittest.TestCase]:
+    """
+    Flattens a (nested) unittest.TestSuite into its test cases.
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iterate_tests(test)
+        else:
+            yield test
+
+
+def address_of(test: unittest.TestCase):
+    """
+    Determines the address a worker process can load a test by, or None if it can only run in this process (e.g. the
+    placeholders unittest creates for modules failing to import).
+    """
+    test_class = type(test)
+    method_name = getattr(test, "_testMethodName", None)
+    try:
+        resolved = import_module(test_class.__module__)
+        for name in test_class.__qualname__.split("."):
+            resolved = getattr(resolved, name)
+    except (ImportError, AttributeError):
+        return None
+    if resolved is not test_class or method_name is None or not hasattr(test_class, method_name):
+        return None
+    return test_class.__module__, test_class.__qualname__, method_name
+
+
+def test_id(address: Address) -> str:
+    return ".".join(address)
+
+
+def load_test(address: Address) -> unittest.TestCase:
+    module_name, class_name, method_name = address
+    test_class = import_module(module_name)
+    for name in class_name.split("."):
+        test_class = getattr(test_class, name)
+    return test_class(method_name)
+
+
+def group(addresses: List[Address], granularity: str = CLASS) -> Dict[str, List[Address]]:
+    """
+    Groups tests into units that are never split across shards: whole test classes, so that setUpClass() runs once,
+    or single test methods.
+
+    :return: the units by their id, in discovery order
+    """
+    if granularity not in (CLASS, METHOD):
+        raise ValueError(f"Unknown granularity {granularity!r}, expected {CLASS!r} or {METHOD!r}")
+
+    units = {}
+    for address in addresses:
+        unit_id = f"{address[0]}.{address[1]}" if granularity == CLASS else test_id(address)
+        units.setdefault(unit_id, []).append(address)
+    return units
+
+
+def _default_duration(durations: Dict[str, float]) -> float:
+    return sum(durations.values()) / len(durations) if durations else DEFAULT_DURATION
+
+
+def prioritize(units: Dict[str, List[Address]], durations: Dict[str, float],
+               failed: Collection[str]) -> Dict[str, List[Address]]:
+    """
+    Orders units, and the tests within every unit, by priority: units containing tests that failed in their last run
+    first, then the fastest units. Tests without a recorded duration are estimated by the mean recorded duration.
+
+    :param units: the units to order, as returned by group()
+    :param durations: the recorded duration of every test by its id
+    :param failed: the ids of the tests that failed in their last run
+    :return: the units in the order they should run
+    """
+    default = _default_duration(durations)
+
+    def priority(addresses: List[Address]) -> Tuple[bool, float]:
+        ids = [test_id(address) for address in addresses]
+        return not any(test in failed for test in ids), sum(durations.get(test, default) for test in ids)
+
+    ordered = {unit_id: sorted(addresses, key=lambda address: priority([address]))
+               for unit_id, addresses in units.items()}
+    return dict(sorted(ordered.items(), key=lambda unit: priority(unit[1])))
+
+
+def balance(units: Dict[str, List[Address]], durations: Dict[str, float], count: int) -> List[List[Address]]:
+    """
+    Distributes units onto shards with similar total durations, using the longest processing time first heuristic.
+    Tests without a recorded duration are estimated by the mean recorded duration. Within a shard, units keep the
+    order they are passed in, e.g. discovery order, so that module level fixtures are set up as rarely as possible.
+
+    :param units: the units to distribute, as returned by group() or prioritize()
+    :param durations: the recorded duration of every test by its id
+    :param count: the number of shards
+    :return: the tests of every non-empty shard
+    """
+    default = _default_duration(durations)
+    costs = {unit_id: sum(durations.get(test_id(address), default) for address in addresses)
+             for unit_id, addresses in units.items()}
+    order = {unit_id: index for index, unit_id in enumerate(units)}
+
+    loads = [(0.0, shard) for shard in range(max(1, count))]
+    assigned = [[] for _ in loads]
+    for unit_id in sorted(units, key=lambda unit: costs[unit], reverse=True):
+        load, shard = heapq.heappop(loads)
+        assigned[shard].append(unit_id)
+        heapq.heappush(loads, (load + costs[unit_id], shard))
+
+    return [[address for unit_id in sorted(unit_ids, key=order.get) for address in units[unit_id]]
+            for unit_ids in assigned if unit_ids]
+
+
+class _ShardResult(unittest.TestResult):
+    """
+    Records the outcomes of a shard as plain, picklable data to be sent back from a worker process.
+    """
+
+    def __init__(self, recorder: impact.FileRecorder = None):
+        super().__init__()
+        self.records = []
+        self.durations = {}
+        self.failed = set()
+        self.touched = {}
+        self._recorder = recorder
+        self._fixture_files = set()
+        self._started = 0.0
+        self.cache_stats = result_cache.CacheStats()
+        self.timings = []
+
+    @property
+    def shouldStop(self) -> bool:
+        return self._should_stop or (_stop_event is not None and _stop_event.is_set())
+
+    @shouldStop.setter
+    def shouldStop(self, value: bool) -> None:
+        self._should_stop = value
+        if value and _stop_event is not None:
+            _stop_event.set()
+
+    def _record(self, event: str, test, details=None) -> None:
+        self.records.append((event, _describe(test), details))
+
+    def outcome(self) -> dict:
+        return {"records": self.records, "durations": self.durations, "failed": self.failed, "touched": self.touched,
+                "cache_stats": self.cache_stats, "timings": self.timings}
+
+    def startTest(self, test) -> None:
+        super().startTest(test)
+        if self._recorder:
+            self._fixture_files = self._recorder.take()
+        self._started = time.perf_counter()
+        self._record("startTest", test)
+
+    def stopTest(self, test) -> None:
+        super().stopTest(test)
+        self.durations[test.id()] = time.perf_counter() - self._started
+        if self._recorder:
+            module_file = getattr(sys.modules.get(type(test).__module__), "__file__", None)
+            self.touched[test.id()] = sorted(self._fixture_files | self._recorder.take() |
+                                             ({os.path.abspath(module_file)} if module_file else set()))
+        self._record("stopTest", test)
+
+    def addSuccess(self, test) -> None:
+        super().addSuccess(test)
+        self._record("addSuccess", test)
+
+    def addFailure(self, test, err) -> None:
+        super().addFailure(test, err)
+        self.failed.add(test.id())
+        self._record("addFailure", test, self.failures[-1][1])
+
+    def addError(self, test, err) -> None:
+        super().addError(test, err)
+        self.failed.add(test.id())
+        self._record("addError", test, self.errors[-1][1])
+
+    def addSkip(self, test, reason) -> None:
+        super().addSkip(test, reason)
+        self._record("addSkip", test, reason)
+
+    def addExpectedFailure(self, test, err) -> None:
+        super().addExpectedFailure(test, err)
+        self._record("addExpectedFailure", test, self.expectedFailures[-1][1])
+
+    def addUnexpectedSuccess(self, test) -> None:
+        super().addUnexpectedSuccess(test)
+        self.failed.add(test.id())
+        self._record("addUnexpectedSuccess", test)
+
+    def addSubTest(self, test, subtest, err) -> None:
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            failed = issubclass(err[0], test.failureException)
+            formatted = (self.failures if failed else self.errors)[-1][1]
+            self.failed.add(test.id())
+            self._record("addSubTest", test, (_describe(subtest), failed, formatted))
+
+
+def _describe(test) -> Tuple[str, str, str]:
+    return test.id(), str(test), test.shortDescription()
+
+
+def _run_tests(tests: List[unittest.TestCase], failfast: bool, record_impact: bool = False,
+               record_timings: bool = False) -> dict:
+    recorder = impact.FileRecorder() if record_impact else None
+    result = _ShardResult(recorder)
+    result.failfast = failfast
+    cache_stats = result_cache.stats()
+    if recorder:
+        recorder.start()
+    try:
+        with timing.collecting() if record_timings else nullcontext([]) as timings:
+            unittest.TestSuite(tests).run(result)
+    finally:
+        if recorder:
+            recorder.stop()
+        # worker processes exit without running atexit handlers, so everything registered there is done per shard;
+        # timings are recorded by the reporting process
+        try:
+            fixtures.teardown_session()
+        except Exception:
+            traceback.print_exc()
+        result_cache.save()
+    result.cache_stats = result_cache.stats() - cache_stats
+    result.timings = timings
+    return result.outcome()
+
+
+def _run_shard(addresses: List[Address], failfast: bool, record_impact: bool = False,
+               record_timings: bool = False) -> dict:
+    return _run_tests([load_test(address) for address in addresses], failfast, record_impact, record_timings)
+
+
+def _initialize_worker(path: List[str], stop_event=None) -> None:
+    global _stop_event
+
+    sys.path[:] = path
+    _stop_event = stop_event
+
+
+class _RemoteTest:
+    """
+    Stands in for a test executed in another process when its outcome is reported.
+    """
+    failureException = AssertionError
+
+    def __init__(self, description: Tuple[str, str, str]):
+        self._id, self._description, self._short_description = description
+
+    def id(self) -> str:
+        return self._id
+
+    def shortDescription(self) -> str:
+        return self._short_description
+
+    def __str__(self):
+        return self._description
+
+
+class _RemoteFailure(AssertionError):
+    pass
+
+
+class _RemoteError(Exception):
+    pass
+
+
+class MergedResult(unittest.TextTestResult):
+    """
+    TextTestResult reporting the outcomes recorded in worker processes, whose tracebacks arrive already formatted.
+    """
+
+    def _exc_info_to_string(self, err, test) -> str:
+        if isinstance(err[1], (_RemoteFailure, _RemoteError)):
+            return str(err[1])
+        return super()._exc_info_to_string(err, test)
+
+    def replay(self, records: list) -> None:
+        for event, description, details in records:
+            test = _RemoteTest(description)
+            if event in ("addFailure", "addExpectedFailure"):
+                getattr(self, event)(test, (_RemoteFailure, _RemoteFailure(details), None))
+            elif event == "addError":
+                self.addError(test, (_RemoteError, _RemoteError(details), None))
+            elif event == "addSkip":
+                self.addSkip(test, details)
+            elif event == "addSubTest":
+                subtest_description, failed, formatted = details
+                error_type = _RemoteFailure if failed else _RemoteError
+                self.addSubTest(test, _RemoteTest(subtest_description), (error_type, error_type(formatted), None))
+            else:
+                getattr(self, event)(test)
+
+
+class _Run:
+    """
+    The callable passed to unittest.TextTestRunner in place of a test suite; it executes all shards and replays their
+    outcomes on the runner's result.
+    """
+
+    def __init__(self, tests: List[unittest.TestCase], workers: int, granularity: str, record_impact: bool = False,
+                 order: str = DISCOVERY):
+        if order not in (DISCOVERY, PRIORITY):
+            raise ValueError(f"Unknown order {order!r}, expected {DISCOVERY!r} or {PRIORITY!r}")
+
+        self.record_impact = record_impact
+        self.touched = {}
+        self.failed = set()
+        self.cache_stats = result_cache.CacheStats()
+        self.local_tests = []
+        addresses = []
+        for test in tests:
+            address = address_of(test)
+            if address is None:
+                self.local_tests.append(test)
+            else:
+                addresses.append(address)
+
+        self.durations = storage.load_json(DURATIONS_FILE, {})
+        self.outcomes = storage.load_json(OUTCOMES_FILE, {})
+        units = group(addresses, granularity)
+        if order == PRIORITY:
+            failed = {test for test, outcome in self.outcomes.items() if outcome == "failed"}
+            units = prioritize(units, self.durations, failed)
+        self.shards = balance(units, self.durations, workers)
+        self.workers = workers
+
+    def __call__(self, result: MergedResult) -> None:
+        if self.local_tests:
+            self._merge(result, _run_tests(self.local_tests, result.failfast, self.record_impact, timing.enabled))
+
+        if self.workers <= 1 or len(self.shards) <= 1:
+            for shard in self.shards:
+                if result.shouldStop:
+                    break
+                self._merge(result, _run_shard(shard, result.failfast, self.record_impact, timing.enabled))
+        else:
+            context = multiprocessing.get_context()
+            stop_event = context.Event() if result.failfast else None
+            executor = ProcessPoolExecutor(len(self.shards), mp_context=context, initializer=_initialize_worker,
+                                           initargs=(list(sys.path), stop_event))
+            try:
+                futures = [executor.submit(_run_shard, shard, result.failfast, self.record_impact, timing.enabled)
+                           for shard in self.shards]
+                for future in as_completed(futures):
+                    if result.shouldStop:
+                        break
+                    self._merge(result, future.result())
+            finally:
+                # running workers see the event after their current test instead of completing their shards
+                if stop_event is not None:
+                    stop_event.set()
+                executor.shutdown(wait=not result.shouldStop, cancel_futures=True)
+
+        storage.save_json(DURATIONS_FILE, self.durations)
+        storage.save_json(OUTCOMES_FILE, self.outcomes)
+        if self.record_impact:
+            impact.update_index(self.touched, self.failed)
+
+        # the statistics of all workers are reported here instead of by every process at exit
+        result_cache.report_at_exit = False
+        if any(self.cache_stats[:3]):
+            result.stream.writeln(f"\n{self.cache_stats}")
+
+    def _merge(self, result: MergedResult, outcome: dict) -> None:
+        result.replay(outcome["records"])
+        self.durations.update(outcome["durations"])
+        self.outcomes.update((test, "failed" if test in outcome["failed"] else "passed")
+                             for test in outcome["durations"])
+        self.touched.update(outcome["touched"])
+        self.failed.update(outcome["failed"])
+        self.cache_stats += outcome["cache_stats"]
+        for recorded in outcome["timings"]:
+            timing.record(*recorded)
+
+
+def run(tests: List[unittest.TestCase], workers: int = None, granularity: str = CLASS, failfast: bool = False,
+        verbosity: int = 1, stream=None, record_impact: bool = False, order: str = DISCOVERY) -> unittest.TestResult:
+    """
+    Runs tests on a process pool and reports their outcomes like unittest.TextTestRunner.
+
+    :param tests: the tests to run, e.g. from discover()
+    :param workers: the number of worker processes, defaults to the number of CPUs; 1 runs all tests in this process
+    :param granularity: ``"class"`` to keep the tests of a class in one process, ``"method"`` to distribute single
+    test methods (setUpClass() then runs in every process executing a test of the class)
+    :param failfast: stop after the first failure or error; the other workers stop after the test they are running
+    and the outcomes of shards not completed yet are not reported
+    :param verbosity: the verbosity of the report, as for unittest.TextTestRunner
+    :param stream: the stream to write the report to, defaults to sys.stderr
+    :param record_impact: record the files every test touches in the impact index (see unittest_specs.impact)
+    :param order: ``"discovery"`` to run tests in the order they were discovered, ``"priority"`` to run tests that
+    failed in their last run first and the fastest tests after them (see prioritize()); combined with failfast, this
+    reports a red build as early as possible
+    :return: the merged result of all tests
+    """
+    runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity, failfast=failfast, resultclass=MergedResult)
+    return runner.run(_Run(tests, workers or os.cpu_count() or 1, granularity, record_impact, order))
+
+
+def select_impacted(tests: List[unittest.TestCase]) -> List[unittest.TestCase]:
+    """
+    Selects the tests affected by changes since the impact index was recorded, see unittest_specs.impact.select().
+    """
+    return [test for test, affected in zip(tests, impact.select([test.id() for test in tests])) if affected]
+
+
+def discover(names: List[str] = None, start_dir: str = ".", pattern: str = "test*.py",
+             top_level_dir: str = None) -> List[unittest.TestCase]:
+    """
+    Loads tests by name (modules, classes or methods) or, without names, discovers them like
+    ``python -m unittest discover``.
+    """
+    loader = unittest.TestLoader()
+    if names:
+        suite = loader.loadTestsFromNames(names)
+    else:
+        suite = loader.discover(start_dir, pattern, top_level_dir)
+    return list(iterate_tests(suite))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m unittest_specs",
+                                     description="Runs specs in parallel on a process pool.")
+    parser.add_argument("names", nargs="*", help="test modules, classes or methods to run instead of discovering")
+    parser.add_argument("-s", "--start-directory", default=".", help="directory to start discovery at")
+    parser.add_argument("-p", "--pattern", default="test*.py", help="pattern matching test files")
+    parser.add_argument("-t", "--top-level-directory", default=None, help="top level directory of the project")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--granularity", choices=(CLASS, METHOD), default=CLASS,
+                        help="distribute whole test classes or single test methods")
+    parser.add_argument("-f", "--failfast", action="store_true", help="stop on the first failure or error")
+    parser.add_argument("--order", choices=(DISCOVERY, PRIORITY), default=DISCOVERY,
+                        help="run tests in discovery order or those that failed last time first, then the fastest")
+    parser.add_argument("--impact", action="store_true",
+                        help="only run tests affected by files changed since the last --impact run, recording the "
+                             "files every test touches")
+    parser.add_argument("-v", "--verbose", dest="verbosity", action="store_const", const=2, default=1)
+    parser.add_argument("-q", "--quiet", dest="verbosity", action="store_const", const=0)
+    arguments = parser.parse_args(argv)
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    tests = discover(arguments.names, arguments.start_directory, arguments.pattern, arguments.top_level_directory)
+    if arguments.impact:
+        selected = select_impacted(tests)
+        sys.stderr.write(f"Running {len(selected)} of {len(tests)} tests affected by changes\n")
+        tests = selected
+
+    result = run(tests, arguments.workers, arguments.granularity, arguments.failfast, arguments.verbosity,
+                 record_impact=arguments.impact, order=arguments.order)
+    return 0 if result.wasSuccessful() else 1
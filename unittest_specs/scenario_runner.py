@@ -0,0 +1,184 @@
+"""
+Executes the scenarios of a test class concurrently, either on a thread pool or as tasks on an event loop. Every
+scenario still runs its steps in order (setup, run, assertion, teardown); scenarios marked as serial are executed one
+after another once all concurrent scenarios are done.
+"""
+import asyncio
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type
+
+from unittest_specs import async_support
+
+THREADS = "threads"
+ASYNCIO = "asyncio"
+
+
+class _RecordingResult(unittest.TestResult):
+    """
+    Records the events of a single test, so that they can be replayed on a shared result object from one thread.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    @property
+    def failed(self) -> bool:
+        return any(name in ("addFailure", "addError") or (name == "addSubTest" and args[2] is not None)
+                   for name, args in self.events)
+
+    def replay(self, result: unittest.TestResult) -> None:
+        for name, args in self.events:
+            getattr(result, name)(*args)
+
+
+def _recorder(event: str):
+    def record(self, *args):
+        self.events.append((event, args))
+
+    return record
+
+
+for _event in ("startTest", "stopTest", "addSuccess", "addFailure", "addError", "addSkip", "addExpectedFailure",
+               "addUnexpectedSuccess", "addSubTest"):
+    setattr(_RecordingResult, _event, _recorder(_event))
+
+
+def _partition(test_class: Type[unittest.TestCase]):
+    concurrent, serial = [], []
+    for name in unittest.TestLoader().getTestCaseNames(test_class):
+        (serial if getattr(getattr(test_class, name), "serial", False) else concurrent).append(name)
+    return concurrent, serial
+
+
+def _run_in_thread(test_class, name: str) -> _RecordingResult:
+    recording = _RecordingResult()
+    test_class(name).run(recording)
+    return recording
+
+
+def _run_until_stopped(test_class, name: str, stop: threading.Event, failfast: bool):
+    if stop.is_set():
+        return None
+    recording = _run_in_thread(test_class, name)
+    if failfast and recording.failed:
+        # stop other workers before they pick up another scenario, not only once the main thread replays the failure
+        stop.set()
+    return recording
+
+
+def _run_threads(test_class, names, workers: int, result: unittest.TestResult) -> None:
+    stop = threading.Event()
+    failfast = getattr(result, "failfast", False)
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    previous_loop = async_support.set_event_loop(test_class, loop)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_until_stopped, test_class, name, stop, failfast) for name in names]
+            for future in futures:
+                recording = future.result()
+                if recording is None:
+                    break
+                recording.replay(result)
+                if result.shouldStop or stop.is_set():
+                    # scenarios not started yet are dropped, running ones are still waited for
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        async_support.close_event_loop(test_class)
+        if previous_loop is not None:
+            async_support.set_event_loop(test_class, previous_loop)
+
+
+async def _run_in_task(test_class, name: str) -> _RecordingResult:
+    test_function = getattr(test_class, name)
+    if not hasattr(test_function, "run_async"):
+        return await asyncio.get_running_loop().run_in_executor(None, _run_in_thread, test_class, name)
+
+    test_case = test_class(name)
+    recording = _RecordingResult()
+    recording.startTest(test_case)
+    try:
+        await test_function.run_async(test_case)
+    except unittest.SkipTest as skip:
+        recording.addSkip(test_case, str(skip))
+    except test_case.failureException:
+        recording.addFailure(test_case, sys.exc_info())
+    except Exception:
+        recording.addError(test_case, sys.exc_info())
+    else:
+        recording.addSuccess(test_case)
+    finally:
+        recording.stopTest(test_case)
+    return recording
+
+
+async def _run_task(test_class, name: str, semaphore: asyncio.Semaphore, stop: threading.Event, failfast: bool):
+    async with semaphore:
+        if stop.is_set():
+            return None
+        recording = await _run_in_task(test_class, name)
+        if failfast and recording.failed:
+            # set before releasing the semaphore, so that no waiting scenario starts after the failure
+            stop.set()
+        return recording
+
+
+def _run_tasks(test_class, names, workers: int, result: unittest.TestResult) -> None:
+    stop = threading.Event()
+    failfast = getattr(result, "failfast", False)
+
+    async def run_all():
+        semaphore = asyncio.Semaphore(workers)
+        return await asyncio.gather(*(_run_task(test_class, name, semaphore, stop, failfast) for name in names))
+
+    for recording in async_support.event_loop(test_class).run_until_complete(run_all()):
+        if recording is None:
+            break
+        recording.replay(result)
+        if result.shouldStop:
+            break
+
+
+def run_scenarios(test_class: Type[unittest.TestCase], workers: int = 4, mode: str = THREADS,
+                  result: unittest.TestResult = None) -> unittest.TestResult:
+    """
+    Runs all tests of a test class, e.g. the TestSuite generated by scenario(), with independent scenarios being
+    executed concurrently.
+
+    :param test_class: the test class to run
+    :param workers: the maximum number of scenarios executed at the same time
+    :param mode: ``"threads"`` to run scenarios on a thread pool, ``"asyncio"`` to run them as tasks on the event loop
+    of the test class; in the latter mode, async steps run concurrently and assertions are moved to threads, while
+    blocking synchronous steps hold up the loop and are better run in thread mode
+    :param result: the unittest.TestResult to report to; a new one is created if omitted
+    :return: the result containing the outcome of all tests
+    """
+    if mode not in (THREADS, ASYNCIO):
+        raise ValueError(f"Unknown mode {mode!r}, expected {THREADS!r} or {ASYNCIO!r}")
+
+    result = result if result is not None else unittest.TestResult()
+    concurrent, serial = _partition(test_class)
+
+    test_class.setUpClass()
+    try:
+        if concurrent:
+            (_run_threads if mode == THREADS else _run_tasks)(test_class, concurrent, workers, result)
+
+        for name in serial:
+            if result.shouldStop:
+                break
+            test_class(name).run(result)
+    finally:
+        test_class.tearDownClass()
+
+    return result
@@ -1,8 +1,40 @@
+import re
+import sys
 import unittest
-from typing import Any
+from collections import deque
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable
+
+from unittest_specs import arrays, assertions, async_support, parameters, timing
 
 
 class SimpleFlatSpec(unittest.TestCase):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, member in list(vars(cls).items()):
+            deterministic = getattr(member, "_deterministic", False) is True
+            if hasattr(member, "_expanded_rows"):
+                delattr(cls, name)
+                for method_name, method in _row_methods(name, member._expanded_function, member._expanded_rows(),
+                                                         vars(cls)):
+                    setattr(cls, method_name, _cached(method) if deterministic else method)
+            elif iscoroutinefunction(member) and (name.startswith("test") or name in ("setUp", "tearDown")):
+                setattr(cls, name, _cached(_on_event_loop(member)) if deterministic else _on_event_loop(member))
+            elif deterministic:
+                setattr(cls, name, _cached(member))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        async_support.close_event_loop(cls)
+        super().tearDownClass()
+
+    def run(self, result=None):
+        if not timing.enabled:
+            return super().run(result)
+        return timing.measure("test", self.id(), super().run, result)
+
     @staticmethod
     def expect(actual_value: Any):
         """
@@ -11,32 +43,100 @@ class SimpleFlatSpec(unittest.TestCase):
         :param actual_value: the value computed by the SUT to be compared against an expectation
         :return: an Asserter to perform an assertion on
         """
-        return Asserter(actual_value)
+        return _SoftAsserter(actual_value) if assertions.within_softly() else Asserter(actual_value)
+
+    @staticmethod
+    def softly():
+        """
+        Context manager collecting the failures of all expectations created within its block and reporting them
+        together at its end, while outside of it the first failing expectation ends the test:
+
+        ``with self.softly():``
+        """
+        return assertions.softly()
 
     @staticmethod
-    def parameterize(params):
+    def parameterize(params, workers: int = None, limit: int = None, sample: int = None, seed=0, shard=None,
+                     expand: bool = False, max_seconds: float = None):
         """
         Injects provided test data sets into the decorated function with every data set being provided as a set of
         parameters. For each set, a separate sub-test is performed using unittest's subTest.
 
-        :param params: a list of tuples containing the test data
+        Data sets are streamed, so params can be any iterable, e.g. a generator or one of the sources in
+        unittest_specs.parameters. Single-use iterables like generators are exhausted after one run; pass a factory
+        (a function returning the iterable) to create them anew for every run.
+
+        Passing a strategy from unittest_specs.strategies as params generates data sets instead, until one fails or
+        the budget given by limit (default strategies.DEFAULT_EXAMPLES) and max_seconds is spent. The failing data
+        set is shrunk to a minimal one, reported as sub-test and replayed first on the next runs until it passes.
+
+        :param params: a list of tuples containing the test data, any other iterable, a factory returning one or a
+        strategy generating data sets
+        :param workers: if set, the data sets are executed concurrently on a thread pool of this size (or as tasks on
+        the event loop of the test class for async functions), which pays off for I/O bound tests; results are still
+        reported per data set and in the order of params
+        :param limit: only run the first ``limit`` data sets, or generate at most this many data sets with a strategy
+        :param sample: only run a random sample of this many data sets, reproducible for the same seed
+        :param seed: the seed used for sample and for strategies; None draws a new seed for every run
+        :param shard: only run every n-th data set, given as ``(index, count)`` or ``"index/count"``, e.g. to split
+        huge data sets across CI workers
+        :param expand: instead of sub-tests, generate a separate test method per data set when the decorated function
+        is defined in a SimpleFlatSpec subclass; method names are derived from the parameters, e.g.
+        ``test_length_hello_5``, so single data sets can be selected, rerun and distributed by test runners
+        :param max_seconds: stop generating data sets with a strategy after this many seconds
         """
+        generated = _is_strategy(params)
+        if generated and (workers or sample is not None or shard is not None or expand):
+            raise ValueError("workers, sample, shard and expand cannot be combined with a strategy")
+
+        def selected_rows():
+            rows = parameters.iterate(params)
+            if limit is not None or sample is not None or shard is not None:
+                rows = parameters.select(rows, limit=limit, sample=sample, seed=seed, shard=shard)
+            return rows
 
         def decorator_function(function):
+            if generated:
+                def parameter_handler(self):
+                    _run_property(self, function, params, limit, max_seconds, seed)
+
+                if getattr(function, "_deterministic", False):
+                    parameter_handler._deterministic = True
+                return parameter_handler
+
             def parameter_handler(self):
-                for param in params:
-                    if isinstance(param, tuple):
-                        test_params = [_p for _p in param]
-                    else:
-                        test_params = [param]
+                rows = selected_rows()
+
+                if workers and iscoroutinefunction(function):
+                    return async_support.resolve(_gather_rows(self, function, rows, workers), type(self))
+                if workers:
+                    return _run_concurrently(self, function, rows, workers)
+
+                for param in rows:
+                    test_params = _as_parameters(param)
 
                     with self.subTest(i=test_params[0]):
-                        function(self, *test_params)
+                        _run_row(self, function, test_params)
+
+            if getattr(function, "_deterministic", False):
+                parameter_handler._deterministic = True
+            if expand:
+                parameter_handler._expanded_function = function
+                parameter_handler._expanded_rows = selected_rows
 
             return parameter_handler
 
         return decorator_function
 
+    @staticmethod
+    def deterministic(function):
+        """
+        Marks a test whose outcome only depends on its code and parameters, caching its result (see
+        unittest_specs.result_cache). Works with parameterize() on either side.
+        """
+        function._deterministic = True
+        return function
+
     @staticmethod
     def intercept(expected_exception):
         """
@@ -48,9 +148,7 @@ class SimpleFlatSpec(unittest.TestCase):
 
         def decorator_function(function):
             def nested_execution_handler(self, *args, **kwargs):
-                interceptor = unittest.TestCase()
-
-                with interceptor.assertRaises(expected_exception=expected_exception):
+                with assertions.raises(expected_exception):
                     function(self, *args, **kwargs)
 
             return nested_execution_handler
@@ -58,59 +156,314 @@ class SimpleFlatSpec(unittest.TestCase):
         return decorator_function
 
 
-class Asserter(unittest.TestCase):
+def _as_parameters(param) -> tuple:
+    return param if isinstance(param, tuple) else (param,)
+
+
+def _stable_repr(value) -> str:
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(map(_stable_repr, value))) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(map(_stable_repr, value)) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_stable_repr(key)}: {_stable_repr(item)}" for key, item in value.items()) + "}"
+
+    representation = repr(value)
+    return type(value).__name__ if " at 0x" in representation else representation
+
+
+def row_method_name(function_name: str, test_params: tuple, max_length: int = 60) -> str:
+    """
+    Derives a deterministic test method name from a data set, e.g. ``test_length_hello_5`` for the parameters
+    ``("hello", 5)``. Names exceeding max_length are shortened and suffixed with a hash of all parameters.
+
+    :param function_name: name of the parameterized test function
+    :param test_params: the parameters of the data set
+    :param max_length: maximum length of the parameter part of the name
+    :return: the method name
+    """
+    representation = _stable_repr(test_params)
+    slug = re.sub(r"\W+", "_", representation[1:-1]).strip("_")
+
+    if len(slug) > max_length:
+        import hashlib
+
+        digest = hashlib.sha1(representation.encode("utf-8")).hexdigest()[:8]
+        slug = f"{slug[:max_length].rstrip('_')}_{digest}"
+
+    return f"{function_name}_{slug}" if slug else function_name
+
+
+def _row_methods(function_name: str, function, rows, taken=()):
+    names = set()
+
+    for param in rows:
+        test_params = _as_parameters(param)
+        method_name = base_name = row_method_name(function_name, test_params)
+
+        suffix = len(names)
+        while method_name in names or method_name in taken:
+            method_name = f"{base_name}_{suffix}"
+            suffix += 1
+        names.add(method_name)
+
+        def row_test(self, _test_params=test_params):
+            return async_support.resolve(function(self, *_test_params), type(self))
+
+        row_test.__name__ = method_name
+        row_test.__qualname__ = function.__qualname__.replace(function.__name__, method_name)
+        row_test.__doc__ = function.__doc__
+        yield method_name, row_test
+
+
+def _row_name(test_case: unittest.TestCase, test_params: tuple) -> str:
+    return f"{test_case.id()}[{test_params[0]!r}]"
+
+
+def _run_row(test_case: unittest.TestCase, function, test_params: tuple):
+    if not timing.enabled:
+        return async_support.resolve(function(test_case, *test_params), type(test_case))
+
+    return timing.measure("row", _row_name(test_case, test_params),
+                          lambda: async_support.resolve(function(test_case, *test_params), type(test_case)))
+
+
+async def _run_row_async(test_case: unittest.TestCase, function, test_params: tuple):
+    if not timing.enabled:
+        return await function(test_case, *test_params)
+
+    return await timing.measure_async("row", _row_name(test_case, test_params), function(test_case, *test_params))
+
+
+def _is_strategy(params) -> bool:
+    # strategies are only instantiated after importing their module, which is therefore not imported for the check
+    strategies = sys.modules.get("unittest_specs.strategies")
+    return strategies is not None and isinstance(params, strategies.Strategy)
+
+
+def _run_property(test_case: unittest.TestCase, function, strategy: "strategies.Strategy", examples: int,
+                  max_seconds: float, seed) -> None:
+    from unittest_specs import strategies
+
+    def run_example(value):
+        return async_support.resolve(function(test_case, *_as_parameters(value)), type(test_case))
+
+    falsified = strategies.find_failure(run_example, strategy, examples, max_seconds, seed, key=test_case.id())
+    if falsified is None:
+        return
+
+    example = f"{function.__name__}({', '.join(map(repr, _as_parameters(falsified.value)))})"
+    with test_case.subTest(example=example):
+        run_example(falsified.value)
+        assertions.fail(f"Example {example} passed when replayed, although it failed before with "
+                        f"{type(falsified.error).__name__}: {falsified.error}")
+
+
+def _run_concurrently(test_case: unittest.TestCase, function, rows, workers: int) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = deque()
+
+    def report_oldest():
+        test_params, result = pending.popleft()
+        with test_case.subTest(i=test_params[0]):
+            result.result()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for test_params in map(_as_parameters, rows):
+            pending.append((test_params, executor.submit(_run_row, test_case, function, test_params)))
+            if len(pending) >= 4 * workers:
+                report_oldest()
+
+        while pending:
+            report_oldest()
+
+
+async def _gather_rows(test_case: unittest.TestCase, function, rows, workers: int) -> None:
+    import asyncio
+
+    pending = deque()
+
+    async def report_oldest():
+        test_params, task = pending.popleft()
+        with test_case.subTest(i=test_params[0]):
+            await task
+
+    try:
+        for test_params in map(_as_parameters, rows):
+            pending.append((test_params, asyncio.ensure_future(_run_row_async(test_case, function, test_params))))
+            if len(pending) >= workers:
+                await report_oldest()
+
+        while pending:
+            await report_oldest()
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def _cached(function):
+    from unittest_specs import result_cache
+
+    return result_cache.cached(function)
+
+
+def _on_event_loop(function):
+    @wraps(function)
+    def run_on_event_loop(self, *args, **kwargs):
+        return async_support.resolve(function(self, *args, **kwargs), type(self))
+
+    return run_on_event_loop
+
+
+class _clause:
+    """
+    Decorates an assertion of Asserter, adding it to the class under its and_* clause name as well.
+    """
+    __slots__ = ("assertion",)
+
+    def __init__(self, assertion: Callable):
+        self.assertion = assertion
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        setattr(owner, name, self.assertion)
+        setattr(owner, assertions.clause_name(name), self.assertion)
+
+
+class Asserter:
+    """
+    Offers the assertions available after expect(). Every assertion returns the Asserter, so that further assertions
+    on the same value can be chained with and_* clauses, e.g.
+
+    ``self.expect(ids).to_be_a_list().and_of_length(3).and_contain_all([1, 2])``
+    """
+    __slots__ = ("_actual_value",)
+
     def __init__(self, actual_value: Any):
-        super().__init__()
         self._actual_value = actual_value
 
+    @_clause
     def to_be(self, expected_value):
-        self.assertEqual(self._actual_value, expected_value)
+        assertions.assert_equal(self._actual_value, expected_value)
+        return self
 
+    @_clause
     def to_not_be(self, expected_value):
-        self.assertNotEqual(self._actual_value, expected_value)
+        assertions.assert_not_equal(self._actual_value, expected_value)
+        return self
 
+    @_clause
     def to_be_of_type(self, expected_type):
-        self.assertIsInstance(self._actual_value, expected_type)
+        assertions.assert_is_instance(self._actual_value, expected_type)
+        return self
 
+    @_clause
     def to_equal_list(self, expected_list):
-        self.assertListEqual(self._actual_value, expected_list)
+        assertions.assert_list_equal(self._actual_value, expected_list)
+        return self
 
+    @_clause
     def to_contain(self, expected_element):
-        self.assertTrue(expected_element in self._actual_value)
+        assertions.assert_true(expected_element in self._actual_value)
+        return self
 
+    @_clause
     def to_contain_all(self, expected_elements):
-        is_contained = True
-        for element in expected_elements:
-            if element not in self._actual_value:
-                is_contained = False
-                break
-        self.assertTrue(is_contained)
+        assertions.assert_contains_all(self._actual_value, expected_elements)
+        return self
+
+    @_clause
+    def to_contain_any(self, expected_elements):
+        assertions.assert_contains_any(self._actual_value, expected_elements)
+        return self
+
+    @_clause
+    def to_contain_exactly(self, expected_elements):
+        assertions.assert_contains_exactly(self._actual_value, expected_elements)
+        return self
 
+    @_clause
     def to_be_true(self):
-        self.assertTrue(self._actual_value)
+        assertions.assert_true(self._actual_value)
+        return self
 
+    @_clause
     def to_be_false(self):
-        self.assertFalse(self._actual_value)
+        assertions.assert_false(self._actual_value)
+        return self
 
+    @_clause
     def to_be_none(self):
-        self.assertIsNone(self._actual_value)
+        assertions.assert_is_none(self._actual_value)
+        return self
 
+    @_clause
     def to_not_be_none(self):
-        self.assertIsNotNone(self._actual_value)
+        assertions.assert_is_not_none(self._actual_value)
+        return self
 
+    @_clause
     def to_be_a_list(self):
-        self.to_be_of_type(list)
+        return self.to_be_of_type(list)
 
+    @_clause
     def to_be_a_dict(self):
-        self.to_be_of_type(dict)
+        return self.to_be_of_type(dict)
 
+    @_clause
     def to_be_a_set(self):
-        self.to_be_of_type(set)
+        return self.to_be_of_type(set)
 
+    @_clause
     def to_raise(self, expected_exception, *args, **kwargs):
-        with self.assertRaises(expected_exception=expected_exception):
+        with assertions.raises(expected_exception):
             self._actual_value(*args, **kwargs)
+        return self
 
+    @_clause
+    def to_complete_within(self, seconds: float, rounds: int = 7, warmup: int = 1):
+        """
+        Asserts that the median run time of the actual value, a callable without arguments, does not exceed seconds.
+        """
+        from unittest_specs import performance
+
+        performance.assert_completes_within(self._actual_value, seconds, rounds, warmup)
+        return self
+
+    @_clause
+    def to_run_faster_than(self, other_callable, factor: float = 1.0, rounds: int = 7, warmup: int = 1):
+        """
+        Asserts that the actual value, a callable without arguments, is at least factor times faster than
+        other_callable, comparing the medians of interleaved rounds.
+        """
+        from unittest_specs import performance
+
+        performance.assert_faster_than(self._actual_value, other_callable, factor, rounds, warmup)
+        return self
+
+    @_clause
+    def to_allocate_less_than(self, max_bytes: int, rounds: int = 5, warmup: int = 1):
+        """
+        Asserts that a call of the actual value, a callable without arguments, allocates less than max_bytes at its
+        peak (median of several calls, measured with tracemalloc).
+        """
+        from unittest_specs import performance
+
+        performance.assert_allocates_less_than(self._actual_value, max_bytes, rounds, warmup)
+        return self
+
+    @_clause
+    def to_scale_at_most(self, complexity, inputs, tolerance: float = 2.0, rounds: int = 5, warmup: int = 1):
+        """
+        Asserts that the run time of the actual value, a callable taking one input, grows no faster than complexity
+        (e.g. performance.O_n_log_n) over the given inputs.
+        """
+        from unittest_specs import performance
+
+        performance.assert_scales_at_most(self._actual_value, complexity, inputs, tolerance, rounds, warmup)
+        return self
+
+    @_clause
     def to_be_of_length(self, expected_length: int):
         """
         Asserts whether the previously provided value's length matches expected_length. The length is determined by
@@ -118,4 +471,54 @@ class Asserter(unittest.TestCase):
         
         :param expected_length: the expected value of len(actual_value)
         """
-        self.assertEqual(len(self._actual_value), expected_length)
+        assertions.assert_equal(len(self._actual_value), expected_length)
+        return self
+
+    @_clause
+    def to_be_close_to(self, expected, rtol: float = 1e-07, atol: float = 0.0):
+        """
+        Asserts that all elements of a numeric array (or a single number) are within the tolerances of the expected
+        ones: ``abs(actual - expected) <= atol + rtol * abs(expected)``. Uses NumPy if it is installed.
+        """
+        arrays.assert_close_to(self._actual_value, expected, rtol, atol)
+        return self
+
+    @_clause
+    def to_all_satisfy(self, predicate):
+        """
+        Asserts that all elements of an array satisfy predicate; with NumPy, vectorized predicates like
+        ``lambda x: x >= 0`` are applied to the whole array at once.
+        """
+        arrays.assert_all_satisfy(self._actual_value, predicate)
+        return self
+
+    @_clause
+    def to_have_shape(self, expected_shape):
+        """
+        Asserts the shape of an array or of nested sequences, e.g. ``(2, 3)`` or ``10`` for one dimension.
+        """
+        arrays.assert_shape(self._actual_value, expected_shape)
+        return self
+
+
+class _SoftAsserter(Asserter):
+    """
+    The Asserter created within softly() blocks; failing assertions are recorded instead of ending the chain.
+    """
+    __slots__ = ()
+
+    def __getattribute__(self, name: str):
+        attribute = super().__getattribute__(name)
+        if not name.startswith(("to_", "and_")):
+            return attribute
+
+        @wraps(attribute)
+        def soft_assertion(*args, **kwargs):
+            try:
+                attribute(*args, **kwargs)
+            except AssertionError as failure:
+                if not assertions.record_soft_failure(failure):
+                    raise
+            return self
+
+        return soft_assertion
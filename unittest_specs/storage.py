@@ -0,0 +1,49 @@
+"""
+Local, on-disk state of unittest_specs like benchmark history or recorded test durations. Everything is stored as
+JSON files in the directory ``.unittest_specs`` of the working directory, or in the directory given by the
+environment variable ``UNITTEST_SPECS_HOME``.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+def state_directory() -> Path:
+    return Path(os.environ.get("UNITTEST_SPECS_HOME", ".unittest_specs"))
+
+
+def load_json(name: str, default=None):
+    """
+    Loads a JSON file from the state directory.
+
+    :param name: file name within the state directory
+    :param default: returned if the file does not exist or cannot be parsed
+    :return: the loaded data
+    """
+    try:
+        with open(state_directory() / name, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(name: str, data) -> None:
+    """
+    Saves data as JSON file in the state directory. The file is replaced atomically, so that concurrent readers
+    never see partially written files.
+
+    :param name: file name within the state directory
+    :param data: JSON serializable data
+    """
+    directory = state_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1, sort_keys=True)
+        os.replace(temporary_path, directory / name)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
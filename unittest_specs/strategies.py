@@ -0,0 +1,506 @@
+"""
+Strategies generating data sets for SimpleFlatSpec.parameterize(), e.g.
+``@SimpleFlatSpec.parameterize(tuples(integers(0, 100), text()), limit=1000)``.
+
+Generated examples are streamed into the test until the example or time budget is spent. The first failing example is
+shrunk to a minimal one by repeatedly trying simpler candidates that fail with the same exception type, and stored in
+``.unittest_specs/examples.json``, so that it is replayed before any new example on the next run.
+
+Every strategy generates a raw value made of ints, strings, booleans, None, lists and tuples, which is shrunk and
+stored, and turns it into the actual value passed to the test; map() and builds() only change the latter, so that
+their results can be shrunk and replayed as well.
+"""
+import abc
+import ast
+import random
+import string
+import time
+import unittest
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from unittest_specs import storage
+
+EXAMPLES_FILE = "examples.json"
+DEFAULT_EXAMPLES = 100
+MAX_SHRINKS = 1000
+MAX_STORED_EXAMPLES = 10
+MAX_FILTER_ATTEMPTS = 100
+
+DEFAULT_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " \t\n\x00éß中\U0001f600"
+
+_EDGE_PROBABILITY = 0.2
+
+
+class Unsatisfiable(Exception):
+    """
+    Raised when a filtered strategy does not find a value satisfying its predicate.
+    """
+
+
+class Strategy(abc.ABC):
+    """
+    Base class of all strategies.
+    """
+
+    @abc.abstractmethod
+    def generate(self, generator: random.Random):
+        """
+        Draws a random raw value.
+        """
+
+    def shrink(self, raw) -> Iterator:
+        """
+        Yields simpler raw values than the given one, the simplest first.
+        """
+        return iter(())
+
+    def value(self, raw):
+        """
+        Turns a raw value into the value passed to the test.
+        """
+        return raw
+
+    def example(self, seed=0):
+        """
+        Generates a single value, e.g. to try out a strategy.
+        """
+        return self.value(self.generate(random.Random(seed)))
+
+    def map(self, function: Callable) -> "Strategy":
+        return _Mapped(self, function)
+
+    def filter(self, predicate: Callable) -> "Strategy":
+        return _Filtered(self, predicate)
+
+
+class _Integers(Strategy):
+    def __init__(self, min_value: int = None, max_value: int = None):
+        if min_value is not None and max_value is not None and min_value > max_value:
+            raise ValueError(f"min_value {min_value} is greater than max_value {max_value}")
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def _contains(self, value: int) -> bool:
+        return ((self.min_value is None or value >= self.min_value)
+                and (self.max_value is None or value <= self.max_value))
+
+    def generate(self, generator: random.Random) -> int:
+        if generator.random() < _EDGE_PROBABILITY:
+            edges = [edge for edge in (0, 1, -1, self.min_value, self.max_value)
+                     if edge is not None and self._contains(edge)]
+            if edges:
+                return generator.choice(edges)
+
+        magnitude = 2 ** generator.choice((4, 8, 16, 32, 64))
+        if self.min_value is None and self.max_value is None:
+            return generator.randint(-magnitude, magnitude)
+        if self.max_value is None:
+            return generator.randint(self.min_value, self.min_value + magnitude)
+        if self.min_value is None:
+            return generator.randint(self.max_value - magnitude, self.max_value)
+        return generator.randint(self.min_value, self.max_value)
+
+    def shrink(self, raw: int) -> Iterator[int]:
+        if self._contains(0):
+            target = 0
+        else:
+            target = self.min_value if self.min_value is not None and self.min_value > 0 else self.max_value
+        if raw == target:
+            return
+        yield target
+        if raw < 0 and self._contains(-raw):
+            yield -raw
+        step = int((raw - target) / 2)
+        while step:
+            yield raw - step
+            step = int(step / 2)
+
+
+class _Booleans(Strategy):
+    def generate(self, generator: random.Random) -> bool:
+        return generator.random() < 0.5
+
+    def shrink(self, raw: bool) -> Iterator[bool]:
+        if raw:
+            yield False
+
+
+class _Just(Strategy):
+    def __init__(self, value):
+        self.constant = value
+
+    def generate(self, generator: random.Random) -> None:
+        return None
+
+    def value(self, raw):
+        return self.constant
+
+
+class _SampledFrom(Strategy):
+    def __init__(self, values: Sequence):
+        if not values:
+            raise ValueError("Cannot sample from an empty sequence")
+        self.values = list(values)
+
+    def generate(self, generator: random.Random) -> int:
+        return generator.randrange(len(self.values))
+
+    def shrink(self, raw: int) -> Iterator[int]:
+        yield from sorted({0, raw // 2, raw - 1} - {raw}) if raw > 0 else ()
+
+    def value(self, raw: int):
+        return self.values[raw]
+
+
+def _size(generator: random.Random, min_size: int, max_size: int) -> int:
+    # the smaller of two draws favours short collections, which fail and shrink faster
+    return min(generator.randint(min_size, max_size), generator.randint(min_size, max_size))
+
+
+def _shorter(raw: Sequence, min_size: int) -> Iterator[Sequence]:
+    if len(raw) <= min_size:
+        return
+    yield raw[:min_size]
+    if len(raw) // 2 > min_size:
+        yield raw[:len(raw) // 2]
+        yield raw[len(raw) - len(raw) // 2:]
+    for index in range(len(raw)):
+        yield raw[:index] + raw[index + 1:]
+
+
+class _Text(Strategy):
+    def __init__(self, alphabet: str = None, min_size: int = 0, max_size: int = 20):
+        self.alphabet = alphabet or DEFAULT_ALPHABET
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def generate(self, generator: random.Random) -> str:
+        return "".join(generator.choice(self.alphabet) for _ in range(_size(generator, self.min_size, self.max_size)))
+
+    def shrink(self, raw: str) -> Iterator[str]:
+        yield from _shorter(raw, self.min_size)
+        simplest = self.alphabet[0]
+        for index, character in enumerate(raw):
+            if character != simplest:
+                yield raw[:index] + simplest + raw[index + 1:]
+
+
+class _Lists(Strategy):
+    def __init__(self, elements: Strategy, min_size: int = 0, max_size: int = 10):
+        self.elements = elements
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def generate(self, generator: random.Random) -> list:
+        return [self.elements.generate(generator) for _ in range(_size(generator, self.min_size, self.max_size))]
+
+    def shrink(self, raw: list) -> Iterator[list]:
+        yield from _shorter(raw, self.min_size)
+        for index, element in enumerate(raw):
+            for candidate in self.elements.shrink(element):
+                yield raw[:index] + [candidate] + raw[index + 1:]
+
+    def value(self, raw: list) -> list:
+        return [self.elements.value(element) for element in raw]
+
+
+class _Dicts(Strategy):
+    def __init__(self, keys: Strategy, values: Strategy, min_size: int = 0, max_size: int = 10):
+        self.keys = keys
+        self.values = values
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def generate(self, generator: random.Random) -> list:
+        size = _size(generator, self.min_size, self.max_size)
+        pairs, seen = [], set()
+        for _ in range(size * 2):
+            if len(pairs) == size:
+                break
+            key = self.keys.generate(generator)
+            if self.keys.value(key) not in seen:
+                seen.add(self.keys.value(key))
+                pairs.append((key, self.values.generate(generator)))
+        return pairs
+
+    def shrink(self, raw: list) -> Iterator[list]:
+        yield from _shorter(raw, self.min_size)
+        for index, (key, value) in enumerate(raw):
+            for candidate in self.values.shrink(value):
+                yield raw[:index] + [(key, candidate)] + raw[index + 1:]
+            for candidate in self.keys.shrink(key):
+                yield raw[:index] + [(candidate, value)] + raw[index + 1:]
+
+    def value(self, raw: list) -> dict:
+        return {self.keys.value(key): self.values.value(value) for key, value in raw}
+
+
+class _Tuples(Strategy):
+    def __init__(self, strategies: Sequence[Strategy]):
+        self.strategies = tuple(strategies)
+
+    def generate(self, generator: random.Random) -> tuple:
+        return tuple(strategy.generate(generator) for strategy in self.strategies)
+
+    def shrink(self, raw: tuple) -> Iterator[tuple]:
+        for index, (strategy, element) in enumerate(zip(self.strategies, raw)):
+            for candidate in strategy.shrink(element):
+                yield raw[:index] + (candidate,) + raw[index + 1:]
+
+    def value(self, raw: tuple) -> tuple:
+        return tuple(strategy.value(element) for strategy, element in zip(self.strategies, raw))
+
+
+class _OneOf(Strategy):
+    def __init__(self, strategies: Sequence[Strategy]):
+        if not strategies:
+            raise ValueError("one_of() needs at least one strategy")
+        self.strategies = tuple(strategies)
+
+    def generate(self, generator: random.Random) -> tuple:
+        index = generator.randrange(len(self.strategies))
+        return index, self.strategies[index].generate(generator)
+
+    def shrink(self, raw: tuple) -> Iterator[tuple]:
+        index, inner = raw
+        for candidate in self.strategies[index].shrink(inner):
+            yield index, candidate
+
+    def value(self, raw: tuple):
+        index, inner = raw
+        return self.strategies[index].value(inner)
+
+
+class _Mapped(Strategy):
+    def __init__(self, strategy: Strategy, function: Callable):
+        self.strategy = strategy
+        self.function = function
+
+    def generate(self, generator: random.Random):
+        return self.strategy.generate(generator)
+
+    def shrink(self, raw) -> Iterator:
+        return self.strategy.shrink(raw)
+
+    def value(self, raw):
+        return self.function(self.strategy.value(raw))
+
+
+class _Filtered(Strategy):
+    def __init__(self, strategy: Strategy, predicate: Callable):
+        self.strategy = strategy
+        self.predicate = predicate
+
+    def _satisfied(self, raw) -> bool:
+        return bool(self.predicate(self.strategy.value(raw)))
+
+    def generate(self, generator: random.Random):
+        for _ in range(MAX_FILTER_ATTEMPTS):
+            raw = self.strategy.generate(generator)
+            if self._satisfied(raw):
+                return raw
+        raise Unsatisfiable(f"No value satisfying {getattr(self.predicate, '__name__', self.predicate)} found in "
+                            f"{MAX_FILTER_ATTEMPTS} attempts")
+
+    def shrink(self, raw) -> Iterator:
+        return (candidate for candidate in self.strategy.shrink(raw) if self._satisfied(candidate))
+
+    def value(self, raw):
+        return self.strategy.value(raw)
+
+
+def integers(min_value: int = None, max_value: int = None) -> Strategy:
+    """
+    Generates integers within optional bounds, favouring 0, 1, -1 and the bounds. Shrinks towards 0.
+    """
+    return _Integers(min_value, max_value)
+
+
+def booleans() -> Strategy:
+    return _Booleans()
+
+
+def just(value) -> Strategy:
+    """
+    Always generates the same value.
+    """
+    return _Just(value)
+
+
+def sampled_from(values: Sequence) -> Strategy:
+    """
+    Generates elements of a sequence. Shrinks towards the first element.
+    """
+    return _SampledFrom(values)
+
+
+def text(alphabet: str = None, min_size: int = 0, max_size: int = 20) -> Strategy:
+    """
+    Generates strings of characters from an alphabet, by default ASCII letters, digits, punctuation, whitespace and a
+    few non-ASCII characters. Shrinks towards shorter strings of the first character of the alphabet.
+    """
+    return _Text(alphabet, min_size, max_size)
+
+
+def lists(elements: Strategy, min_size: int = 0, max_size: int = 10) -> Strategy:
+    """
+    Generates lists of elements. Shrinks towards shorter lists of simpler elements.
+    """
+    return _Lists(elements, min_size, max_size)
+
+
+def dicts(keys: Strategy, values: Strategy, min_size: int = 0, max_size: int = 10) -> Strategy:
+    """
+    Generates dicts with distinct keys. Shrinks towards smaller dicts of simpler keys and values.
+    """
+    return _Dicts(keys, values, min_size, max_size)
+
+
+def tuples(*strategies: Strategy) -> Strategy:
+    """
+    Generates tuples with one element per strategy. Passed to parameterize(), every element becomes a parameter.
+    """
+    return _Tuples(strategies)
+
+
+def one_of(*strategies: Strategy) -> Strategy:
+    """
+    Generates values of one of several strategies.
+    """
+    return _OneOf(strategies)
+
+
+def builds(target: Callable, *args: Strategy, **kwargs: Strategy) -> Strategy:
+    """
+    Generates objects by calling target with arguments generated by the given strategies, e.g.
+    ``builds(Order, integers(1, 10), currency=sampled_from(["EUR", "USD"]))``.
+    """
+    names = list(kwargs)
+    return _Tuples((_Tuples(args), _Tuples(list(kwargs.values())))).map(
+        lambda arguments: target(*arguments[0], **dict(zip(names, arguments[1]))))
+
+
+class Falsified(NamedTuple):
+    value: Any
+    raw: Any
+    error: Exception
+    examples: int
+    shrinks: int
+
+
+def _failure(test: Callable, value) -> Optional[Exception]:
+    try:
+        test(value)
+    except unittest.SkipTest:
+        raise
+    except Exception as error:
+        return error
+    return None
+
+
+def shrink(test: Callable, strategy: Strategy, raw, error_type: type,
+           max_shrinks: int = MAX_SHRINKS) -> Tuple[Any, int]:
+    """
+    Shrinks a failing raw value greedily: the first simpler candidate still failing with error_type replaces it, until
+    no candidate fails or max_shrinks candidates were tried.
+
+    :return: the minimal raw value found and the number of candidates tried
+    """
+    def fails(candidate) -> bool:
+        try:
+            value = strategy.value(candidate)
+        except Exception:
+            return False
+        return isinstance(_failure(test, value), error_type)
+
+    tried = 0
+    improved = True
+    while improved and tried < max_shrinks:
+        improved = False
+        for candidate in strategy.shrink(raw):
+            tried += 1
+            if fails(candidate):
+                raw, improved = candidate, True
+                break
+            if tried >= max_shrinks:
+                break
+    return raw, tried
+
+
+def stored_examples(key: str) -> List:
+    """
+    Loads the raw failing examples stored for a test, the most recent first.
+    """
+    examples = []
+    for representation in storage.load_json(EXAMPLES_FILE, {}).get(key, []):
+        try:
+            examples.append(ast.literal_eval(representation))
+        except (ValueError, SyntaxError):
+            pass
+    return examples
+
+
+def _update_stored_examples(key: str, add=None, remove: List = ()) -> None:
+    database = storage.load_json(EXAMPLES_FILE, {})
+    removed = {repr(raw) for raw in remove}
+    examples = [representation for representation in database.get(key, []) if representation not in removed]
+    if add is not None:
+        examples = [repr(add)] + [representation for representation in examples if representation != repr(add)]
+    if examples:
+        database[key] = examples[:MAX_STORED_EXAMPLES]
+    else:
+        database.pop(key, None)
+    storage.save_json(EXAMPLES_FILE, database)
+
+
+def find_failure(test: Callable, strategy: Strategy, examples: int = None, max_seconds: float = None, seed=0,
+                 key: str = None) -> Optional[Falsified]:
+    """
+    Runs a test with generated values until it fails or the budget is spent, and shrinks the first failing value.
+
+    :param test: a function taking a generated value and raising an exception if it fails
+    :param strategy: the strategy to generate values with
+    :param examples: the maximum number of generated values, defaults to DEFAULT_EXAMPLES
+    :param max_seconds: stop generating values after this many seconds
+    :param seed: the seed of the generator; None draws a new seed for every run
+    :param key: if set, failing examples are stored under this key and replayed first, before generating values
+    :return: the minimal failing example, or None if all values passed
+    """
+    examples = DEFAULT_EXAMPLES if examples is None else examples
+    deadline = None if max_seconds is None else time.perf_counter() + max_seconds
+    generator = random.Random(seed)
+
+    def candidates():
+        for raw in stored_examples(key) if key else ():
+            yield raw, True
+        for _ in range(examples):
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+            yield strategy.generate(generator), False
+
+    passed_replays = []
+    count = 0
+    for raw, replayed in candidates():
+        try:
+            value = strategy.value(raw)
+        except Exception:
+            if not replayed:
+                raise
+            passed_replays.append(raw)  # stored for an earlier version of the strategy
+            continue
+
+        count += 1
+        error = _failure(test, value)
+        if error is None:
+            if replayed:
+                passed_replays.append(raw)
+            continue
+
+        minimal, shrinks = shrink(test, strategy, raw, type(error))
+        if key:
+            _update_stored_examples(key, add=minimal, remove=passed_replays)
+        return Falsified(strategy.value(minimal), minimal, error, count, shrinks)
+
+    if key and passed_replays:
+        _update_stored_examples(key, remove=passed_replays)
+    return None
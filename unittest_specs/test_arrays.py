@@ -0,0 +1,99 @@
+import array
+import unittest
+from unittest import mock
+
+from unittest_specs import arrays, assertions
+from unittest_specs.fun_test_spec import expect
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+
+numpy = arrays.numpy()
+
+
+class BufferArraySpec(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(arrays, "USE_NUMPY", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_close_values_should_pass(self):
+        arrays.assert_close_to(array.array("d", [1.0, 2.0 + 1e-9]), [1.0, 2.0])
+        arrays.assert_close_to([[0.1, 0.2], [0.3, float("nan")]], [[0.1, 0.2], [0.3, float("nan")]])
+        arrays.assert_close_to(memoryview(array.array("d", [0.5, 0.5])), 0.5)
+
+    def test_distant_values_should_be_summarized(self):
+        with self.assertRaises(AssertionError) as context:
+            arrays.assert_close_to([1.0, 2.0, 3.5, 4.0], [1.0, 2.0, 3.0, 4.01], atol=0.001)
+
+        self.assertEqual("2 of 4 elements (50.0%) not close (rtol=1e-07, atol=0.001), max absolute difference 0.5, "
+                         "max relative difference 0.166667:\n  [2]: 3.5 != 3.0\n  [3]: 4.0 != 4.01",
+                         str(context.exception))
+
+    def test_mismatch_reports_should_be_capped(self):
+        with self.assertRaisesRegex(AssertionError, r"\n  \[1, 2\]: 0 != 1\n  \.\.\. \(3 more\)$"):
+            arrays.assert_close_to([[0, 0, 0], [0, 0, 0], [0, 0, 0]], [[0, 1, 1], [1, 1, 1], [1, 1, 1]])
+
+    def test_shapes_should_be_compared(self):
+        with self.assertRaisesRegex(AssertionError, r"^Arrays differ in shape: \(2,\) != \(3,\)$"):
+            arrays.assert_close_to([1, 2], [1, 2, 3])
+
+        arrays.assert_shape([[1, 2, 3], [4, 5, 6]], (2, 3))
+        arrays.assert_shape(array.array("i", [1, 2]), 2)
+        with self.assertRaisesRegex(AssertionError, r"^shape \(2, 3\) != \(3, 2\)$"):
+            arrays.assert_shape([[1, 2, 3], [4, 5, 6]], (3, 2))
+
+    def test_predicates_should_be_checked_for_every_element(self):
+        arrays.assert_all_satisfy([[1, 2], [3, 4]], lambda value: value > 0)
+
+        def is_even(value):
+            return value % 2 == 0
+
+        with self.assertRaisesRegex(AssertionError, r"^2 of 4 elements \(50.0%\) do not satisfy is_even:\n"
+                                                    r"  \[0, 0\]: 1\n  \[1, 0\]: 3$"):
+            arrays.assert_all_satisfy([[1, 2], [3, 4]], is_even)
+
+    def test_ragged_sequences_should_be_rejected(self):
+        with self.assertRaisesRegex(ValueError, "ragged"):
+            arrays.shape_of([[1, 2], [3]])
+
+
+class ArrayAsserterSpec(unittest.TestCase):
+    def test_simple_flat_spec_should_offer_array_assertions(self):
+        SimpleFlatSpec.expect([0.1 + 0.2, 0.3]).to_have_shape(2).and_close_to(0.3).and_all_satisfy(lambda x: x > 0)
+
+    def test_fun_spec_should_offer_array_assertions(self):
+        expect([0.1 + 0.2, 0.3]).to_have_shape(2).and_close_to(0.3).and_all_satisfy(lambda x: x > 0)(self)
+
+        with self.assertRaisesRegex(AssertionError, "^1 of 2 elements"):
+            expect([1.0, 2.0]).to_be_close_to([1.0, 2.1])(self)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyArraySpec(unittest.TestCase):
+    def test_close_values_should_be_compared_vectorized(self):
+        arrays.assert_close_to(numpy.linspace(0, 1, 1000) + 1e-9, numpy.linspace(0, 1, 1000))
+
+        actual = numpy.array([[1.0, 2.0, 3.0], [4.5, 5.0, 6.0]])
+        with self.assertRaisesRegex(AssertionError, r"^1 of 6 elements \(16.7%\) not close .*\n"
+                                                    r"  \[1, 0\]: 4.5 != 4.0$"):
+            arrays.assert_close_to(actual, numpy.arange(1.0, 7.0).reshape(2, 3))
+
+    def test_vectorized_predicates_should_be_applied_to_the_whole_array(self):
+        calls = []
+
+        def is_positive(values):
+            calls.append(values)
+            return values > 0
+
+        with self.assertRaisesRegex(AssertionError, r"^1 of 3 elements \(33.3%\) do not satisfy is_positive"):
+            arrays.assert_all_satisfy(numpy.array([1, -1, 2]), is_positive)
+        self.assertEqual(1, len(calls))
+
+    def test_arrays_should_be_compared_by_assert_equal(self):
+        assertions.assert_equal(numpy.arange(3), numpy.arange(3))
+
+        with self.assertRaisesRegex(AssertionError, r"^Arrays differ: 1 of 3 elements \(33.3%\) differ:\n"
+                                                    r"  \[2\]: 2 != 5$"):
+            assertions.assert_equal(numpy.arange(3), numpy.array([0, 1, 5]))
+
+    def test_shapes_should_be_read_from_arrays(self):
+        arrays.assert_shape(numpy.zeros((2, 3)), (2, 3))
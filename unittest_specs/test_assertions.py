@@ -0,0 +1,145 @@
+import unittest
+
+from unittest_specs import assertions
+
+
+class AssertionMessageSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reference = unittest.TestCase()
+
+    def assert_same_message(self, reference_assertion, assertion, *args):
+        with self.assertRaises(AssertionError) as expected:
+            reference_assertion(*args)
+        with self.assertRaises(AssertionError) as actual:
+            assertion(*args)
+        self.assertEqual(str(expected.exception), str(actual.exception))
+
+    def test_equal_messages_should_match_unittest(self):
+        for first, second in [(1, 2), ([1, 2, 3], [1, 4, 3]), ([1], [1, 2]), ((1, 2), (1,)),
+                              ({1: 2}, {1: 3}), ({1, 2}, {2, 3}), ("a\nb\n", "a\nc\n"), ("abc", "abd")]:
+            with self.subTest(first=first):
+                self.assert_same_message(self.reference.assertEqual, assertions.assert_equal, first, second)
+
+    def test_not_equal_message_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertNotEqual, assertions.assert_not_equal, 1, 1)
+
+    def test_list_equal_message_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertListEqual, assertions.assert_list_equal, (1,), [1])
+
+    def test_truth_messages_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertTrue, assertions.assert_true, 0)
+        self.assert_same_message(self.reference.assertFalse, assertions.assert_false, 1)
+
+    def test_none_messages_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertIsNone, assertions.assert_is_none, 1)
+        self.assert_same_message(self.reference.assertIsNotNone, assertions.assert_is_not_none, None)
+
+    def test_instance_message_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertIsInstance, assertions.assert_is_instance, 1, str)
+
+    def test_in_message_should_match_unittest(self):
+        self.assert_same_message(self.reference.assertIn, assertions.assert_in, 4, [1, 2])
+
+    def test_registered_equality_function_should_be_used(self):
+        class Point(tuple):
+            pass
+
+        def compare_points(first, second):
+            assertions.fail("points differ")
+
+        assertions.register_equality_function(Point, compare_points)
+        with self.assertRaisesRegex(AssertionError, "points differ"):
+            assertions.assert_equal(Point((1,)), Point((2,)))
+
+
+class ContainmentSpec(unittest.TestCase):
+    def test_missing_elements_should_report_all_missing_in_order(self):
+        self.assertEqual([5, 4], assertions.missing_elements([1, 2, 3], [5, 1, 4]))
+
+    def test_missing_elements_should_handle_unhashable_items(self):
+        self.assertEqual([[3]], assertions.missing_elements([[1], 2, {3: 4}], [[1], 2, {3: 4}, [3]]))
+
+    def test_missing_elements_should_keep_substring_semantics(self):
+        self.assertEqual(["xy"], assertions.missing_elements("abcde", ["bcd", "xy"]))
+
+    def test_missing_elements_should_consume_iterators_once(self):
+        self.assertEqual([], assertions.missing_elements(iter([1, 2, 3]), [3, 2, 1]))
+
+    def test_missing_elements_should_respect_custom_containment(self):
+        class CaseInsensitiveList(list):
+            def __contains__(self, element):
+                return any(element.lower() == item.lower() for item in self)
+
+        class Evens:
+            def __contains__(self, element):
+                return element % 2 == 0
+
+        self.assertEqual(["C"], assertions.missing_elements(CaseInsensitiveList(["a", "b"]), ["A", "b", "C"]))
+        self.assertEqual([3], assertions.missing_elements(Evens(), [2, 3, 4]))
+
+    def test_missing_elements_should_report_unhashable_elements_of_hashed_containers(self):
+        self.assertEqual([[1]], assertions.missing_elements({1, 2}, [1, [1]]))
+        self.assertEqual([{"a": 1}], assertions.missing_elements({"a": 1}, ["a", {"a": 1}]))
+
+        with self.assertRaisesRegex(AssertionError, r"1 of 1 expected elements not found: \[\[1\]\]"):
+            assertions.assert_contains_all({1, 2}, [[1]])
+
+    def test_contains_all_should_list_missing_elements(self):
+        with self.assertRaisesRegex(AssertionError, r"2 of 3 expected elements not found: \[4, 5\]"):
+            assertions.assert_contains_all(range(3), [4, 1, 5])
+
+    def test_contains_any_should_pass_with_single_match(self):
+        assertions.assert_contains_any({1, 2}, [7, 8, 2])
+
+    def test_contains_any_should_fail_without_match(self):
+        with self.assertRaisesRegex(AssertionError, "none of the expected elements found"):
+            assertions.assert_contains_any([1, 2], [3])
+
+    def test_contains_exactly_should_ignore_order(self):
+        assertions.assert_contains_exactly([3, 1, 2, 1], [1, 1, 2, 3])
+
+    def test_contains_exactly_should_respect_multiplicity(self):
+        with self.assertRaisesRegex(AssertionError, "First has 2, Second has 1:  1"):
+            assertions.assert_contains_exactly([1, 1, 2], [1, 2])
+
+    def test_contains_exactly_should_handle_unhashable_items(self):
+        assertions.assert_contains_exactly([[1], [2]], [[2], [1]])
+
+
+class SoftAssertionSpec(unittest.TestCase):
+    def test_single_failures_should_be_raised_unchanged(self):
+        failure = AssertionError("only")
+        with self.assertRaises(AssertionError) as context:
+            assertions.fail_together([failure])
+        self.assertIs(failure, context.exception)
+
+    def test_failures_should_only_be_recorded_within_softly(self):
+        self.assertFalse(assertions.record_soft_failure(AssertionError("raised")))
+
+        with self.assertRaisesRegex(AssertionError, "^2 expectations failed:\n1\\) first\n2\\) second$"):
+            with assertions.softly():
+                self.assertTrue(assertions.record_soft_failure(AssertionError("first")))
+                self.assertTrue(assertions.record_soft_failure(AssertionError("second")))
+
+    def test_clause_names_should_read_as_continuation(self):
+        self.assertEqual(["and_be", "and_of_length", "and_contain_all", "and_not_be_none"],
+                         [assertions.clause_name(name) for name in
+                          ("to_be", "to_be_of_length", "to_contain_all", "to_not_be_none")])
+
+
+class RaisesSpec(unittest.TestCase):
+    def test_raises_should_intercept_expected_exception(self):
+        with assertions.raises(ValueError) as context:
+            raise ValueError("intercepted")
+
+        self.assertEqual(str(context.exception), "intercepted")
+
+    def test_raises_should_fail_without_exception(self):
+        with self.assertRaisesRegex(AssertionError, "ValueError not raised"):
+            with assertions.raises(ValueError):
+                pass
+
+    def test_raises_should_propagate_other_exceptions(self):
+        with self.assertRaises(KeyError):
+            with assertions.raises(ValueError):
+                raise KeyError()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from unittest_specs import async_support
+from unittest_specs.fun_test_spec import describe, it, expect
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+from unittest_specs.with_test_spec import scenario, setup, run, teardown
+
+
+class AsyncSupportSpec(unittest.TestCase):
+    def tearDown(self) -> None:
+        async_support.close_event_loop(AsyncSupportSpec)
+
+    def test_resolve_should_return_plain_values(self):
+        self.assertEqual(1, async_support.resolve(1, AsyncSupportSpec))
+
+    def test_resolve_should_await_coroutines(self):
+        async def compute():
+            return 2
+
+        self.assertEqual(2, async_support.resolve(compute(), AsyncSupportSpec))
+
+    def test_event_loop_should_be_shared_per_owner(self):
+        self.assertIs(async_support.event_loop(AsyncSupportSpec), async_support.event_loop(AsyncSupportSpec))
+        self.assertIsNot(async_support.event_loop(AsyncSupportSpec), async_support.event_loop(None))
+
+    def test_closed_event_loop_should_be_replaced(self):
+        loop = async_support.event_loop(AsyncSupportSpec)
+        async_support.close_event_loop(AsyncSupportSpec)
+
+        self.assertTrue(loop.is_closed())
+        self.assertIsNot(loop, async_support.event_loop(AsyncSupportSpec))
+
+
+class AsyncSpecStylesSpec(unittest.TestCase):
+    def run_tests(self, test_class):
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(test_class).run(result)
+        self.assertEqual([], result.failures + result.errors)
+        return result
+
+    def test_simple_flat_spec_should_share_one_loop_across_async_tests(self):
+        loops = []
+
+        class AsyncSpec(SimpleFlatSpec):
+            async def setUp(self):
+                self.value = await asyncio.sleep(0, result=1)
+
+            async def test_first(self):
+                loops.append(asyncio.get_running_loop())
+                self.expect(self.value).to_be(1)
+
+            async def test_second(self):
+                loops.append(asyncio.get_running_loop())
+
+            @SimpleFlatSpec.parameterize(params=[1, 2, 3], workers=2)
+            async def test_rows(self, value):
+                loops.append(asyncio.get_running_loop())
+
+        self.assertEqual(3, self.run_tests(AsyncSpec).testsRun)
+        self.assertEqual(1, len(set(map(id, loops))))
+        self.assertEqual(5, len(loops))
+
+    def test_fun_spec_should_await_actual_values_and_test_functions(self):
+        async def compute():
+            return 3
+
+        async def async_test(_):
+            await asyncio.sleep(0)
+
+        describe("Async Fun Spec",
+                 it("awaits callables", expect(compute).to_be(3)),
+                 it("awaits test functions", async_test),
+                 module=__name__)
+
+        self.assertEqual(2, self.run_tests(globals().pop("AsyncFunSpec")).testsRun)
+
+    def test_scenario_should_await_actions(self):
+        events = []
+
+        async def record(event):
+            events.append(event)
+
+        with scenario("async actions", suite="AsyncScenarios") as test_scenario:
+            test_scenario @ setup << (lambda: record("setup"))
+            test_scenario @ run << (lambda: record("run"))
+            test_scenario @ teardown << (lambda: record("teardown"))
+
+        self.run_tests(globals().pop("AsyncScenarios"))
+        self.assertEqual(["setup", "run", "teardown"], events)
@@ -0,0 +1,55 @@
+import os
+import unittest
+from unittest import mock
+
+from unittest_specs import bench_test_spec
+from unittest_specs.bench_test_spec import bench
+from unittest_specs.fun_test_spec import describe
+from unittest_specs.test_support import TemporaryState
+
+
+class BenchSpec(TemporaryState, unittest.TestCase):
+    def run_benchmarks(self, *benchmarks) -> unittest.TestResult:
+        describe("Generated Benchmarks", *benchmarks, module=__name__)
+        test_class = globals().pop("GeneratedBenchmarks")
+        return unittest.TestLoader().loadTestsFromTestCase(test_class).run(unittest.TestResult())
+
+    def test_benchmarks_should_be_discovered_by_describe(self):
+        result = self.run_benchmarks(bench("sums numbers", sum, setup=lambda: range(100), rounds=3))
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(1, result.testsRun)
+
+    def test_results_should_be_stored_with_the_first_result_as_baseline(self):
+        self.run_benchmarks(bench("sums numbers", sum, setup=lambda: range(100), rounds=3))
+        self.run_benchmarks(bench("sums numbers", sum, setup=lambda: range(100), rounds=3))
+
+        entry = bench_test_spec.history(f"{__name__}.GeneratedBenchmarks.test_sums_numbers")
+        self.assertEqual(2, len(entry["runs"]))
+        self.assertEqual(entry["runs"][0], entry["baseline"])
+        self.assertEqual(3, entry["baseline"]["rounds"])
+
+    def test_regressions_beyond_the_threshold_should_fail(self):
+        self.run_benchmarks(bench("computes", lambda: sum(range(10)), rounds=3))
+        result = self.run_benchmarks(bench("computes", lambda: sum(range(10000)), rounds=3, threshold=0.5))
+
+        self.assertEqual(1, len(result.failures))
+        self.assertIn("regressed by", result.failures[0][1])
+        self.assertIn("threshold 50%", result.failures[0][1])
+
+    def test_update_should_replace_the_baseline(self):
+        self.run_benchmarks(bench("computes", lambda: sum(range(10)), rounds=3))
+        with mock.patch.dict(os.environ, {"UNITTEST_SPECS_BENCH_UPDATE": "1"}):
+            result = self.run_benchmarks(bench("computes", lambda: sum(range(10000)), rounds=3))
+
+        self.assertTrue(result.wasSuccessful())
+        entry = bench_test_spec.history(f"{__name__}.GeneratedBenchmarks.test_computes")
+        self.assertEqual(entry["runs"][1], entry["baseline"])
+
+    def test_history_should_be_capped(self):
+        with mock.patch.object(bench_test_spec, "MAX_HISTORY", 2):
+            for _ in range(3):
+                self.run_benchmarks(bench("is fast", int, rounds=1))
+
+        entry = bench_test_spec.history(f"{__name__}.GeneratedBenchmarks.test_is_fast")
+        self.assertEqual(2, len(entry["runs"]))
@@ -0,0 +1,73 @@
+import time
+import unittest
+
+from unittest_specs import assertions, diff
+
+
+class StructuralDiffSpec(unittest.TestCase):
+    def messages(self, first, second, **limits):
+        return [str(difference) for difference in diff.structural_diff(first, second, **limits).differences]
+
+    def test_equal_values_should_have_no_differences(self):
+        self.assertFalse(diff.structural_diff({"a": [1, {2}], "b": "c"}, {"a": [1, {2}], "b": "c"}))
+
+    def test_nested_differences_should_be_reported_with_paths(self):
+        self.assertEqual(["[1]: 2 != 3",
+                          "[2]['c']: missing in first",
+                          "[2]['a']: first contains 1 additional element starting at [2]: 3",
+                          "[2]['b']: differ at index 2: 'xyz' != 'xyq'"],
+                         self.messages([1, 2, {"a": [1, 2, 3], "b": "xyz"}], [1, 3, {"a": [1, 2], "c": 1, "b": "xyq"}]))
+
+    def test_set_differences_should_be_reported_by_membership(self):
+        self.assertEqual(["(top level): 1 missing in second", "(top level): 3 missing in first"],
+                         self.messages({1, 2}, {2, 3}))
+
+    def test_string_differences_should_report_line_and_column(self):
+        self.assertEqual(["(top level): differ at index 7 (line 2, column 2): 'hello\\nworld' != 'hello\\nwarld'"],
+                         self.messages("hello\nworld", "hello\nwarld"))
+
+    def test_type_differences_should_be_reported(self):
+        self.assertEqual(["(top level): [1] != (1,) (list != tuple)"], self.messages([1], (1,)))
+
+    def test_number_of_differences_should_be_capped(self):
+        result = diff.structural_diff(list(range(100)), list(range(1, 101)), max_differences=3)
+
+        self.assertEqual(3, len(result.differences))
+        self.assertTrue(str(result).startswith("first 3 differences (stopped after 3 differences):\n  [0]: 0 != 1"))
+
+    def test_compared_items_should_be_capped(self):
+        result = diff.structural_diff(list(range(100)), list(range(99)) + [0], max_items=50)
+
+        self.assertEqual("no differences found in the first 50 items (stopped after 50 items)", str(result))
+
+    def test_recursive_values_should_terminate(self):
+        first, second = [], []
+        first.append(first)
+        second.append(second)
+
+        self.assertFalse(diff.structural_diff(first, second))
+
+    def test_large_values_should_be_detected_without_visiting_everything(self):
+        self.assertTrue(diff.exceeds([[0] * 10] * 10 ** 6, 1000))
+        self.assertFalse(diff.exceeds({"a": [1, 2, 3]}, 1000))
+
+
+class LargeFailureMessageSpec(unittest.TestCase):
+    def test_large_mismatches_should_be_reported_quickly_with_a_structural_diff(self):
+        first = [{"id": index, "tags": [index]} for index in range(100000)]
+        second = [dict(record, tags=list(record["tags"])) for record in first]
+        for record in second[::10]:
+            record["tags"].append(-1)
+
+        start = time.perf_counter()
+        with self.assertRaises(AssertionError) as context:
+            assertions.assert_equal(first, second)
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertIn("\nfirst 10 differences (stopped after 10 differences):\n"
+                      "  [0]['tags']: second contains 1 additional element starting at [1]: -1\n",
+                      str(context.exception))
+
+    def test_large_strings_should_report_the_first_difference(self):
+        with self.assertRaisesRegex(AssertionError, "differ at index 100000 \\(line 20001, column 1\\)"):
+            assertions.assert_equal("line\n" * 20000 + "a", "line\n" * 20000 + "b")
@@ -0,0 +1,84 @@
+import sys
+import unittest
+
+from unittest_specs import fixtures
+from unittest_specs.fixtures import fixture, fixture_report
+from unittest_specs.scenario_runner import run_scenarios
+from unittest_specs.with_test_spec import scenario, setup, run, teardown
+
+events = []
+
+
+@fixture(scope="session")
+def configuration():
+    events.append("configuration")
+    return {"size": 3}
+
+
+@fixture(scope="module", depends=[configuration])
+def database(config):
+    events.append("database up")
+    yield list(range(config["size"]))
+    events.append("database down")
+
+
+@fixture(depends=[database])
+def connection(db):
+    events.append("connection up")
+    yield db
+    events.append("connection down")
+
+
+class FixtureSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        events.clear()
+        fixtures.teardown_module(__name__)
+
+    def tearDown(self) -> None:
+        fixtures.teardown_module(__name__)
+
+    def test_module_fixture_should_be_set_up_once_per_module(self):
+        self.assertIs(database(), database.value)
+        self.assertEqual(1, events.count("database up"))
+
+    def test_module_fixture_should_be_torn_down_with_module(self):
+        database()
+        sys.modules[__name__].tearDownModule()
+
+        self.assertEqual("database down", events[-1])
+        database()
+        self.assertEqual(2, events.count("database up"))
+
+    def test_scenario_fixture_should_require_a_scenario(self):
+        self.assertRaises(RuntimeError, connection)
+
+    def test_scenario_fixtures_should_be_set_up_per_scenario_and_torn_down_in_reverse(self):
+        for index in range(2):
+            with scenario(f"using connection {index}", suite="FixtureScenarios") as test_scenario:
+                test_scenario @ setup << connection
+                test_scenario @ run << (lambda: events.append(("run", len(connection.value))))
+                test_scenario @ teardown << (lambda: events.append("scenario teardown"))
+
+        result = run_scenarios(globals().pop("FixtureScenarios"), workers=2)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(1, events.count("database up"))
+        self.assertEqual(2, events.count("connection up"))
+        self.assertEqual(2, events.count("connection down"))
+        self.assertEqual([("run", 3)] * 2, [event for event in events if isinstance(event, tuple)])
+        self.assertNotIn("database down", events)
+
+    def test_fixture_should_reject_wider_scope_depending_on_narrower_one(self):
+        self.assertRaises(ValueError, fixture(scope="session", depends=[database]), lambda db: db)
+
+    def test_fixture_should_reject_unknown_scope(self):
+        self.assertRaises(ValueError, fixture, scope="class")
+
+    def test_report_should_show_saved_setup_time(self):
+        database()
+        database()
+        report = fixture_report([database])
+
+        self.assertIn("database", report)
+        self.assertIn("total setup time saved", report)
+        self.assertGreater(database.stats.uses, database.stats.setups)
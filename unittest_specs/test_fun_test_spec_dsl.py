@@ -3,7 +3,7 @@ import unittest
 from inspect import getmodule, currentframe
 from typing import Callable
 
-from unittest_specs.fun_test_spec import describe, it, expect
+from unittest_specs.fun_test_spec import describe, it, expect, defer, Asserter
 
 
 class FunTestDSL(unittest.TestCase):
@@ -39,7 +39,16 @@ class FunAsserterSpec(unittest.TestCase):
         self.false_asserter = expect(False)
 
     def test_should_create_asserter(self):
-        self.assertIsInstance(expect(''), unittest.TestCase)
+        self.assertIsInstance(expect(''), Asserter)
+
+    def test_asserters_should_share_one_type(self):
+        self.assertIs(type(expect(1)), type(expect('')))
+
+    def test_asserter_should_evaluate_callable_actual_value_at_test_time(self):
+        values = []
+        test_def = expect(lambda: values).to_be([1])
+        values.append(1)
+        test_def(self)
 
     def test_asserter_should_return_callable(self):
         self.assertIsInstance(expect('').to_be(''), Callable)
@@ -62,6 +71,22 @@ class FunAsserterSpec(unittest.TestCase):
     def test_asserter_should_detect_list_contains_all_correctly(self):
         self.list_asserter.to_contain_all([3, 1, 2])(self)
 
+    def test_asserter_should_evaluate_actual_value_once_for_contains_all(self):
+        calls = []
+
+        def actual_value():
+            calls.append(1)
+            return [1, 2, 3]
+
+        expect(actual_value).to_contain_all([3, 1, 2])(self)
+        self.assertEqual(1, len(calls))
+
+    def test_asserter_should_detect_list_contains_any_correctly(self):
+        self.list_asserter.to_contain_any([7, 2])(self)
+
+    def test_asserter_should_detect_list_contains_exactly_correctly(self):
+        self.list_asserter.to_contain_exactly([3, 2, 1])(self)
+
     def test_asserter_should_detect_true_correctly(self):
         self.true_asserter.to_be_true()(self)
 
@@ -87,6 +112,94 @@ class FunAsserterSpec(unittest.TestCase):
         self.list_asserter.to_be_of_length(3)(self)
 
 
+class ChainedExpectationSpec(unittest.TestCase):
+    def test_clauses_should_check_the_same_value(self):
+        expect([1, 2, 3]).to_be_a_list().and_of_length(3).and_contain_all([3, 1]).and_not_be([])(self)
+
+    def test_actual_value_should_be_evaluated_once(self):
+        calls = []
+
+        def actual_value():
+            calls.append(1)
+            return [1, 2, 3]
+
+        expect(actual_value).to_be_a_list().and_of_length(3).and_contain_any([5, 1])(self)
+        self.assertEqual([1], calls)
+
+    def test_every_failing_clause_should_be_reported(self):
+        expectation = expect([1, 2, 3]).to_be_a_dict().and_of_length(3).and_contain_all([4]).and_be([1])
+
+        with self.assertRaises(AssertionError) as context:
+            expectation(self)
+
+        message = str(context.exception)
+        self.assertTrue(message.startswith("3 expectations failed:\n1) [1, 2, 3] is not an instance of"), message)
+        self.assertIn("\n2) 1 of 1 expected elements not found: [4]", message)
+        self.assertIn("\n3) Lists differ: [1] != [1, 2, 3]", message)
+
+    def test_chaining_should_not_change_the_original_expectation(self):
+        expectation = expect(5).to_be_of_type(int)
+        expectation.and_be(6)
+
+        expectation(self)
+
+
+class LazyActualValueSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = []
+
+    def compute(self, value=3):
+        self.calls.append(value)
+        return value
+
+    def run_tests(self, *test_config, share_values=False) -> unittest.TestResult:
+        describe("Lazy Values", *test_config, module=__name__, share_values=share_values)
+        test_class = globals().pop("LazyValues")
+        return unittest.TestLoader().loadTestsFromTestCase(test_class).run(unittest.TestResult())
+
+    def test_thunks_should_be_evaluated_once_per_test_run(self):
+        def test_function(test_case):
+            asserter = expect(self.compute)
+            asserter.to_be(3)(test_case)
+            asserter.to_not_be(4)(test_case)
+
+        result = self.run_tests(("test_twice", test_function), ("test_again", test_function))
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual([3, 3], self.calls)
+
+    def test_thunks_should_be_shared_across_tests_if_requested(self):
+        answer = defer(self.compute, 42)
+
+        result = self.run_tests(it("is 42", expect(answer).to_be(42)),
+                                it("is an int", expect(answer).to_be_of_type(int)),
+                                it("is computed elsewhere", expect(defer(self.compute, 42)).to_be(42)),
+                                share_values=True)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual([42, 42], self.calls)
+
+    def test_awaitable_results_should_be_memoized(self):
+        async def compute():
+            return self.compute()
+
+        def test_function(test_case):
+            asserter = expect(compute)
+            asserter.to_be(3)(test_case)
+            asserter.to_be_of_type(int)(test_case)
+
+        self.assertTrue(self.run_tests(("test_async", test_function)).wasSuccessful())
+        self.assertEqual([3], self.calls)
+
+    def test_defer_should_postpone_calls_until_the_test_runs(self):
+        asserter = expect(defer(self.compute, value=5))
+        self.assertEqual([], self.calls)
+        self.assertEqual("defer(compute)", repr(asserter._actual_value))
+
+        asserter.to_be(5)(self)
+        self.assertEqual([5], self.calls)
+
+
 describe("Python numbers",
 
          it("5 should be of type int",
@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import unittest_specs
+from unittest_specs import impact
+from unittest_specs.test_support import TemporaryState
+
+SPEC_MODULE = textwrap.dedent("""
+    import unittest
+
+    import helper
+
+
+    class ImpactSample(unittest.TestCase):
+        def test_uses_helper(self):
+            self.assertEqual(2, helper.double(1))
+
+        def test_does_not_use_helper(self):
+            self.assertEqual(2, 1 + 1)
+
+        def test_fails(self):
+            self.fail("always")
+""")
+
+
+class ImpactSpec(TemporaryState, unittest.TestCase):
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def run_module(self, *arguments) -> subprocess.CompletedProcess:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(unittest_specs.__file__)))
+        environment = dict(os.environ, PYTHONPATH=project_root)
+        return subprocess.run([sys.executable, "-m", "unittest_specs", "--impact", *arguments],
+                              cwd=self.directory.name, env=environment, capture_output=True, text=True)
+
+    def test_recorder_should_record_executed_project_files_only(self):
+        recorder = impact.FileRecorder(os.path.dirname(os.path.abspath(unittest_specs.__file__)))
+
+        recorder.start()
+        try:
+            impact.file_hash(__file__)
+            os.path.join("a", "b")
+        finally:
+            recorder.stop()
+
+        self.assertEqual({os.path.abspath(impact.__file__)}, recorder.take())
+        self.assertEqual(set(), recorder.take())
+
+    def test_recorder_should_ignore_code_without_a_file(self):
+        recorder = impact.FileRecorder(os.getcwd())
+        namespace = {}
+        exec(compile("def generated():\n    return 1\n", "<string>", "exec"), namespace)
+
+        recorder.start()
+        try:
+            os.path.join("a", "b")
+            namespace["generated"]()
+        finally:
+            recorder.stop()
+
+        self.assertEqual([], [path for path in recorder.take() if "<" in path])
+
+    def test_new_failed_and_changed_tests_should_be_selected(self):
+        path = self.write("dependency.py", "")
+        impact.update_index({"spec.unchanged": [path], "spec.failed": [path], "spec.changed": [path]}, ["spec.failed"])
+        index = impact.load_index()
+        index["spec.changed"]["files"][path] = "outdated"
+
+        self.assertEqual([False, True, True, True],
+                         impact.select(["spec.unchanged", "spec.failed", "spec.changed", "spec.new"], index))
+
+    def test_deleted_dependencies_should_select_tests(self):
+        path = self.write("dependency.py", "")
+        impact.update_index({"spec.test": [path]}, [])
+        os.remove(path)
+
+        self.assertEqual([True], impact.select(["spec.test"]))
+
+    def test_only_affected_tests_should_run_again(self):
+        self.write("test_specs.py", SPEC_MODULE)
+        helper = self.write("helper.py", "def double(value):\n    return 2 * value\n")
+
+        process = self.run_module("-v")
+        self.assertIn("Running 3 of 3 tests", process.stderr)
+
+        process = self.run_module("-v")
+        self.assertIn("Running 1 of 3 tests", process.stderr)
+        self.assertIn("test_fails", process.stderr)
+
+        with open(helper, "a", encoding="utf-8") as file:
+            file.write("# changed\n")
+        process = self.run_module("-v")
+        self.assertIn("Running 2 of 3 tests", process.stderr)
+        self.assertIn("test_uses_helper", process.stderr)
+        self.assertNotIn("test_does_not_use_helper", process.stderr)
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import unittest_specs
+
+# generous upper bound for importing the package alone relative to importing a spec style in the same interpreter
+MAX_IMPORT_RATIO = 0.1
+# generous upper bound for the import time a spec style adds to an interpreter that imported unittest before, relative
+# to the import time of unittest; the package with all three spec styles added about 0.35 times the import time of
+# unittest before lazy imports were introduced
+MAX_SPEC_STYLE_RATIO = 1.0
+
+SPEC_STYLES = ("unittest_specs.fun_test_spec", "unittest_specs.simple_test_spec", "unittest_specs.with_test_spec")
+
+
+def import_times(statement: str) -> dict:
+    """
+    Runs a statement in a fresh interpreter with ``-X importtime`` and returns the cumulative import time of every
+    imported module in microseconds.
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(unittest_specs.__file__)))
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=project_root,
+                             capture_output=True, text=True, check=True)
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+def spec_style_ratio(spec_style: str, runs: int = 3) -> float:
+    """
+    Imports unittest and then a spec style in several fresh interpreters and returns the lowest ratio of the import
+    time added by the spec style to the import time of unittest. Both are measured in the same interpreter, so that
+    load on the machine affects them alike, and the lowest ratio ignores runs disturbed nonetheless.
+    """
+    ratios = []
+    for _ in range(runs):
+        imported = import_times(f"import unittest; import {spec_style}")
+        ratios.append(imported[spec_style] / imported["unittest"])
+    return min(ratios)
+
+
+class LazyImportSpec(unittest.TestCase):
+    def test_importing_the_package_should_not_import_the_spec_styles(self):
+        imported = import_times("import unittest_specs")
+
+        self.assertIn("unittest_specs", imported)
+        self.assertEqual([], [module for module in imported if module.startswith(("unittest_specs.", "unittest."))
+                              or module in ("unittest", "inspect", "asyncio")])
+
+    def test_importing_the_package_should_be_fast(self):
+        imported = import_times("import unittest_specs; import unittest_specs.fun_test_spec")
+
+        self.assertLess(imported["unittest_specs"], MAX_IMPORT_RATIO * imported["unittest_specs.fun_test_spec"])
+
+    def test_importing_a_spec_style_should_not_cost_much_more_than_unittest(self):
+        for spec_style in SPEC_STYLES:
+            with self.subTest(spec_style=spec_style):
+                self.assertLess(spec_style_ratio(spec_style), MAX_SPEC_STYLE_RATIO)
+
+    def test_importing_a_spec_style_should_not_import_optional_features(self):
+        imported = import_times(f"import {', '.join(SPEC_STYLES)}")
+
+        self.assertEqual([], [module for module in ("asyncio", "concurrent.futures", "unittest_specs.performance",
+                                                    "unittest_specs.result_cache", "unittest_specs.strategies")
+                              if module in imported])
+
+    def test_public_names_should_be_resolved_on_access(self):
+        imported = import_times("from unittest_specs import describe")
+
+        self.assertIn("unittest_specs.fun_test_spec", imported)
+        self.assertNotIn("unittest_specs.with_test_spec", imported)
+
+    def test_public_names_should_be_listed(self):
+        from unittest_specs.fun_test_spec import describe
+
+        self.assertIs(describe, unittest_specs.describe)
+        self.assertLessEqual(set(unittest_specs.__all__), set(dir(unittest_specs)))
+        with self.assertRaises(AttributeError):
+            getattr(unittest_specs, "missing")
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+import unittest
+
+from unittest_specs import parameters
+
+
+class ParameterSourceSpec(unittest.TestCase):
+    def test_iterate_should_call_factories(self):
+        self.assertEqual([1, 2], list(parameters.iterate(lambda: (i for i in (1, 2)))))
+
+    def test_iterate_should_pass_iterables_through(self):
+        rows = [(1, 2)]
+        self.assertIs(rows, parameters.iterate(rows))
+
+    def test_select_should_limit_rows(self):
+        self.assertEqual([0, 1, 2], list(parameters.select(range(10), limit=3)))
+
+    def test_select_should_shard_rows(self):
+        self.assertEqual([1, 4, 7], list(parameters.select(range(9), shard=(1, 3))))
+
+    def test_select_should_accept_shard_strings(self):
+        self.assertEqual([2, 5, 8], list(parameters.select(range(9), shard="2/3")))
+
+    def test_select_should_reject_invalid_shards(self):
+        self.assertRaises(ValueError, parameters.parse_shard, (3, 3))
+
+    def test_select_should_sample_reproducibly_in_original_order(self):
+        first = list(parameters.select(iter(range(1000)), sample=10, seed=42))
+        second = list(parameters.select(iter(range(1000)), sample=10, seed=42))
+
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(first), first)
+        self.assertEqual(10, len(set(first)))
+
+    def test_select_should_apply_shard_before_sample_and_limit(self):
+        rows = list(parameters.select(range(100), shard=(0, 2), sample=10, limit=5))
+        self.assertEqual(5, len(rows))
+        self.assertTrue(all(row % 2 == 0 for row in rows))
+
+
+class FileSourceSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_csv_rows_should_stream_tuples_without_header(self):
+        path = self.write("rows.csv", "word,length\nhello,5\nworld!,6\n")
+        self.assertEqual([("hello", "5"), ("world!", "6")], list(parameters.csv_rows(path)()))
+
+    def test_csv_rows_should_convert_rows(self):
+        path = self.write("rows.csv", "word,length\nhello,5\n")
+        rows = parameters.csv_rows(path, convert=lambda row: (row[0], int(row[1])))
+        self.assertEqual([("hello", 5)], list(rows()))
+
+    def test_jsonl_rows_should_stream_arrays_as_tuples(self):
+        path = self.write("rows.jsonl", "\n".join(json.dumps(row) for row in (["a", 1], {"b": 2}, 3)) + "\n\n")
+        self.assertEqual([("a", 1), {"b": 2}, 3], list(parameters.jsonl_rows(path)()))
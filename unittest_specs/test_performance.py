@@ -0,0 +1,60 @@
+import time
+import unittest
+
+from unittest_specs import performance
+from unittest_specs.fun_test_spec import expect
+from unittest_specs.performance import O_1, O_n, O_n_log_n
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+
+
+def quadratic(values):
+    return sum(1 for a in values for b in values if a == b)
+
+
+class SampleSpec(unittest.TestCase):
+    def test_sample_should_compute_median_and_iqr(self):
+        sample = performance.Sample([1.0, 2.0, 3.0, 4.0, 100.0])
+        self.assertEqual(3.0, sample.median)
+        self.assertLess(sample.iqr, 100.0)
+
+    def test_time_per_call_should_take_requested_rounds(self):
+        self.assertEqual(3, len(performance.time_per_call(lambda: None, rounds=3).values))
+
+
+class PerformanceAsserterSpec(SimpleFlatSpec):
+    def test_should_detect_completion_within_budget(self):
+        self.expect(lambda: sum(range(10))).to_complete_within(0.1)
+
+    def test_should_detect_exceeded_budget(self):
+        with self.assertRaisesRegex(AssertionError, "expected to complete within"):
+            self.expect(lambda: time.sleep(0.005)).to_complete_within(0.0001, rounds=3)
+
+    def test_should_detect_faster_callable(self):
+        self.expect(lambda: None).to_run_faster_than(lambda: time.sleep(0.001), factor=2, rounds=3)
+
+    def test_should_detect_slower_callable(self):
+        with self.assertRaisesRegex(AssertionError, "faster than"):
+            self.expect(lambda: time.sleep(0.001)).to_run_faster_than(lambda: None, rounds=3)
+
+    def test_should_detect_allocations_within_budget(self):
+        self.expect(lambda: [0] * 10).to_allocate_less_than(10_000)
+
+    def test_should_detect_exceeded_allocation_budget(self):
+        with self.assertRaisesRegex(AssertionError, "expected to allocate less than 10000 bytes"):
+            self.expect(lambda: [0] * 100_000).to_allocate_less_than(10_000)
+
+    def test_should_detect_linear_scaling(self):
+        self.expect(sorted).to_scale_at_most(O_n_log_n, inputs=[list(range(1000)), list(range(8000))])
+
+    def test_should_detect_scaling_beyond_complexity(self):
+        with self.assertRaisesRegex(AssertionError, "grow at most like O_1"):
+            self.expect(quadratic).to_scale_at_most(O_1, inputs=[list(range(20)), list(range(200))], rounds=3)
+
+    def test_should_reject_inputs_of_same_size(self):
+        self.assertRaises(ValueError, self.expect(len).to_scale_at_most, O_n, inputs=[[1], [2]])
+
+    def test_fun_asserter_should_offer_performance_assertions(self):
+        expect(lambda: None).to_complete_within(0.1)(self)
+        expect(lambda: None).to_allocate_less_than(10_000)(self)
+        expect(sum).to_scale_at_most(O_n, inputs=[list(range(1000)), list(range(10000))])(self)
+        expect(lambda: None).to_run_faster_than(lambda: time.sleep(0.001), rounds=3)(self)
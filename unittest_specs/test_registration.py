@@ -0,0 +1,53 @@
+import sys
+import unittest
+
+from inspect import getmodule, currentframe
+from types import ModuleType
+
+from unittest_specs.registration import caller_module, resolve_module, register
+from unittest_specs.fun_test_spec import describe, it, expect
+from unittest_specs.with_test_spec import scenario, run
+
+
+class RegistrationSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.target = ModuleType("registration_target")
+        sys.modules[self.target.__name__] = self.target
+
+    def tearDown(self) -> None:
+        del sys.modules[self.target.__name__]
+
+    def test_caller_module_should_resolve_calling_module(self):
+        def registering_function():
+            return caller_module()
+
+        self.assertIs(registering_function(), getmodule(currentframe()))
+
+    def test_caller_module_should_respect_depth(self):
+        def registering_function():
+            return caller_module(2)
+
+        def wrapper():
+            return registering_function()
+
+        self.assertIs(wrapper(), getmodule(currentframe()))
+
+    def test_resolve_module_should_accept_module_object(self):
+        self.assertIs(resolve_module(self.target), self.target)
+
+    def test_resolve_module_should_accept_module_name(self):
+        self.assertIs(resolve_module("registration_target"), self.target)
+
+    def test_register_should_set_module_attribute(self):
+        register(self.target, "Registered", 1)
+        self.assertEqual(self.target.Registered, 1)
+
+    def test_describe_should_register_into_explicit_module(self):
+        describe("Explicit Target", it("works", expect(1).to_be(1)), module=self.target)
+        self.assertEqual(self.target.ExplicitTarget.__name__, "ExplicitTarget")
+
+    def test_scenario_should_register_into_explicit_module(self):
+        with scenario("explicit target", into="registration_target") as test_scenario:
+            test_scenario @ run << (lambda: None)
+
+        self.assertIn("test_explicit_target", self.target.TestSuite.__dict__)
@@ -0,0 +1,186 @@
+import os
+import unittest
+from types import ModuleType
+from unittest import mock
+
+from unittest_specs import SimpleFlatSpec, describe, expect, it, result_cache, scenario, storage
+from unittest_specs.test_support import TemporaryState
+from unittest_specs.with_test_spec import run
+
+EXECUTIONS = []
+
+
+def record_execution(name: str) -> None:
+    EXECUTIONS.append(name)
+
+
+def run_tests(test_class) -> unittest.TestResult:
+    result = unittest.TestResult()
+    unittest.defaultTestLoader.loadTestsFromTestCase(test_class).run(result)
+    return result
+
+
+class ResultCacheSpec(TemporaryState, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.addCleanup(result_cache.clear)
+        result_cache.clear()
+        EXECUTIONS.clear()
+        self.target = ModuleType("result_cache_target")
+
+    def test_passed_deterministic_tests_should_be_skipped_while_unchanged(self):
+        class DeterministicSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.deterministic
+            def test_cached(self):
+                record_execution("cached")
+
+            def test_not_marked(self):
+                record_execution("not marked")
+
+        first, second = run_tests(DeterministicSpec), run_tests(DeterministicSpec)
+
+        self.assertTrue(first.wasSuccessful() and second.wasSuccessful())
+        self.assertEqual(2, second.testsRun)
+        self.assertEqual(["cached", "not marked", "not marked"], EXECUTIONS)
+        self.assertEqual((1, 1, 0), result_cache.stats()[:3])
+
+    def test_results_should_be_persisted(self):
+        class PersistedSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.deterministic
+            def test_cached(self):
+                record_execution("cached")
+
+        run_tests(PersistedSpec)
+        result_cache.save()
+        result_cache._entries = None
+        run_tests(PersistedSpec)
+
+        self.assertEqual(["cached"], EXECUTIONS)
+        self.assertEqual(1, len(storage.load_json(result_cache.CACHE_FILE)))
+
+    def test_changed_parameters_should_execute_tests_again(self):
+        def spec_class(rows):
+            class ParameterizedSpec(SimpleFlatSpec):
+                @SimpleFlatSpec.deterministic
+                @SimpleFlatSpec.parameterize(rows)
+                def test_rows(self, value):
+                    record_execution(value)
+
+            return ParameterizedSpec
+
+        run_tests(spec_class([1, 2]))
+        run_tests(spec_class([1, 2]))
+        run_tests(spec_class([1, 3]))
+
+        self.assertEqual([1, 2, 1, 3], EXECUTIONS)
+
+    def test_failed_tests_should_not_be_cached(self):
+        class FailingSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.parameterize([1, 2])
+            @SimpleFlatSpec.deterministic
+            def test_rows(self, value):
+                record_execution(value)
+                self.expect(value).to_be(1)
+
+        run_tests(FailingSpec)
+        result = run_tests(FailingSpec)
+
+        self.assertEqual(1, len(result.failures))
+        self.assertEqual([1, 2, 1, 2], EXECUTIONS)
+
+    def test_uncacheable_parameters_should_be_executed(self):
+        class GeneratorSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.deterministic
+            @SimpleFlatSpec.parameterize(value for value in [1])
+            def test_rows(self, value):
+                record_execution(value)
+
+        run_tests(GeneratorSpec)
+
+        self.assertEqual([1], EXECUTIONS)
+        self.assertEqual(1, result_cache.stats().uncacheable)
+
+    def test_it_blocks_should_be_keyed_by_their_assertion(self):
+        describe("Cached Fun Spec", it("is cached", expect(lambda: record_execution("fun")).to_be_none(),
+                                       deterministic=True), module=self.target)
+        run_tests(self.target.CachedFunSpec)
+        run_tests(self.target.CachedFunSpec)
+
+        describe("Cached Fun Spec", it("is cached", expect(lambda: record_execution("fun")).to_not_be(1),
+                                       deterministic=True), module=self.target)
+        run_tests(self.target.CachedFunSpec)
+
+        self.assertEqual(["fun", "fun"], EXECUTIONS)
+
+    def test_scenarios_should_be_cached(self):
+        with scenario("cached scenario", into=self.target, deterministic=True) as test_scenario:
+            test_scenario @ run << (lambda: record_execution("scenario"))
+
+        run_tests(self.target.TestSuite)
+        result = run_tests(self.target.TestSuite)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(["scenario"], EXECUTIONS)
+
+    def test_disabled_cache_should_execute_all_tests(self):
+        class DisabledSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.deterministic
+            def test_cached(self):
+                record_execution("cached")
+
+        with mock.patch.object(result_cache, "enabled", False):
+            run_tests(DisabledSpec)
+            run_tests(DisabledSpec)
+
+        self.assertEqual(["cached", "cached"], EXECUTIONS)
+
+
+class FingerprintSpec(unittest.TestCase):
+    def key(self, test_function) -> str:
+        return result_cache.result_key("spec.test", test_function)[0]
+
+    def test_keys_should_depend_on_closures_and_defaults(self):
+        def closure(value):
+            return lambda: value
+
+        self.assertEqual(self.key(closure({"a", "b", "c"})), self.key(closure({"c", "b", "a"})))
+        self.assertNotEqual(self.key(closure([1, 2])), self.key(closure([1, 3])))
+        self.assertNotEqual(self.key(lambda value=1: value), self.key(lambda value=2: value))
+
+    def test_keys_should_depend_on_the_code(self):
+        self.assertNotEqual(self.key(lambda: 1 + 1), self.key(lambda: 1 + 2))
+
+    def test_objects_should_be_fingerprinted_by_their_state(self):
+        self.assertEqual(self.key(expect([1, 2]).to_be([1, 2])), self.key(expect([1, 2]).to_be([1, 2])))
+        self.assertNotEqual(self.key(expect([1, 2]).to_be([1, 2])), self.key(expect([1, 2]).to_be([2, 1])))
+
+    def test_dependencies_should_include_project_modules(self):
+        _, files = result_cache.result_key("spec.test", record_execution)
+
+        self.assertIn(os.path.abspath(__file__), files)
+        self.assertIn(os.path.abspath(result_cache.__file__), files)
+
+    def test_unreproducible_values_should_be_uncacheable(self):
+        with open(__file__, encoding="utf-8") as file:
+            with self.assertRaises(result_cache.Uncacheable):
+                self.key(lambda: file.read())
+
+
+class EvictionSpec(unittest.TestCase):
+    def test_entries_not_used_recently_should_be_evicted(self):
+        entries = {"old": {"used": 0.0}, "recent": {"used": 100.0}}
+
+        with mock.patch.object(result_cache, "MAX_AGE", 50):
+            self.assertEqual(["recent"], list(result_cache.evict(entries, now=120.0)))
+
+    def test_least_recently_used_entries_should_be_evicted_beyond_the_limit(self):
+        entries = {name: {"used": used} for name, used in (("a", 3.0), ("b", 1.0), ("c", 2.0))}
+
+        with mock.patch.object(result_cache, "MAX_ENTRIES", 2):
+            self.assertEqual({"a", "c"}, set(result_cache.evict(entries, now=4.0)))
+
+    def test_stats_should_report_hit_ratio_and_time_saved(self):
+        stats = result_cache.CacheStats(3, 1, 0, 1.5)
+
+        self.assertEqual("result cache: 3 hits, 1 misses (75.0% hit ratio), 1.500s saved", str(stats))
+        self.assertEqual(result_cache.CacheStats(4, 1, 0, 2.0), stats + result_cache.CacheStats(1, 0, 0, 0.5))
@@ -0,0 +1,208 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+import unittest
+from unittest import mock
+
+import unittest_specs
+from unittest_specs import runner, storage
+from unittest_specs.test_support import TemporaryState
+
+SPEC_MODULE = textwrap.dedent("""
+    from unittest_specs import describe, it, expect, SimpleFlatSpec
+
+    describe("Fun Sample", it("passes", expect(1).to_be(1)), it("fails", expect(1).to_be(2)))
+
+
+    class SimpleSample(SimpleFlatSpec):
+        @SimpleFlatSpec.parameterize(params=[1, 2, 3])
+        def test_rows(self, value):
+            self.expect(value).to_not_be(2)
+
+        def test_error(self):
+            raise KeyError("boom")
+
+        def test_passes(self):
+            pass
+""")
+
+FIXTURE_MODULE = textwrap.dedent("""
+    import unittest
+
+    from unittest_specs.fixtures import fixture
+
+
+    @fixture(scope="session")
+    def marker():
+        yield "set up"
+        with open("torn_down", "w") as file:
+            file.write("torn down")
+
+
+    class FixtureSample(unittest.TestCase):
+        def test_uses_fixture(self):
+            self.assertEqual("set up", marker())
+""")
+
+SLOW_MODULE = textwrap.dedent("""
+    import time
+    import unittest
+
+
+    class FailingSample(unittest.TestCase):
+        def test_fails(self):
+            self.fail("fails")
+
+
+    class SlowSample(unittest.TestCase):
+        def _sleep(self):
+            time.sleep(0.5)
+
+        test_1 = test_2 = test_3 = test_4 = test_5 = test_6 = test_7 = test_8 = test_9 = test_10 = _sleep
+""")
+
+
+def address(class_name: str, method_name: str = "test"):
+    return "specs", class_name, method_name
+
+
+class BalanceSpec(unittest.TestCase):
+    def test_units_should_be_whole_classes_or_single_methods(self):
+        addresses = [address("A", "test_1"), address("B"), address("A", "test_2")]
+
+        self.assertEqual({"specs.A": [addresses[0], addresses[2]], "specs.B": [addresses[1]]},
+                         runner.group(addresses, runner.CLASS))
+        self.assertEqual(["specs.A.test_1", "specs.B.test", "specs.A.test_2"],
+                         list(runner.group(addresses, runner.METHOD)))
+
+    def test_longest_units_should_be_assigned_to_the_least_loaded_shard(self):
+        units = {name: [address(name)] for name in "ABCDE"}
+        durations = {"specs.A.test": 1, "specs.B.test": 5, "specs.C.test": 3, "specs.D.test": 3, "specs.E.test": 2}
+
+        shards = runner.balance(units, durations, 2)
+
+        self.assertEqual([[address("B"), address("E")], [address("A"), address("C"), address("D")]], shards)
+
+    def test_unknown_durations_should_be_estimated_by_the_mean(self):
+        units = {name: [address(name)] for name in "ABC"}
+
+        shards = runner.balance(units, {"specs.A.test": 4, "specs.B.test": 2}, 2)
+
+        self.assertEqual([[address("A")], [address("B"), address("C")]], shards)
+
+    def test_empty_shards_should_be_dropped(self):
+        self.assertEqual([[address("A")]], runner.balance({"A": [address("A")]}, {}, 4))
+
+
+class PrioritizeSpec(unittest.TestCase):
+    def test_units_with_failed_tests_should_run_first_then_the_fastest(self):
+        units = {name: [address(name)] for name in "ABCD"}
+        durations = {"specs.A.test": 1, "specs.B.test": 5, "specs.C.test": 3, "specs.D.test": 0.5}
+
+        self.assertEqual(["B", "D", "A", "C"], list(runner.prioritize(units, durations, {"specs.B.test"})))
+
+    def test_failed_tests_should_run_first_within_their_unit(self):
+        units = runner.group([address("A", "test_1"), address("A", "test_2"), address("A", "test_3")])
+        durations = {"specs.A.test_1": 2, "specs.A.test_2": 3, "specs.A.test_3": 1}
+
+        self.assertEqual([address("A", "test_2"), address("A", "test_3"), address("A", "test_1")],
+                         runner.prioritize(units, durations, {"specs.A.test_2"})["specs.A"])
+
+    def test_prioritized_units_should_keep_their_order_within_shards(self):
+        units = runner.prioritize({name: [address(name)] for name in "ABC"},
+                                  {"specs.A.test": 3, "specs.B.test": 1, "specs.C.test": 2}, {"specs.C.test"})
+
+        self.assertEqual([[address("C"), address("B"), address("A")]], runner.balance(units, {}, 1))
+
+
+class RunnerSpec(TemporaryState, unittest.TestCase):
+    def run_module(self, *arguments) -> subprocess.CompletedProcess:
+        with open(os.path.join(self.directory.name, "test_specs.py"), "w", encoding="utf-8") as file:
+            file.write(SPEC_MODULE)
+
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(unittest_specs.__file__)))
+        environment = dict(os.environ, PYTHONPATH=project_root)
+        return subprocess.run([sys.executable, "-m", "unittest_specs", *arguments], cwd=self.directory.name,
+                              env=environment, capture_output=True, text=True)
+
+    def test_outcomes_of_all_workers_should_be_merged_into_one_report(self):
+        process = self.run_module("-j", "2", "--granularity", "method")
+
+        self.assertEqual(1, process.returncode)
+        self.assertIn("Ran 5 tests in", process.stderr)
+        self.assertIn("FAILED (failures=2, errors=1)", process.stderr)
+        self.assertIn("FAIL: test_fails (test_specs.FunSample.test_fails)\n", process.stderr)
+        self.assertIn("FAIL: test_rows (test_specs.SimpleSample.test_rows) (i=2)\n", process.stderr)
+        self.assertIn("KeyError: 'boom'", process.stderr)
+
+    def test_durations_should_be_recorded(self):
+        self.run_module("-j", "2")
+
+        self.assertEqual({"test_specs.FunSample.test_fails", "test_specs.FunSample.test_passes",
+                          "test_specs.SimpleSample.test_error", "test_specs.SimpleSample.test_passes",
+                          "test_specs.SimpleSample.test_rows"}, set(storage.load_json(runner.DURATIONS_FILE)))
+
+    def test_previously_failed_tests_should_run_first(self):
+        self.run_module("-j", "1")
+        process = self.run_module("-j", "1", "--order", "priority", "--failfast")
+
+        self.assertEqual(1, process.returncode)
+        self.assertIn("Ran 1 test in", process.stderr)
+        self.assertEqual("failed", storage.load_json(runner.OUTCOMES_FILE)["test_specs.SimpleSample.test_error"])
+        self.assertEqual("passed", storage.load_json(runner.OUTCOMES_FILE)["test_specs.SimpleSample.test_passes"])
+
+    def test_failfast_should_stop_all_workers(self):
+        with open(os.path.join(self.directory.name, "test_slow_specs.py"), "w", encoding="utf-8") as file:
+            file.write(SLOW_MODULE)
+
+        started = time.perf_counter()
+        process = self.run_module("-j", "2", "--failfast", "-p", "test_slow_specs.py")
+
+        self.assertEqual(1, process.returncode)
+        self.assertIn("FAIL: test_fails", process.stderr)
+        self.assertLess(time.perf_counter() - started, 4.0)
+
+    def test_session_fixtures_should_be_torn_down_in_workers(self):
+        with open(os.path.join(self.directory.name, "test_fixture_specs.py"), "w", encoding="utf-8") as file:
+            file.write(FIXTURE_MODULE)
+
+        process = self.run_module("-j", "2", "-p", "test_fixture_specs.py")
+
+        self.assertEqual(0, process.returncode, process.stderr)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "torn_down")))
+
+    def test_timings_of_workers_should_be_recorded(self):
+        timings_path = os.path.join(self.directory.name, "timings.json")
+        with mock.patch.dict(os.environ, {"UNITTEST_SPECS_TIMING": f"json:{timings_path}"}):
+            self.run_module("-j", "2")
+
+        with open(timings_path, encoding="utf-8") as file:
+            names = {entry["name"] for entry in json.load(file)}
+        self.assertIn("test_specs.FunSample.test_passes", names)
+        self.assertIn("test_specs.SimpleSample.test_passes", names)
+
+    def test_names_should_select_tests(self):
+        process = self.run_module("-v", "test_specs.SimpleSample.test_passes")
+
+        self.assertEqual(0, process.returncode, process.stderr)
+        self.assertIn("Ran 1 test in", process.stderr)
+
+    def test_tests_not_loadable_by_workers_should_run_in_this_process(self):
+        class LocalSpec(unittest.TestCase):
+            def test_passes(self):
+                pass
+
+            def test_skipped(self):
+                self.skipTest("not now")
+
+        stream = io.StringIO()
+        result = runner.run(runner.discover([], start_dir=self.directory.name) +
+                            [LocalSpec("test_passes"), LocalSpec("test_skipped")], workers=2, stream=stream)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(2, result.testsRun)
+        self.assertEqual(1, len(result.skipped))
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from unittest_specs import async_support
+from unittest_specs.fun_test_spec import expect
+from unittest_specs.scenario_runner import _run_threads, run_scenarios
+from unittest_specs.with_test_spec import scenario, run, assertion, teardown
+
+
+def build_suite(suite_name, action_factory, count=4):
+    events = []
+
+    for index in range(count):
+        with scenario(f"scenario {index}", suite=suite_name, serial=index == 0) as test_scenario:
+            test_scenario @ run << action_factory(events, index)
+            test_scenario @ assertion << expect(lambda: len(events) > 0).to_be_true()
+            test_scenario @ teardown << (lambda i=index: events.append(("teardown", i)))
+
+    return globals().pop(suite_name), events
+
+
+class ScenarioRunnerSpec(unittest.TestCase):
+    def test_thread_mode_should_run_scenarios_concurrently(self):
+        def sleeping(events, index):
+            def action():
+                events.append(("run", index, threading.get_ident()))
+                time.sleep(0.05)
+
+            return action
+
+        suite, events = build_suite("ThreadedScenarios", sleeping, count=5)
+        start = time.perf_counter()
+        result = run_scenarios(suite, workers=4)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(5, result.testsRun)
+        self.assertLess(time.perf_counter() - start, 0.2)
+
+    def test_asyncio_mode_should_await_steps_concurrently(self):
+        def sleeping(events, index):
+            async def action():
+                events.append(("run", index))
+                await asyncio.sleep(0.05)
+
+            return action
+
+        suite, events = build_suite("AsyncScenarios", sleeping, count=5)
+        start = time.perf_counter()
+        result = run_scenarios(suite, workers=5, mode="asyncio")
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(5, result.testsRun)
+        self.assertLess(time.perf_counter() - start, 0.2)
+
+    def test_serial_scenarios_should_run_after_concurrent_ones(self):
+        def recording(events, index):
+            return lambda: events.append(("run", index))
+
+        suite, events = build_suite("SerialScenarios", recording)
+        run_scenarios(suite, workers=2)
+
+        runs = [event[1] for event in events if event[0] == "run"]
+        self.assertEqual(0, runs[-1])
+
+    def test_each_scenario_should_keep_its_step_order(self):
+        def recording(events, index):
+            return lambda: events.append(("run", index))
+
+        suite, events = build_suite("OrderedScenarios", recording)
+        run_scenarios(suite, workers=4, mode="asyncio")
+
+        for index in range(4):
+            self.assertLess(events.index(("run", index)), events.index(("teardown", index)))
+
+    def test_failures_should_be_reported_on_result(self):
+        with scenario("failing", suite="FailingScenarios") as test_scenario:
+            test_scenario @ run << (lambda: None)
+            test_scenario @ assertion << expect(1).to_be(2)
+
+        for mode in ("threads", "asyncio"):
+            with self.subTest(mode=mode):
+                result = run_scenarios(globals()["FailingScenarios"], mode=mode)
+                self.assertEqual(1, len(result.failures))
+        del globals()["FailingScenarios"]
+
+    def test_failfast_should_skip_scenarios_not_started_yet(self):
+        def failing(events, index):
+            def action():
+                events.append(("run", index))
+                assert index != 1
+
+            return action
+
+        for mode in ("threads", "asyncio"):
+            with self.subTest(mode=mode):
+                suite, events = build_suite(f"FailFast{mode.title()}Scenarios", failing, count=6)
+                result = unittest.TestResult()
+                result.failfast = True
+                run_scenarios(suite, workers=1, mode=mode, result=result)
+
+                self.assertEqual(1, len(result.errors) + len(result.failures))
+                self.assertEqual([1], [event[1] for event in events if event[0] == "run"])
+
+    def test_thread_mode_should_restore_the_event_loop_of_the_class(self):
+        suite, _ = build_suite("LoopScenarios", lambda events, index: lambda: None)
+        loop = async_support.event_loop(suite)
+        self.addCleanup(async_support.close_event_loop, suite)
+
+        _run_threads(suite, ["test_scenario_1"], 1, unittest.TestResult())
+
+        self.assertIs(loop, async_support.event_loop(suite))
+
+    def test_unknown_mode_should_be_rejected(self):
+        self.assertRaises(ValueError, run_scenarios, unittest.TestCase, mode="processes")
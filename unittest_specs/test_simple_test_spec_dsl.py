@@ -1,6 +1,6 @@
 import unittest
 
-from unittest_specs.simple_test_spec import SimpleFlatSpec
+from unittest_specs.simple_test_spec import SimpleFlatSpec, row_method_name
 
 parameterize = SimpleFlatSpec.parameterize
 intercept = SimpleFlatSpec.intercept
@@ -29,6 +29,83 @@ class SimpleTestDSL(unittest.TestCase):
     def test_should_decorate_class_member(self, left_param, right_param):
         self.assertEqual(left_param, right_param)
 
+    @parameterize(params=[
+        (1, 1),
+        (2, 2),
+        (3, 3),
+    ], workers=3)
+    def test_should_decorate_class_member_concurrently(self, left_param, right_param):
+        self.assertEqual(left_param, right_param)
+
+    def test_concurrent_parameters_should_attribute_failures_to_their_row(self):
+        class ConcurrentSpec(SimpleFlatSpec):
+            @parameterize(params=[1, 2, 3, 4], workers=2)
+            def test_rows(self, value):
+                self.expect(value % 2).to_be(1)
+
+        result = unittest.TestResult()
+        ConcurrentSpec("test_rows").run(result)
+
+        failed_rows = [test.params["i"] for test, _ in result.failures]
+        self.assertEqual([2, 4], failed_rows)
+
+    def test_parameter_factories_should_be_iterated_on_every_run(self):
+        executed = []
+
+        @parameterize(params=lambda: (row for row in (1, 2, 3)))
+        def generated_rows(_, value):
+            executed.append(value)
+
+        generated_rows(self)
+        generated_rows(self)
+        self.assertEqual([1, 2, 3, 1, 2, 3], executed)
+
+    def test_parameters_should_be_selectable(self):
+        executed = []
+
+        @parameterize(params=range(100), shard=(1, 4), limit=3)
+        def selected_rows(_, value):
+            executed.append(value)
+
+        selected_rows(self)
+        self.assertEqual([1, 5, 9], executed)
+
+    def test_expanded_parameters_should_generate_method_per_row(self):
+        class ExpandedSpec(SimpleFlatSpec):
+            @parameterize(params=[("hello", 5), ("world!", 6)], expand=True)
+            def test_length(self, given_string, expected_length):
+                self.expect(given_string).to_be_of_length(expected_length)
+
+        self.assertNotIn("test_length", vars(ExpandedSpec))
+        self.assertEqual(["test_length_hello_5", "test_length_world_6"],
+                         unittest.TestLoader().getTestCaseNames(ExpandedSpec))
+
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(ExpandedSpec).run(result)
+        self.assertEqual((2, []), (result.testsRun, result.failures))
+
+    def test_colliding_row_method_names_should_keep_every_row(self):
+        executed = []
+
+        class CollidingSpec(SimpleFlatSpec):
+            @parameterize(params=["a_2", "a", "a", "b"], expand=True)
+            def test_f(self, value):
+                executed.append(value)
+
+            def test_f_b(self):
+                executed.append("method")
+
+        unittest.TestLoader().loadTestsFromTestCase(CollidingSpec).run(unittest.TestResult())
+
+        self.assertEqual(5, len(unittest.TestLoader().getTestCaseNames(CollidingSpec)))
+        self.assertEqual(["a", "a", "a_2", "b", "method"], sorted(executed))
+
+    def test_row_method_names_should_be_stable_and_bounded(self):
+        self.assertEqual("test_x_a_b_1", row_method_name("test_x", ({"b", "a"}, 1)))
+        long_name = row_method_name("test_x", ("a" * 100,))
+        self.assertEqual(long_name, row_method_name("test_x", ("a" * 100,)))
+        self.assertLess(len(long_name), 80)
+
     def test_should_handle_exceptions_with_args_correctly(self):
         def exception_raiser(some_arg, another_arg=0):
             if some_arg == 1 and another_arg == 32:
@@ -65,6 +142,23 @@ class SimpleAsserterTest(unittest.TestCase):
     def test_asserter_should_detect_equality_correctly(self):
         self.test_case.expect('test').to_be('test')
 
+    def test_assertions_should_be_chainable(self):
+        self.test_case.expect([1, 2, 3]).to_be_a_list().and_of_length(3).and_contain_all([3, 1]).and_not_be([])
+
+    def test_chains_should_stop_at_the_first_failing_clause(self):
+        with self.assertRaisesRegex(AssertionError, "^3 != 2$"):
+            self.test_case.expect([1, 2, 3]).to_be_a_list().and_of_length(2).and_contain_all([4])
+
+    def test_softly_should_report_all_failing_clauses_together(self):
+        with self.assertRaises(AssertionError) as context:
+            with self.test_case.softly():
+                self.test_case.expect([1, 2, 3]).to_be_a_dict().and_of_length(3).and_contain_all([4])
+                self.test_case.expect(1).to_be(1)
+
+        message = str(context.exception)
+        self.assertTrue(message.startswith("2 expectations failed:\n1) [1, 2, 3] is not an instance of"), message)
+        self.assertIn("\n2) 1 of 1 expected elements not found: [4]", message)
+
     def test_asserter_should_detect_difference_correctly(self):
         self.test_case.expect('test').to_not_be('Test')
 
@@ -80,6 +174,12 @@ class SimpleAsserterTest(unittest.TestCase):
     def test_asserter_should_test_contains_all_correctly(self):
         self.test_case.expect([1, 2, 3]).to_contain_all((2, 3, 1,))
 
+    def test_asserter_should_test_contains_any_correctly(self):
+        self.test_case.expect([1, 2, 3]).to_contain_any((5, 3,))
+
+    def test_asserter_should_test_contains_exactly_correctly(self):
+        self.test_case.expect([1, 2, 3]).to_contain_exactly((2, 3, 1,))
+
     def test_asserter_should_test_true_correctly(self):
         self.test_case.expect(True).to_be_true()
 
@@ -0,0 +1,22 @@
+import os
+import unittest
+
+from unittest_specs import storage
+from unittest_specs.test_support import TemporaryState
+
+
+class StorageSpec(TemporaryState, unittest.TestCase):
+    def test_state_directory_should_be_configurable(self):
+        self.assertEqual(os.path.join(self.directory.name, "state"), str(storage.state_directory()))
+
+    def test_saved_data_should_be_loaded(self):
+        storage.save_json("data.json", {"a": [1, 2]})
+        self.assertEqual({"a": [1, 2]}, storage.load_json("data.json"))
+        self.assertEqual(["data.json"], os.listdir(storage.state_directory()))
+
+    def test_missing_or_broken_files_should_load_the_default(self):
+        self.assertEqual({}, storage.load_json("missing.json", {}))
+
+        storage.state_directory().mkdir(parents=True)
+        (storage.state_directory() / "broken.json").write_text("{", encoding="utf-8")
+        self.assertIsNone(storage.load_json("broken.json"))
@@ -0,0 +1,136 @@
+import random
+import unittest
+
+from unittest_specs import SimpleFlatSpec, storage, strategies
+from unittest_specs.strategies import (booleans, builds, dicts, integers, just, lists, one_of, sampled_from, text,
+                                       tuples)
+from unittest_specs.test_support import TemporaryState
+
+
+def run_tests(test_class) -> unittest.TestResult:
+    result = unittest.TestResult()
+    unittest.defaultTestLoader.loadTestsFromTestCase(test_class).run(result)
+    return result
+
+
+class StrategySpec(unittest.TestCase):
+    def draw(self, strategy, count: int = 200) -> list:
+        generator = random.Random(1)
+        return [strategy.value(strategy.generate(generator)) for _ in range(count)]
+
+    def test_integers_should_respect_their_bounds(self):
+        values = self.draw(integers(-3, 5))
+
+        self.assertTrue(all(-3 <= value <= 5 for value in values))
+        self.assertEqual(set(range(-3, 6)), set(values))
+        self.assertTrue(all(value >= 10 for value in self.draw(integers(min_value=10))))
+        self.assertTrue(all(value <= -10 for value in self.draw(integers(max_value=-10))))
+
+    def test_collections_should_respect_their_sizes(self):
+        self.assertTrue(all(2 <= len(value) <= 4 for value in self.draw(text("ab", min_size=2, max_size=4))))
+        self.assertTrue(all(len(value) <= 3 for value in self.draw(lists(booleans(), max_size=3))))
+        self.assertTrue(all(isinstance(value, dict) and len(value) <= 2
+                            for value in self.draw(dicts(text("xyz", max_size=2), integers(), max_size=2))))
+
+    def test_composites_should_combine_strategies(self):
+        self.assertTrue(all(isinstance(number, int) and isinstance(word, str)
+                            for number, word in self.draw(tuples(integers(), text()))))
+        self.assertEqual({None, "a", "b"}, set(self.draw(one_of(just(None), sampled_from("ab")))))
+        self.assertTrue(all(value.imag == 0 for value in self.draw(builds(complex, integers(), imag=just(0)))))
+        self.assertTrue(all(value % 2 == 0 for value in self.draw(integers().map(lambda value: value * 2))))
+        self.assertTrue(all(value > 0 for value in self.draw(integers().filter(lambda value: value > 0))))
+
+    def test_strategies_should_implement_generate(self):
+        class Incomplete(strategies.Strategy):
+            pass
+
+        self.assertRaises(TypeError, Incomplete)
+
+    def test_unsatisfiable_filters_should_raise(self):
+        self.assertRaises(strategies.Unsatisfiable, integers(0, 1).filter(lambda value: value > 1).example)
+
+
+class ShrinkSpec(unittest.TestCase):
+    def shrunk(self, test, strategy):
+        return strategies.find_failure(test, strategy, examples=500).value
+
+    def test_integers_should_shrink_to_the_boundary_of_the_failure(self):
+        def at_most_100(value):
+            assert value <= 100
+
+        self.assertEqual(101, self.shrunk(at_most_100, integers()))
+        self.assertEqual(-101, self.shrunk(lambda value: 1 // (value >= -100), integers(max_value=-1)))
+
+    def test_lists_should_shrink_to_a_minimal_reproducer(self):
+        def sum_below_100(values):
+            assert sum(values) < 100
+
+        self.assertEqual([100], self.shrunk(sum_below_100, lists(integers(0, 1000))))
+
+    def test_mapped_values_should_be_shrunk_through_their_source(self):
+        def short_strings(value):
+            assert len(value) < 3
+
+        self.assertEqual("aaa", self.shrunk(short_strings, text().map(str.lower)))
+
+    def test_shrinking_should_keep_the_exception_type(self):
+        def two_failures(values):
+            if len(values) == 1:
+                raise KeyError(values[0])
+            assert len(values) < 3
+
+        minimal, _ = strategies.shrink(two_failures, lists(integers(0, 9)), [5, 6, 7, 8], AssertionError)
+
+        self.assertEqual([0, 0, 0], minimal)
+
+    def test_passing_tests_should_run_the_example_budget(self):
+        calls = []
+
+        self.assertIsNone(strategies.find_failure(calls.append, integers(), examples=50))
+        self.assertEqual(50, len(calls))
+
+
+class ExampleDatabaseSpec(TemporaryState, unittest.TestCase):
+    def test_failing_examples_should_be_replayed_first(self):
+        def below_1000(value):
+            assert value < 1000
+
+        strategies.find_failure(below_1000, integers(0, 5000), examples=1000, key="spec.test")
+        calls = []
+
+        falsified = strategies.find_failure(lambda value: calls.append(value) or below_1000(value),
+                                            integers(0, 5000), seed=1, key="spec.test")
+
+        self.assertEqual([1000], strategies.stored_examples("spec.test"))
+        self.assertEqual(1000, calls[0])
+        self.assertEqual(1, falsified.examples)
+
+    def test_passing_examples_should_be_removed(self):
+        storage.save_json(strategies.EXAMPLES_FILE, {"spec.test": ["5"]})
+
+        strategies.find_failure(lambda value: None, integers(), examples=1, key="spec.test")
+
+        self.assertEqual({}, storage.load_json(strategies.EXAMPLES_FILE))
+
+    def test_generated_parameters_should_be_reported_as_minimal_sub_test(self):
+        class PropertySpec(SimpleFlatSpec):
+            @SimpleFlatSpec.parameterize(tuples(text(), integers(0, 100)), limit=500)
+            def test_repeat(self, word, count):
+                self.expect(len(word * count) < 20).to_be_true()
+
+        result = run_tests(PropertySpec)
+
+        self.assertEqual(1, len(result.failures))
+        self.assertIn("(example=\"test_repeat('a', 20)\")", str(result.failures[0][0]))
+        self.assertEqual([("a", 20)], strategies.stored_examples(PropertySpec("test_repeat").id()))
+
+    def test_passing_properties_should_pass(self):
+        class PassingSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.parameterize(lists(integers()), limit=50)
+            def test_sorted(self, values):
+                self.expect(sorted(sorted(values))).to_be(sorted(values))
+
+        self.assertTrue(run_tests(PassingSpec).wasSuccessful())
+
+    def test_strategies_should_reject_row_options(self):
+        self.assertRaises(ValueError, SimpleFlatSpec.parameterize, integers(), workers=2)
@@ -0,0 +1,18 @@
+import os
+import tempfile
+from unittest import mock
+
+
+class TemporaryState:
+    """
+    Mixin giving every test of a unittest.TestCase an empty temporary directory, ``self.directory``, whose ``state``
+    subdirectory replaces the state directory (see unittest_specs.storage).
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        patcher = mock.patch.dict(os.environ, {"UNITTEST_SPECS_HOME": os.path.join(self.directory.name, "state")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
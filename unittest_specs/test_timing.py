@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from unittest_specs import timing
+from unittest_specs.fun_test_spec import describe, it, expect
+from unittest_specs.simple_test_spec import SimpleFlatSpec
+from unittest_specs.with_test_spec import scenario, setup, run
+
+
+class TimingSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.timings = []
+        timing.enable(self.timings.append)
+
+    def tearDown(self) -> None:
+        timing.disable()
+
+    def run_tests(self, test_class):
+        unittest.TestLoader().loadTestsFromTestCase(test_class).run(unittest.TestResult())
+
+    def test_measure_should_record_wall_and_cpu_time(self):
+        self.assertEqual(3, timing.measure("test", "sum", sum, [1, 2]))
+        self.assertEqual(("test", "sum"), self.timings[0][:2])
+        self.assertGreaterEqual(self.timings[0].wall, 0)
+
+    def test_it_blocks_should_be_timed(self):
+        describe("Timed Fun Spec", it("is timed", expect(1).to_be(1)), module=__name__)
+        self.run_tests(globals().pop("TimedFunSpec"))
+
+        self.assertEqual([("it", f"{__name__}.TimedFunSpec.test_is_timed")], [t[:2] for t in self.timings])
+
+    def test_simple_flat_spec_tests_and_rows_should_be_timed(self):
+        class TimedSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.parameterize(params=[1, 2])
+            def test_rows(self, _):
+                pass
+
+        self.run_tests(TimedSpec)
+
+        self.assertEqual(["row", "row", "test"], [t.kind for t in self.timings])
+        self.assertTrue(self.timings[0].name.endswith("TimedSpec.test_rows[1]"))
+
+    def test_concurrent_async_rows_should_be_timed(self):
+        class ConcurrentTimedSpec(SimpleFlatSpec):
+            @SimpleFlatSpec.parameterize(params=[1, 2, 3], workers=2)
+            async def test_rows(self, _):
+                pass
+
+        self.run_tests(ConcurrentTimedSpec)
+
+        self.assertEqual(["row", "row", "row", "test"], [t.kind for t in self.timings])
+        self.assertTrue(self.timings[0].name.endswith("ConcurrentTimedSpec.test_rows[1]"))
+
+    def test_scenario_stages_should_be_timed(self):
+        with scenario("timed scenario", suite="TimedScenarios") as test_scenario:
+            test_scenario @ setup << (lambda: None)
+            test_scenario @ run << (lambda: None)
+
+        self.run_tests(globals().pop("TimedScenarios"))
+
+        self.assertEqual(["setup", "run", "assertion", "teardown"], [t.kind for t in self.timings])
+
+    def test_disabled_timing_should_not_record(self):
+        class UntimedSpec(SimpleFlatSpec):
+            def test_nothing(self):
+                pass
+
+        timing.disable()
+        self.run_tests(UntimedSpec)
+        self.assertEqual([], self.timings)
+
+
+class TimingSinkSpec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.timings = [timing.Timing("test", f"test_{index}", index, index / 2) for index in range(5)]
+
+    def test_slowest_summary_should_print_slowest_timings(self):
+        stream = io.StringIO()
+        summary = timing.SlowestSummary(2, stream)
+        for entry in self.timings:
+            summary.record(entry)
+        summary.close()
+
+        lines = stream.getvalue().strip().splitlines()
+        self.assertEqual("2 slowest of 5 timings:", lines[0])
+        self.assertIn("test_4", lines[1])
+        self.assertIn("test_3", lines[2])
+
+    def test_json_file_sink_should_write_timings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "timings.json")
+            sink = timing.JsonFileSink(path)
+            sink.record(self.timings[1])
+            sink.close()
+
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual([{"kind": "test", "name": "test_1", "wall": 1, "cpu": 0.5}], json.load(file))
+
+    def test_configuration_should_create_sinks(self):
+        sinks = timing._sinks_from_configuration("slowest:3, json:out.json")
+        self.assertEqual((3, "out.json"), (sinks[0].count, sinks[1].path))
+        self.assertRaises(ValueError, timing._sinks_from_configuration, "csv")
@@ -3,7 +3,7 @@ import unittest
 from inspect import getmodule, currentframe
 
 from unittest_specs import expect
-from unittest_specs.with_test_spec import scenario, setup, run, teardown, assertion
+from unittest_specs.with_test_spec import scenario, setup, run, teardown, assertion, ScenarioError, ScenarioFailure
 
 
 class TestWithScenarioDSL(unittest.TestCase):
@@ -45,6 +45,27 @@ class TestWithScenarioDSL(unittest.TestCase):
         self.assertEqual(module.__dict__["TestSuite"].__dict__["test_first_test_scenario"].__name__, "test_first_test_scenario")
         self.assertEqual(module.__dict__["TestSuite"].__dict__["test_second_test_scenario"].__name__, "test_second_test_scenario")
 
+    def test_with_statement_extends_existing_class_in_place(self):
+        with scenario("first test scenario"):
+            pass
+
+        module = getmodule(currentframe())
+        test_suite = module.__dict__["TestSuite"]
+
+        with scenario("second test scenario"):
+            pass
+
+        self.assertIs(module.__dict__["TestSuite"], test_suite)
+        self.assertIn("test_first_test_scenario", test_suite.__dict__)
+
+    def test_with_statement_groups_scenarios_into_named_suite(self):
+        with scenario("grouped scenario", suite="grouped scenarios"):
+            pass
+
+        module = getmodule(currentframe())
+        self.assertIn("test_grouped_scenario", module.__dict__["GroupedScenarios"].__dict__)
+        del module.__dict__["GroupedScenarios"]
+
     def test_execution_throws_exception_when_no_run_action_is_defined(self):
         with scenario("test scenario"):
             pass
@@ -108,6 +129,62 @@ class TestWithScenarioDSL(unittest.TestCase):
         module.__dict__["TestSuite"].__dict__["test_scenario"]()
         self.assertEqual(2, self.test_value)
 
+    def registered_scenario(self):
+        return getmodule(currentframe()).__dict__["TestSuite"].__dict__["test_scenario"]
+
+    def test_teardown_runs_when_run_action_fails(self):
+        def failing_run():
+            raise ValueError("run failed")
+
+        with scenario("test scenario") as test_scenario:
+            test_scenario @ run << failing_run
+            test_scenario @ teardown << self.increment
+
+        self.assertRaisesRegex(ValueError, "run failed", self.registered_scenario())
+        self.assertEqual(1, self.test_value)
+
+    def test_failing_setup_skips_run_and_assertion(self):
+        def failing_setup():
+            raise ValueError("setup failed")
+
+        with scenario("test scenario") as test_scenario:
+            test_scenario @ setup << failing_setup
+            test_scenario @ setup << self.increment
+            test_scenario @ run << self.increment
+            test_scenario @ assertion << expect(1).to_be(2)
+            test_scenario @ teardown << self.increment
+
+        self.assertRaisesRegex(ValueError, "setup failed", self.registered_scenario())
+        self.assertEqual(1, self.test_value)
+
+    def test_errors_of_several_stages_are_aggregated(self):
+        def failing_teardown():
+            raise OSError("teardown failed")
+
+        with scenario("test scenario") as test_scenario:
+            test_scenario @ run << (lambda: None)
+            test_scenario @ assertion << expect(1).to_be(2)
+            test_scenario @ teardown << failing_teardown
+            test_scenario @ teardown << self.increment
+
+        with self.assertRaises(ScenarioFailure) as context:
+            self.registered_scenario()()
+
+        self.assertEqual(["assertion", "teardown"], [stage for stage, _ in context.exception.result.errors])
+        self.assertIsInstance(context.exception, ScenarioError)
+        self.assertEqual(1, self.test_value)
+
+    def test_stage_timings_are_exposed_on_the_result(self):
+        with scenario("test scenario") as test_scenario:
+            test_scenario @ setup << self.increment
+            test_scenario @ run << self.increment
+
+        self.registered_scenario()(self)
+
+        self.assertEqual({"setup", "run", "assertion", "teardown"}, set(self.scenario_result.timings))
+        self.assertTrue(self.scenario_result.successful)
+        self.assertIs(self.scenario_result, self.registered_scenario().last_result)
+
 
 with scenario("free standing scenario") as standalone_test_scenario:
 
@@ -0,0 +1,205 @@
+"""
+Timing instrumentation for specs. When enabled, wall and CPU time of every it() test, SimpleFlatSpec test,
+parameterize() data set and scenario stage are passed to the configured sinks. While disabled, instrumented code only
+checks a single flag.
+
+Timing can also be enabled without code changes by setting the environment variable ``UNITTEST_SPECS_TIMING`` to a
+comma separated list of sinks, e.g. ``slowest:20,json:timings.json``.
+"""
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, List, NamedTuple, TextIO
+
+enabled = False
+_sinks = []
+
+
+class Timing(NamedTuple):
+    kind: str
+    name: str
+    wall: float
+    cpu: float
+
+
+class SlowestSummary:
+    """
+    Prints the slowest recorded timings when closed, which happens at exit.
+    """
+
+    def __init__(self, count: int = 10, stream: TextIO = None):
+        self.count = count
+        self.stream = stream
+        self.timings = []
+
+    def record(self, timing: Timing) -> None:
+        self.timings.append(timing)
+
+    def close(self) -> None:
+        slowest = sorted(self.timings, key=lambda timing: timing.wall, reverse=True)[:self.count]
+        stream = self.stream or sys.stdout
+        stream.write(f"\n{len(slowest)} slowest of {len(self.timings)} timings:\n")
+        for timing in slowest:
+            stream.write(f"  {timing.wall:9.4f}s wall {timing.cpu:9.4f}s cpu  {timing.kind:10} {timing.name}\n")
+
+
+class JsonFileSink:
+    """
+    Writes all recorded timings as JSON list to a file when closed, which happens at exit.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.timings = []
+
+    def record(self, timing: Timing) -> None:
+        self.timings.append(timing._asdict())
+
+    def close(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.timings, file, indent=1)
+
+
+class CallbackSink:
+    """
+    Passes every recorded Timing to a callback as soon as it is recorded.
+    """
+
+    def __init__(self, callback: Callable[[Timing], None]):
+        self.callback = callback
+
+    def record(self, timing: Timing) -> None:
+        self.callback(timing)
+
+    def close(self) -> None:
+        pass
+
+
+def enable(*sinks) -> None:
+    """
+    Enables timing instrumentation. Sinks are objects offering ``record(timing)`` and ``close()``; plain callables
+    are wrapped into a CallbackSink. Without sinks, a SlowestSummary is printed at exit.
+
+    :param sinks: the sinks to pass timings to
+    """
+    global enabled
+
+    _sinks.extend(sink if hasattr(sink, "record") else CallbackSink(sink) for sink in sinks or (SlowestSummary(),))
+    enabled = True
+
+
+def disable() -> List:
+    """
+    Disables timing instrumentation and closes all sinks.
+
+    :return: the closed sinks
+    """
+    global enabled
+
+    enabled = False
+    closed = list(_sinks)
+    _sinks.clear()
+    for sink in closed:
+        sink.close()
+    return closed
+
+
+@contextmanager
+def collecting():
+    """
+    Enables timing within its block and collects the recorded timings in a list instead of passing them to the
+    configured sinks, e.g. to send them from a worker process to the process reporting them:
+
+    ``with timing.collecting() as timings:``
+    """
+    global enabled
+
+    collected = []
+    previous_sinks, previous_enabled = list(_sinks), enabled
+    _sinks[:] = [CallbackSink(collected.append)]
+    enabled = True
+    try:
+        yield collected
+    finally:
+        _sinks[:] = previous_sinks
+        enabled = previous_enabled
+
+
+def record(kind: str, name: str, wall: float, cpu: float) -> None:
+    timing = Timing(kind, name, wall, cpu)
+    for sink in _sinks:
+        sink.record(timing)
+
+
+def measure(kind: str, name: str, function: Callable, *args, **kwargs):
+    """
+    Calls a function and records its wall and CPU time, also if it raises.
+
+    :param kind: the kind of timed code, e.g. ``"test"`` or ``"setup"``
+    :param name: the name of the timed code, e.g. the test id
+    :param function: the function to call
+    :return: the return value of the function
+    """
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        record(kind, name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+
+async def measure_async(kind: str, name: str, awaitable):
+    """
+    Awaits an awaitable and records its wall and CPU time like measure(). The CPU time is that of the thread running
+    the event loop, so it includes other tasks running concurrently.
+
+    :param kind: the kind of timed code, e.g. ``"row"``
+    :param name: the name of the timed code, e.g. the test id
+    :param awaitable: the awaitable to await, e.g. a coroutine
+    :return: the result of the awaitable
+    """
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        return await awaitable
+    finally:
+        record(kind, name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+
+def instrumented(kind: str, name: str, function: Callable) -> Callable:
+    """
+    Wraps a test function, so that it is measured whenever timing is enabled.
+
+    :param kind: the kind of timed code
+    :param name: the name of the timed code
+    :param function: the test function taking the test case instance
+    :return: the wrapped test function
+    """
+    def instrumented_function(test_case=None):
+        if not enabled:
+            return function(test_case)
+        return measure(kind, name, function, test_case)
+
+    instrumented_function.__name__ = getattr(function, "__name__", name)
+    instrumented_function.__wrapped__ = function
+    return instrumented_function
+
+
+def _sinks_from_configuration(configuration: str) -> List:
+    sinks = []
+    for entry in filter(None, (entry.strip() for entry in configuration.split(","))):
+        sink_type, _, argument = entry.partition(":")
+        if sink_type == "slowest":
+            sinks.append(SlowestSummary(int(argument or 10)))
+        elif sink_type == "json":
+            sinks.append(JsonFileSink(argument or "timings.json"))
+        else:
+            raise ValueError(f"Unknown timing sink {sink_type!r} in UNITTEST_SPECS_TIMING, expected slowest or json")
+    return sinks
+
+
+atexit.register(disable)
+
+if os.environ.get("UNITTEST_SPECS_TIMING"):
+    enable(*_sinks_from_configuration(os.environ["UNITTEST_SPECS_TIMING"]))
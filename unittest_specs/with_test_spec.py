@@ -1,5 +1,11 @@
-import unittest
-from inspect import getmodule, stack
+import time
+from contextlib import contextmanager
+from contextvars import copy_context
+from types import ModuleType
+from typing import Union
+
+from unittest_specs import async_support, fixtures, timing
+from unittest_specs.registration import resolve_module, add_test
 
 
 setup = 0
@@ -7,8 +13,16 @@ run = 1
 assertion = 2
 teardown = 3
 
+SETUP = "setup"
+RUN = "run"
+ASSERTION = "assertion"
+TEARDOWN = "teardown"
+
+DEFAULT_SUITE = "TestSuite"
+
 
-def scenario(scenario_name: str):
+def scenario(scenario_name: str, into: Union[ModuleType, str] = None, suite: str = DEFAULT_SUITE,
+             serial: bool = False, deterministic: bool = False):
     """
     Creates a ScenarioBuilder to construct a test case. ScenarioBuilder objects are technically context managers and
     should therefore be used in with constructs:
@@ -22,89 +36,259 @@ def scenario(scenario_name: str):
     * ``assertion`` *(optional)* - a single assertion for the test case
     * ``teardown`` *(optional)* - one or more steps to clean up after the test case
 
-    All parts take
+    All parts take callables; coroutine functions are awaited on the event loop shared by all scenarios of a suite.
 
     :param scenario_name: description of the test case, should be unique since it is converted to a function name
+    :param into: the module (or its qualified name) to register the scenario in; defaults to the module calling
+    scenario()
+    :param suite: name of the test class the scenario is added to; scenarios sharing a suite name end up in the same
+    class, descriptions containing spaces are converted like describe() descriptions
+    :param serial: marks a scenario sharing state with others, so that the scenario runner never executes it
+    concurrently with other scenarios
+    :param deterministic: marks a scenario whose outcome only depends on its steps, caching its result (see
+    unittest_specs.result_cache); only applies to scenarios run by unittest, not by run_scenarios()
     :return: a ScenarioBuilder object, which can be used to construct test cases
     """
-    class ScenarioBuilder:
-        class ActionAdder:
-            def __init__(self, scenario_builder, action):
-                self.scenario_builder = scenario_builder
-                self.action = action
+    return ScenarioBuilder(scenario_name, resolve_module(into), suite_class_name(suite), serial, deterministic)
+
+
+def _missing_run_action():
+    raise Exception("No run action defined!")
+
+
+class ScenarioError(Exception):
+    """
+    Raised when several stages of a scenario failed, listing every error.
+    """
+
+    def __init__(self, result: "ScenarioResult"):
+        self.result = result
+        details = "\n".join(f"  {stage}: {type(error).__name__}: {error}" for stage, error in result.errors)
+        super().__init__(f"{len(result.errors)} errors in scenario:\n{details}")
+
+
+class ScenarioFailure(ScenarioError, AssertionError):
+    """
+    Raised instead of ScenarioError when the first error of a scenario is a failed assertion, so that unittest
+    reports a failure rather than an error.
+    """
+
+
+class ScenarioResult:
+    """
+    Outcome of a scenario execution: the errors raised per stage and the time spent in each stage. It is available
+    as ``scenario_result`` on the executing test case.
+    """
+
+    def __init__(self, test_case=None, scenario_name: str = ""):
+        self.scenario_name = test_case.id() if test_case is not None else scenario_name
+        self.errors = []
+        self.timings = {}
+        self.cpu_timings = {}
+        if test_case is not None:
+            test_case.scenario_result = self
+
+    @property
+    def successful(self) -> bool:
+        return not self.errors
+
+    def add_error(self, stage: str, error: Exception) -> None:
+        self.errors.append((stage, error))
+
+    @contextmanager
+    def timed(self, stage: str):
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+            self.cpu_timings[stage] = self.cpu_timings.get(stage, 0.0) + time.thread_time() - cpu_start
+
+    def record_timings(self) -> None:
+        """
+        Passes the stage timings to the timing sinks, if timing is enabled.
+        """
+        if timing.enabled:
+            for stage, wall in self.timings.items():
+                timing.record(stage, self.scenario_name, wall, self.cpu_timings[stage])
+
+    def raise_errors(self) -> None:
+        """
+        Raises the error of a failed scenario: the original exception if only one stage failed, a ScenarioError (or
+        ScenarioFailure) listing all errors otherwise.
+        """
+        if not self.errors:
+            return
+
+        first_error = self.errors[0][1]
+        if len(self.errors) == 1:
+            raise first_error
+
+        error_type = ScenarioFailure if isinstance(first_error, AssertionError) else ScenarioError
+        raise error_type(self) from first_error
+
+
+def suite_class_name(suite: str) -> str:
+    """
+    Converts a suite description into a class name, e.g. "adder behaviour" into "AdderBehaviour". Names without
+    spaces are kept as they are.
+
+    :param suite: description or class name of a suite
+    :return: the class name
+    """
+    return "".join(word[:1].upper() + word[1:] for word in suite.split())
+
+
+class ScenarioBuilder:
+    class ActionAdder:
+        def __init__(self, scenario_builder, action):
+            self.scenario_builder = scenario_builder
+            self.action = action
+
+        def __lshift__(self, other):
+            if self.action == setup:
+                self.scenario_builder.add_setup_action(other)
+            if self.action == run:
+                self.scenario_builder.set_run_action(other)
+            if self.action == assertion:
+                self.scenario_builder.add_assertion(other)
+            if self.action == teardown:
+                self.scenario_builder.add_teardown_action(other)
+
+    def __init__(self, scenario_name_for_builder: str, module: ModuleType, suite_name: str = DEFAULT_SUITE,
+                 serial: bool = False, deterministic: bool = False):
+        self.module = module
+        self.suite_name = suite_name
+        self.serial = serial
+        self.deterministic = deterministic
+        self.scenario_name = scenario_name_for_builder.lower().replace(" ", "_")
+
+        if not self.scenario_name.startswith("test_"):
+            self.scenario_name = f"test_{self.scenario_name}"
+
+        self.setup = []
+        self.run = None
+        self.assertion = None
+        self.teardown = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        def scenario_execution(_=None):
+            result = self.execute(_)
+            test_function.last_result = result
+            result.raise_errors()
 
-            def __lshift__(self, other):
-                if self.action == setup:
-                    self.scenario_builder.add_setup_action(other)
-                if self.action == run:
-                    self.scenario_builder.set_run_action(other)
-                if self.action == assertion:
-                    self.scenario_builder.add_assertion(other)
-                if self.action == teardown:
-                    self.scenario_builder.add_teardown_action(other)
+        async def scenario_execution_async(_=None):
+            result = await self.execute_async(_)
+            test_function.last_result = result
+            result.raise_errors()
 
-        def __init__(self, scenario_name_for_builder: str):
-            self.scenario_name = scenario_name_for_builder.lower().replace(" ", "_")
+        test_function = scenario_execution
+        if self.deterministic:
+            from unittest_specs import result_cache
 
-            if not self.scenario_name.startswith("test_"):
-                self.scenario_name = f"test_{self.scenario_name}"
+            test_function = result_cache.cached(scenario_execution, self.module)
+        test_function.run_async = scenario_execution_async
+        test_function.serial = self.serial
+        test_function.last_result = None
 
-            self.setup = []
-            self.run = None
-            self.assertion = None
-            self.teardown = []
+        add_test(self.module, self.suite_name, self.scenario_name, test_function,
+                 {"tearDownClass": classmethod(async_support.close_event_loop)})
 
-        def __enter__(self):
-            return self
+    def _stages(self, assertion_action):
+        return (
+            (SETUP, self.setup),
+            (RUN, [self.run or _missing_run_action]),
+            (ASSERTION, [assertion_action] if self.assertion else []),
+            (TEARDOWN, self.teardown),
+        )
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            def scenario_execution(_=None):
-                list(map(lambda action: action(), self.setup))
+    def execute(self, test_case=None) -> "ScenarioResult":
+        """
+        Executes the scenario stage by stage. A failing setup step skips the remaining setup steps, run and
+        assertion, a failing run skips the assertion; teardown steps are always executed. Errors are collected
+        instead of being raised.
 
-                if self.run:
-                    self.run()
-                else:
-                    raise Exception("No run action defined!")
+        :param test_case: the unittest.TestCase instance executing the scenario, if any
+        :return: the result holding errors and timings of all stages
+        """
+        owner = async_support.owner_of(test_case)
+        result = ScenarioResult(test_case, self.scenario_name)
+        context = fixtures.enter_scenario(self.module)
 
-                if self.assertion:
-                    self.assertion(_)
+        try:
+            for stage, actions in self._stages(lambda: self.assertion(test_case)):
+                with result.timed(stage):
+                    for action in actions:
+                        if result.errors and stage != TEARDOWN:
+                            break
+                        try:
+                            async_support.resolve(action(), owner)
+                        except Exception as error:
+                            result.add_error(stage, error)
+        finally:
+            with result.timed(TEARDOWN):
+                try:
+                    fixtures.exit_scenario(context)
+                except Exception as error:
+                    result.add_error(TEARDOWN, error)
+            result.record_timings()
 
-                list(map(lambda action: action(), self.teardown))
+        return result
 
-            class_members = {
-                self.scenario_name: scenario_execution
-            }
+    async def execute_async(self, test_case=None) -> "ScenarioResult":
+        """
+        Executes the scenario like execute(), but awaits async steps on the running event loop. The assertion is
+        executed in a worker thread, so that it can wait for awaitable actual values.
 
-            for key, value in zip(class_members, class_members.values()):
-                value.__name__ = key
+        :param test_case: the unittest.TestCase instance executing the scenario, if any
+        :return: the result holding errors and timings of all stages
+        """
+        import asyncio
 
-            module = getmodule(stack()[1][0])
+        def assertion_action():
+            return asyncio.get_running_loop().run_in_executor(None, copy_context().run, self.assertion, test_case)
 
-            if "TestSuite" in module.__dict__:
-                existing_members = module.__dict__["TestSuite"].__dict__
-                for key, value in zip(existing_members, existing_members.values()):
-                    class_members[key] = value
+        result = ScenarioResult(test_case, self.scenario_name)
+        context = fixtures.enter_scenario(self.module)
 
-            test_class = type("TestSuite", (unittest.TestCase,), class_members)
-            module.__dict__["TestSuite"] = test_class
+        try:
+            for stage, actions in self._stages(assertion_action):
+                with result.timed(stage):
+                    for action in actions:
+                        if result.errors and stage != TEARDOWN:
+                            break
+                        try:
+                            await async_support.maybe_await(action())
+                        except Exception as error:
+                            result.add_error(stage, error)
+        finally:
+            with result.timed(TEARDOWN):
+                try:
+                    fixtures.exit_scenario(context)
+                except Exception as error:
+                    result.add_error(TEARDOWN, error)
+            result.record_timings()
 
-        def __matmul__(self, other):
-            return self.ActionAdder(self, other)
+        return result
 
-        def add_setup_action(self, action):
-            self.setup.append(action)
+    def __matmul__(self, other):
+        return self.ActionAdder(self, other)
 
-        def set_run_action(self, action):
-            if self.run:
-                raise Exception("Multiple run actions defined! Only one can be defined per scenario")
-            self.run = action
+    def add_setup_action(self, action):
+        self.setup.append(action)
 
-        def add_assertion(self, action):
-            if self.assertion:
-                raise Exception("Multiple assertions actions defined! Only one can be defined per scenario")
-            self.assertion = action
+    def set_run_action(self, action):
+        if self.run:
+            raise Exception("Multiple run actions defined! Only one can be defined per scenario")
+        self.run = action
 
-        def add_teardown_action(self, action):
-            self.teardown.append(action)
+    def add_assertion(self, action):
+        if self.assertion:
+            raise Exception("Multiple assertions actions defined! Only one can be defined per scenario")
+        self.assertion = action
 
-    return ScenarioBuilder(scenario_name)
+    def add_teardown_action(self, action):
+        self.teardown.append(action)